@@ -1,13 +1,15 @@
 import streamlit as st
 from streamlit_option_menu import option_menu
-from app_pages.overview import overview_page
-from app_pages.Login import simple_login
-from app_pages.sidebar import render_sidebar
-from visualizations.OverallAnalysis import vis
+from app_pages.Login import simple_login, session_active, end_login_state
 from common import create_database
-import requests
+from refresh import watch_data
+import timing
 import streamlit.components.v1 as components
 from datetime import datetime
+import importlib
+import logging
+import os
+import sys
 import time
 st.set_page_config(layout="wide")
 # Try to import optional components with fallbacks
@@ -329,6 +331,7 @@ except Exception as e:
 @st.cache_data(ttl=3600)
 def load_lottieurl(url: str):
     try:
+        import requests
         r = requests.get(url)
         if r.status_code != 200:
             return None
@@ -789,6 +792,36 @@ def handle_authentication():
     if not user:
         return False
 
+# ------------------------------
+# Pages are imported on first navigation, so the login page never loads
+# pandas, plotly or reportlab. Python caches the modules across reruns.
+PAGES = {
+    "Overview": ("app_pages.overview", "overview_page"),
+    "Analysis": ("visualizations.OverallAnalysis", "vis"),
+    "Import": ("app_pages.import_data", "import_page"),
+}
+
+def load_page(name):
+    """Import a page's module on first use and return its render function."""
+    module_name, function = PAGES[name]
+    if module_name not in sys.modules:
+        start = time.perf_counter()
+        with timing.span(module_name, "import"):
+            importlib.import_module(module_name)
+        logging.info(f"Loaded page {name} in {(time.perf_counter() - start) * 1000:.0f} ms")
+    return getattr(sys.modules[module_name], function)
+
+# ------------------------------
+# Per-rerun timing breakdown, shown with ?debug=1 or RENDER_DEBUG=1
+def render_timings(report):
+    if not report or not (os.environ.get("RENDER_DEBUG") == "1" or st.query_params.get("debug") == "1"):
+        return
+    with st.sidebar.expander(f"⏱️ Last render: {report['total_ms']:.0f} ms"):
+        st.caption(" · ".join(f"{kind} {entry['ms']:.0f} ms ({entry['count']})"
+                              for kind, entry in report["totals"].items()))
+        st.dataframe([{"Step": "\u2003" * s.depth + s.name, "Kind": s.kind, "ms": round(s.ms, 1)}
+                      for s in report["spans"]], hide_index=True, use_container_width=True)
+
 # ------------------------------
 # Enhanced dashboard layout with interactive elements
 def render_dashboard():
@@ -826,8 +859,8 @@ def render_dashboard():
     selected = option_menu(
         menu_title="Emissions Calculators",
         menu_icon="cloud-fill",
-        options=["Overview", "Analysis", "Reports"],
-        icons=["house-fill", "graph-up-arrow", "file-earmark-text"],
+        options=["Overview", "Analysis", "Import", "Reports"],
+        icons=["house-fill", "graph-up-arrow", "upload", "file-earmark-text"],
         orientation="horizontal",
         styles={
             "container": {"padding": "5px", "background-color": "rgba(0, 0, 0, 0.2)", "border-radius": "10px"},
@@ -839,19 +872,11 @@ def render_dashboard():
         }
     )
     
-    # Add a visual loading effect
+    # The spinner shows only while the page is actually rendering
     with st.spinner(f"Loading {selected}..."):
-        time.sleep(0.5)  # Brief loading animation for enhanced UX
-        
-        # Map options to pages
-        pages = {
-            "Overview": overview_page,
-            "Analysis": vis
-        }
-        
         # Render the selected page with additional styling
-        if selected in pages:
-            pages[selected]()
+        if selected in PAGES:
+            load_page(selected)()
         elif selected == "Reports":
             st.markdown('<h2 style="margin-bottom: 20px;">Reports Dashboard</h2>', unsafe_allow_html=True)
             st.info("Reports module is loading. This feature will be available in the next update.")
@@ -879,13 +904,26 @@ def render_dashboard():
 # ------------------------------
 # Main application flow with enhanced visuals
 if "logged_in_user" in st.session_state:
+    # Sign out a browser session whose stored session expired or was ended elsewhere
+    if not session_active():
+        end_login_state()
+        st.session_state.login_error = "Your session has expired. Please sign in again."
+        st.rerun()
     if "sidebar_page" not in st.session_state:
         st.session_state.sidebar_page = "main"
-    render_sidebar(st.session_state.logged_in_user)
-    if st.session_state.get("sidebar_page", "main") == "main":
-        # Render the enhanced dashboard interface
-        render_particle_background()  # Add particle background for logged-in state too
-        render_dashboard()
+    timing.start(st.session_state.sidebar_page)
+    try:
+        # Rerun pages only when the emissions data changes
+        watch_data()
+        from app_pages.sidebar import render_sidebar
+        render_sidebar(st.session_state.logged_in_user)
+        if st.session_state.get("sidebar_page", "main") == "main":
+            # Render the enhanced dashboard interface
+            render_particle_background()  # Add particle background for logged-in state too
+            render_dashboard()
+    finally:
+        timings = timing.finish()
+    render_timings(timings)
 else:
     # Render the enhanced pre-login landing page with interactive elements
     render_landing_page()
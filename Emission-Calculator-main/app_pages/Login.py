@@ -1,11 +1,14 @@
 import streamlit as st
 import logging
 import os
+import hmac
+import math
 from hashlib import sha256
 import time
 from datetime import datetime
 import base64
 import json
+import auth_store
 
 st.set_page_config(layout="wide")
 
@@ -63,32 +66,32 @@ def hash_password(password: str) -> str:
 
 def verify_password(stored_hash, provided_password):
     """Verify a password against its hash."""
-    return stored_hash == hash_password(provided_password)
+    return hmac.compare_digest(stored_hash, hash_password(provided_password))
 
-# Login attempt tracking for rate limiting
-login_attempts = {}
+# Failed sign-ins are rate limited per username and sessions are recorded in
+# auth_store, which every worker process shares. A signed-in session is
+# re-checked against it at most this often, not on every rerun.
+SESSION_CHECK_SECONDS = 30
 
-def check_rate_limit(username):
-    """Check if the user has exceeded login attempts"""
-    current_time = time.time()
-    if username in login_attempts:
-        attempts = [t for t in login_attempts[username] if current_time - t < 300]  # 5 min window
-        login_attempts[username] = attempts
-        
-        if len(attempts) >= 5:
-            return False  # Rate limited
-    else:
-        login_attempts[username] = []
-    
-    return True  # Not rate limited
+def session_active():
+    """Check that the signed-in session has not expired or been ended elsewhere."""
+    token = st.session_state.get("session_token")
+    if token is None:
+        return True  # the session could not be stored at sign-in; nothing to check
+    now = time.time()
+    if now - st.session_state.get("session_checked_at", 0) < SESSION_CHECK_SECONDS:
+        return True
+    if auth_store.session_user(token) != st.session_state.logged_in_user:
+        return False
+    st.session_state.session_checked_at = now
+    return True
 
-def record_login_attempt(username):
-    """Record a login attempt for rate limiting"""
-    current_time = time.time()
-    if username in login_attempts:
-        login_attempts[username].append(current_time)
-    else:
-        login_attempts[username] = [current_time]
+def end_login_state():
+    """Forget the signed-in user in this browser session and end its stored session."""
+    auth_store.end_session(st.session_state.get("session_token"))
+    for key in ("logged_in_user", "session_token", "session_checked_at"):
+        if key in st.session_state:
+            del st.session_state[key]
 
 # CSS styles for the login UI
 def load_css():
@@ -280,7 +283,10 @@ def simple_login():
     
     # If already logged in, immediately return the stored user
     if "logged_in_user" in st.session_state and st.session_state.logged_in_user:
-        return st.session_state.logged_in_user
+        if session_active():
+            return st.session_state.logged_in_user
+        end_login_state()
+        st.session_state.login_error = "Your session has expired. Please sign in again."
     
     # App logo
     render_login_logo()
@@ -339,28 +345,28 @@ def simple_login():
             return None
         
         # Check rate limiting for this username
-        if not check_rate_limit(username):
-            show_login_error("Too many failed attempts. Please try again in 5 minutes.")
+        limiter = auth_store.login_limiter()
+        allowed, retry_after = limiter.check(username)
+        if not allowed:
+            minutes = max(1, math.ceil(retry_after / 60))
+            show_login_error(f"Too many failed attempts. Please try again in {minutes} minute{'s' if minutes != 1 else ''}.")
             return None
         
-        # Record the login attempt
-        record_login_attempt(username)
-        
-        # Authentication logic
+        # Authentication logic; the hashes are compared in constant time
         expected_username = role_mapping[role]
         expected_password_hash = hash_password(USER_CREDENTIALS.get(expected_username, ""))
-        
-        # Add a small delay to prevent timing attacks
-        time.sleep(0.5)
         show_loading()
         
         if username == expected_username and verify_password(expected_password_hash, password):
             # Successful login
             show_login_success(f"Successfully logged in as {role}")
             
-            # Store user info in session state
+            # Store user info in session state and the shared session store
+            limiter.reset(username)
             st.session_state.logged_in_user = expected_username
             st.session_state.login_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            st.session_state.session_token = auth_store.start_session(expected_username, remember=remember_me)
+            st.session_state.session_checked_at = time.time()
             
             # Log successful login
             logging.info(f"User {username} logged in successfully as {role}")
@@ -376,6 +382,7 @@ def simple_login():
             return st.session_state.logged_in_user
         else:
             # Failed login
+            limiter.record_failure(username)
             show_login_error("Invalid role, username, or password")
             logging.warning(f"Failed login attempt for username: {username}, role: {role}")
             
@@ -1,87 +1,23 @@
 import streamlit as st
+import timing
 import random
 import re
-import sqlite3
-import os
+import uuid
+import chat_query
+import chat_history
+import chat_snapshot
 
 # -------------------------------
 # 1. Real Data Integration: Load Emission Data from Database
 # -------------------------------
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR,"..", "..", "data", "emissions.db")
-
 def load_emission_data():
+    """Return the chatbot's emission figures: total, per scope, per source and tips.
+
+    The snapshot is shared by every session and refreshed incrementally when
+    the data changes, so calling this per message is cheap and never stale.
     """
-    Connects to your SQLite database and fetches carbon emissions data.
-    
-    This function aggregates data from the MasterEmissions table:
-      - Total emissions as the SUM of all Emission values.
-      - Breakdown into Scope 1, Scope 2, and Scope 3 (assuming these are stored under Category).
-      - Category breakdown (grouped by SourceTable as a proxy).
-      - Monthly aggregated emissions.
-      - Reduction tips (if available from a reduction_tips_table, else default tips).
-    
-    Adjust the queries and table names as needed for your actual schema.
-    """
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    # Total Emissions
-    cursor.execute("SELECT SUM(Emission) FROM MasterEmissions")
-    total_row = cursor.fetchone()
-    total = total_row[0] if total_row and total_row[0] is not None else 0
-
-    # Scope Breakdown: Assume Category field holds 'Scope 1', 'Scope 2', or 'Scope 3'
-    scopes = {}
-    for scope in ["Scope 1", "Scope 2", "Scope 3"]:
-        cursor.execute("SELECT SUM(Emission) FROM MasterEmissions WHERE Category=?", (scope,))
-        row = cursor.fetchone()
-        scopes[scope] = row[0] if row and row[0] is not None else 0
-
-    # Category Breakdown: Group by SourceTable as an example (adjust as needed)
-    cursor.execute("SELECT SourceTable, SUM(Emission) FROM MasterEmissions GROUP BY SourceTable")
-    rows = cursor.fetchall()
-    categories = {row[0]: row[1] for row in rows if row[0] is not None}
-
-    # Monthly Data: Group using SQLite's strftime function
-    cursor.execute("SELECT strftime('%m', Timestamp) as month, SUM(Emission) FROM MasterEmissions GROUP BY month")
-    rows = cursor.fetchall()
-    monthly_data = {}
-    month_lookup = {
-      '01': 'Jan', '02': 'Feb', '03': 'Mar', '04': 'Apr', '05': 'May', '06': 'Jun',
-      '07': 'Jul', '08': 'Aug', '09': 'Sep', '10': 'Oct', '11': 'Nov', '12': 'Dec'
-    }
-    for row in rows:
-        month = month_lookup.get(row[0], row[0])
-        monthly_data[month] = row[1] if row[1] is not None else 0
-
-    # Reduction Tips
-    try:
-        cursor.execute("SELECT tip FROM reduction_tips_table")
-        tips_rows = cursor.fetchall()
-        reduction_tips = [r[0] for r in tips_rows]
-    except sqlite3.Error:
-        reduction_tips = []
-    if not reduction_tips:
-        reduction_tips = [
-            "Use public transportation instead of driving alone",
-            "Switch to LED light bulbs",
-            "Reduce meat consumption, especially beef",
-            "Buy locally produced goods when possible",
-            "Use a programmable thermostat to reduce energy use",
-            "Properly insulate your home",
-            "Reduce, reuse, recycle in that order",
-            "Consider offsetting your carbon footprint through verified programs"
-        ]
-    conn.close()
-    return {
-        "total": total,
-        "scopes": scopes,
-        "categories": categories,
-        "monthly_data": monthly_data,
-        "reduction_tips": reduction_tips
-    }
+    return chat_snapshot.get()
 
 # -------------------------------
 # 2. EmissionResponseGenerator Class (Enhanced Response Logic)
@@ -92,37 +28,47 @@ class EmissionResponseGenerator:
 
     def generate_response(self, user_input, conversation_context=None):
         """Generate a rich, context-aware response based on user input."""
-        input_lower = user_input.lower()
-
-        # Check for total emissions query with detailed context.
-        if ("total" in input_lower or "footprint" in input_lower) and "emission" in input_lower:
-            return self._generate_total_emissions_response()
-
-        # Scope breakdown query.
-        elif "scope" in input_lower:
-            return self._generate_scope_breakdown_response(user_input)
-
-        # Category breakdown query.
-        elif "category" in input_lower or "breakdown" in input_lower:
-            return self._generate_category_analysis_response()
+        intent = chat_query.parse(user_input)
 
-        # Reduction tips query.
-        elif "reduce" in input_lower or "tip" in input_lower:
+        # Tips and explanations need no figures.
+        if intent.kind == "tips":
             return self._generate_reduction_tips_response()
-
-        # Explanation query.
-        elif "what is" in input_lower or "explain" in input_lower:
+        elif intent.kind == "explain" and intent.scope:
+            return self._generate_scope_breakdown_response(intent)
+        elif intent.kind == "explain":
             return self._generate_explanation_response()
+        elif intent.kind == "unknown":
+            return self._generate_fallback_response()
 
-        # Fallback response for unrecognized input.
+        # Everything else is answered from a filtered aggregate query.
+        result = chat_query.answer(intent)
+        if result is None:
+            return "Sorry, I couldn't read the emissions data just now. Please try again in a moment."
+        if not result["rows"]:
+            response = " ".join(filter(None, ["I couldn't find any recorded emissions", chat_query.describe(intent)])) + "."
+        elif intent.kind == "trend":
+            response = self._generate_trend_response(intent, result)
+        elif intent.kind == "breakdown":
+            response = self._generate_category_analysis_response(intent, result)
+        elif intent.kind == "top":
+            response = self._generate_top_source_response(intent, result)
+        elif intent == chat_query.Intent("total"):
+            response = self._generate_total_emissions_response(result)
         else:
-            return self._generate_fallback_response()
+            response = self._generate_filtered_total_response(intent, result)
+        if result["undated_excluded"]:
+            response += " Attendee travel and food entries have no dates, so they are not counted in a period."
+        return response
+
+    @staticmethod
+    def _label(result, name):
+        return name if result["by"] == "fuel" else chat_query.SOURCE_LABELS.get(name, name)
 
-    def _generate_total_emissions_response(self):
-        total = self.data["total"]
-        scope1 = self.data["scopes"].get("Scope 1", 0)
-        scope2 = self.data["scopes"].get("Scope 2", 0)
-        scope3 = self.data["scopes"].get("Scope 3", 0)
+    def _generate_total_emissions_response(self, result):
+        total = result["total"]
+        scope1 = result["scopes"].get("Scope 1", 0)
+        scope2 = result["scopes"].get("Scope 2", 0)
+        scope3 = result["scopes"].get("Scope 3", 0)
         # Assume a benchmark global average (adjust this value as needed)
         average_global = 4000  
         if total < average_global * 0.8:
@@ -131,39 +77,52 @@ class EmissionResponseGenerator:
             comparison = "significantly higher than"
         else:
             comparison = "close to"
-        response = (f"Based on our records, your total carbon footprint is {total} kg CO₂e. "
-                    f"This includes {scope1} kg CO₂e from direct emissions (Scope 1), "
-                    f"{scope2} kg CO₂e from purchased energy (Scope 2), and "
-                    f"{scope3} kg CO₂e from other indirect emissions (Scope 3). "
+        response = (f"Based on our records, your total carbon footprint is {total:,.2f} kg CO₂e. "
+                    f"This includes {scope1:,.2f} kg CO₂e from direct emissions (Scope 1), "
+                    f"{scope2:,.2f} kg CO₂e from purchased energy (Scope 2), and "
+                    f"{scope3:,.2f} kg CO₂e from other indirect emissions (Scope 3). "
                     f"In comparison, your footprint is {comparison} the global average of approximately {average_global} kg CO₂e per year. "
                     "This detailed breakdown can help you identify which areas to focus on for reductions.")
         return response
 
-    def _generate_scope_breakdown_response(self, user_input):
-        input_lower = user_input.lower()
-        if "1" in input_lower:
-            val = self.data["scopes"].get("Scope 1", "unknown")
-            response = (f"Scope 1 emissions, which are direct emissions from sources you control (like fuel combustion), "
-                        f"are estimated at {val} kg CO₂e.")
-            return response
-        elif "2" in input_lower:
-            val = self.data["scopes"].get("Scope 2", "unknown")
-            response = (f"Scope 2 emissions, stemming from indirect energy use like purchased electricity or heat, "
-                        f"are estimated at {val} kg CO₂e.")
-            return response
-        elif "3" in input_lower:
-            val = self.data["scopes"].get("Scope 3", "unknown")
-            response = (f"Scope 3 emissions, which include transportation, materials, and other indirect sources, "
-                        f"are estimated at {val} kg CO₂e.")
-            return response
-        else:
-            return ("Your emissions are grouped into Scope 1, 2, and 3. Please specify the scope you are interested in, "
-                    "for example, 'Scope 2 emissions'.")
-
-    def _generate_category_analysis_response(self):
-        breakdown = ", ".join([f"{cat}: {val} kg CO₂e" for cat, val in self.data["categories"].items()])
-        response = f"The emissions are also broken down by category as follows: {breakdown}. This helps pinpoint major emission sources."
-        return response
+    def _generate_filtered_total_response(self, intent, result):
+        response = f"Emissions {chat_query.describe(intent)} come to {result['total']:,.2f} kg CO₂e"
+        if not intent.scope and len(result["scopes"]) > 1:
+            split = ", ".join(f"{scope}: {value:,.2f}" for scope, value in sorted(result["scopes"].items()))
+            response += f" ({split})"
+        return response + "."
+
+    def _generate_scope_breakdown_response(self, intent):
+        explanations = {
+            "Scope 1": "Scope 1 emissions are direct emissions from sources you control, like fuel combustion and refrigerant leaks",
+            "Scope 2": "Scope 2 emissions stem from indirect energy use like purchased electricity or heat",
+            "Scope 3": "Scope 3 emissions include transportation, materials, food and other indirect sources",
+        }
+        result = chat_query.answer(intent._replace(kind="total"))
+        value = f"{result['total']:,.2f} kg CO₂e" if result else "unknown"
+        scope_filters = chat_query.describe(intent._replace(scope=None))
+        return f"{explanations[intent.scope]}. {' '.join(filter(None, ['They are estimated at', value, scope_filters]))}."
+
+    def _generate_category_analysis_response(self, intent, result):
+        total = result["total"] or 1
+        breakdown = "\n".join(f"- {self._label(result, name)}: {value:,.2f} kg CO₂e ({value / total:.0%})"
+                               for _, name, value in result["rows"])
+        heading = " ".join(filter(None, ["Emissions", chat_query.describe(intent), "break down as follows:"]))
+        return f"{heading}\n{breakdown}"
+
+    def _generate_top_source_response(self, intent, result):
+        _, name, value = result["rows"][0]
+        share = value / result["total"] if result["total"] else 0
+        subject = " ".join(filter(None, ["emissions", chat_query.describe(intent)]))
+        return (f"The largest source of {subject} is {self._label(result, name)}, "
+                f"at {value:,.2f} kg CO₂e ({share:.0%} of {result['total']:,.2f} kg CO₂e).")
+
+    def _generate_trend_response(self, intent, result):
+        if not result["months"]:
+            return "The matching emissions have no dates, so I can't show a monthly trend."
+        months = "\n".join(f"- {month}: {value:,.2f} kg CO₂e" for month, value in result["months"].items())
+        heading = " ".join(filter(None, ["Monthly emissions", chat_query.describe(intent)]))
+        return f"{heading}:\n{months}"
 
     def _generate_reduction_tips_response(self):
         tips = random.sample(self.data['reduction_tips'], min(3, len(self.data['reduction_tips'])))
@@ -179,8 +138,10 @@ class EmissionResponseGenerator:
         return response
 
     def _generate_fallback_response(self):
-        response = ("I'm sorry, I didn't understand your question. Please ask about your total emissions, scope breakdown "
-                    "(e.g., 'Scope 1'), category breakdown, reduction tips, or for an explanation of carbon emissions.")
+        response = ("I'm sorry, I didn't understand your question. Try asking about total emissions, a scope "
+                    "(e.g., 'Scope 1'), a source such as electricity or logistics, an event, a month, "
+                    "reduction tips, or for an explanation of carbon emissions. "
+                    "For example: 'Scope 3 logistics emissions for Annual Meet in March'.")
         return response
 
 # -------------------------------
@@ -194,35 +155,56 @@ class EmissionChatbotWithContext:
     def get_response(self, user_input, conversation_context=None):
         return self.response_generator.generate_response(user_input, conversation_context)
 
+GREETING = "Hello! I'm your Carbon Emissions Assistant. How can I help?"
+
+
+def _conversation():
+    """The logged-in user's conversation, or this browser session's before login."""
+    user = st.session_state.get("logged_in_user")
+    if user:
+        return f"user:{user}"
+    if "chat_session_id" not in st.session_state:
+        st.session_state.chat_session_id = uuid.uuid4().hex
+    return f"session:{st.session_state.chat_session_id}"
+
+
+def _history():
+    conversation = _conversation()
+    history = st.session_state.get("chat_history")
+    if history is None or history.conversation != conversation:
+        history = st.session_state.chat_history = chat_history.ChatHistory(conversation)
+    return history
+
+
+@timing.timed("page")
 def chatbot_ui():
     st.write("Ask me anything about your carbon emissions and how you can reduce them with accurate, data-driven insights.")
-    
-    # Initialize the conversation history
-    if "messages" not in st.session_state:
-        st.session_state.messages = [
-            {"role": "assistant", "content": "Hello! I'm your Carbon Emissions Assistant. How can I help?"}
-        ]
-    
-    # Initialize the chatbot with real data integration
-    if "chatbot" not in st.session_state:
-        data = load_emission_data()
-        st.session_state.chatbot = EmissionChatbotWithContext(data)
-
-    # Display conversation history
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
+
+    # Only the newest messages are kept and rendered; earlier ones are read on request
+    history = _history()
+    if history.earlier and st.button("Hide earlier messages", key="chat_hide_earlier"):
+        history.hide_earlier()
+    if history.has_earlier and st.button("Show earlier messages", key="chat_show_earlier"):
+        history.load_earlier()
+
+    if not history.has_earlier:
+        with st.chat_message("assistant"):
+            st.markdown(GREETING)
+    for message in history.visible():
+        with st.chat_message(message.role):
+            st.markdown(message.content)
 
     # Accept new user input
     user_input = st.chat_input("Type your question here...")
     if user_input:
-        st.session_state.messages.append({"role": "user", "content": user_input})
+        history.append("user", user_input)
         with st.chat_message("user"):
             st.markdown(user_input)
-        
-        # Generate and display a detailed response using real data
-        response = st.session_state.chatbot.get_response(user_input)
-        st.session_state.messages.append({"role": "assistant", "content": response})
+
+        # Generate and display a detailed response using the latest data
+        chatbot = EmissionChatbotWithContext(load_emission_data())
+        response = chatbot.get_response(user_input)
+        history.append("assistant", response)
         with st.chat_message("assistant"):
             st.markdown(response)
 
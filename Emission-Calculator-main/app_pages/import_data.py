@@ -0,0 +1,70 @@
+import streamlit as st
+import timing
+import pandas as pd
+import logging
+import importer
+from events import current_event
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+TABLE_LABELS = {
+    "Scope1": "Scope 1 fuel log",
+    "ElectricityEmissions": "Electricity bills",
+    "HVACEmissions": "HVAC refrigerant leaks",
+    "logistics_emissions": "Freight manifest",
+    "Materials": "Event materials",
+    "transport_data": "Attendee travel",
+}
+
+
+@timing.timed("page")
+def import_page():
+    """Upload a CSV or Excel file of activity data into one of the emission tables."""
+    if "logged_in_user" not in st.session_state:
+        st.error("Please login to access the dashboard.")
+        return
+
+    st.header("📥 Import Activity Data")
+    st.write("Upload a CSV or Excel file. Rows are validated, emissions are calculated with the standard "
+             "factors, and the data is saved in batches. For very large files use "
+             "`python importer.py FILE --table TABLE` instead.")
+
+    table = st.selectbox("What does the file contain?", list(TABLE_LABELS), format_func=TABLE_LABELS.get)
+    spec = importer.TARGETS[table]
+    with st.expander("Expected columns"):
+        st.dataframe(pd.DataFrame(
+            [{"Field": field, "Accepted headers": ", ".join(aliases),
+              "Required": "yes" if field in spec["required"] else ""}
+             for field, aliases in importer.expected_columns(table).items()]),
+            hide_index=True)
+
+    event = st.text_input("Event for rows without one", value=current_event() or "")
+    uploaded = st.file_uploader("Activity file", type=["csv", "xlsx"])
+    if uploaded is None or not st.button("Import", type="primary"):
+        return
+
+    bar = st.progress(0.0, text="Starting import...")
+
+    def report(stats):
+        bar.progress(stats["fraction"], text=f"{stats['rows']:,} rows read, {stats['imported']:,} imported, "
+                                              f"{stats['rejected']:,} rejected")
+
+    try:
+        stats = importer.import_file(uploaded, table, event=event.strip() or None, progress=report)
+    except importer.ImportFailed as e:
+        bar.empty()
+        st.error(str(e))
+        return
+    except Exception as e:
+        bar.empty()
+        st.error(f"Import failed: {e}")
+        logging.error(f"Import of {uploaded.name} into {table} failed: {e}")
+        return
+
+    bar.progress(1.0, text="Import complete")
+    st.success(f"Imported {stats['imported']:,} of {stats['rows']:,} rows into {TABLE_LABELS[table]} "
+               f"in {stats['seconds']:.1f}s.")
+    if stats["rejected"]:
+        st.warning(f"{stats['rejected']:,} rows were rejected. The first {len(stats['errors'])} are shown below.")
+        st.dataframe(pd.DataFrame(stats["errors"]), hide_index=True)
@@ -1,13 +1,12 @@
-import sqlite3
 import streamlit as st
+import timing
+from events import SESSION_KEY, create_event, current_event, list_events, select_event
 from app_pages.scope1 import scope1_page
 from app_pages.scope2 import scope2_page
 from app_pages.scope3 import scope3_page
-import os
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR,"..", "..", "data", "emissions.db")
 
+@timing.timed("page")
 def overview_page():
     # Check if user is logged in
     if "logged_in_user" not in st.session_state:
@@ -76,12 +75,17 @@ def overview_page():
 
     event_name =  st.text_input("Enter event name",key="event_name")
     if st.button("Save"):
-        with sqlite3.connect(DB_PATH) as conn:
-                c = conn.cursor()
-                c.execute("INSERT INTO Events (name) VALUES (?)",(event_name,))
-                conn.commit()   
+        create_event(event_name)
         st.success(f"Event {event_name} saved successfully")
 
+    # Pin the dashboard to an earlier event, or follow the latest one
+    latest = "Latest event"
+    choices = [latest] + list_events()
+    selected = st.session_state.get(SESSION_KEY)
+    shown = st.selectbox("Show event", choices, index=choices.index(selected) if selected in choices else 0)
+    select_event(None if shown == latest else shown)
+    st.caption(f"Showing: {current_event()}")
+
     # Define page names
     overview = "Overview"
     scope1 = "Scope 1"
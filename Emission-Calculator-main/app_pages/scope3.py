@@ -1,36 +1,27 @@
 import streamlit as st
+import timing
 from modules.material import show_material_calculator
 from visualizations.material_visualization import visualize
 from visualizations.transportation_visualization import transport_visual
 from visualizations.food_visualization import food_visual
 from visualizations.logistics import logist_vis
 from modules.logistics import logist_calculator
-import sqlite3
+import db
+import queries
+from events import current_event, invalidate
 import pandas as pd
 import plotly.express as px
 from streamlit_extras.dataframe_explorer import dataframe_explorer
 import logging
-import os
-from streamlit_autorefresh import st_autorefresh
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR,"..", "..", "data", "emissions.db")
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
-def get_latest_event():
-    """Fetch the latest event name from the Events table."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute("SELECT name FROM Events ORDER BY id DESC LIMIT 1")
-    event = cursor.fetchone()
-    return event[0] if event else None
-
-
+@timing.timed("page")
 def scope3_page():
     
-    event = get_latest_event()
+    event = current_event()
     # Check if user is logged in
     if "logged_in_user" not in st.session_state:
         st.error("Please login first!")
@@ -70,20 +61,15 @@ def scope3_page():
 
     with vis_tab3:
         try:
-            conn = sqlite3.connect(DB_PATH)
-            cur = conn.cursor()
-            cur.execute("SELECT * FROM Materials WHERE event=?", (event,))
-            data1 = cur.fetchall()
-            conn.close()
+            data1 = db.fetchall(queries.MATERIALS_BY_EVENT, (event,))
             
             col1, col2 = st.columns(2)
             with col1:
                 st.subheader("Data:")
             with col2: 
-                global event_name
                 if st.button("Refresh", key="Go"):
-                    event_name = get_latest_event()
-                    st.rerun
+                    invalidate()
+                    st.rerun()
 
             category = st.selectbox("Select a category", ["Trophies", "Banners", "Momentoes", "Kit"], key="Hake")
             visualize(category, event)
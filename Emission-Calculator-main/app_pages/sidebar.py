@@ -1,6 +1,9 @@
 import streamlit as st
+import timing
 from app_pages.chatbot import chatbot_ui
+from app_pages.Login import end_login_state
 
+@timing.timed("page")
 def render_sidebar(username):
     """Render the complete sidebar with functional components and enhanced UI."""
     # Apply custom styling for an attractive sidebar
@@ -142,8 +145,7 @@ def render_sidebar(username):
         st.sidebar.markdown("""<div class="sidebar-divider"></div>""", unsafe_allow_html=True)
         if st.sidebar.button("🚪 Logout", key="logout_button", use_container_width=True,
                            help="End your session"):
-            if "logged_in_user" in st.session_state:
-                del st.session_state.logged_in_user
+            end_login_state()
             st.markdown("<meta http-equiv='refresh' content='0'>", unsafe_allow_html=True)
     
     # Profile page view
@@ -0,0 +1,282 @@
+"""Login rate limiting and sessions, shared by every worker process.
+
+Failed sign-ins are counted per username with a sliding-window counter:
+a key keeps only its counts for the current and the previous window, and
+the previous count is weighted by how much of it still overlaps the
+sliding window. A check is one primary-key read and a key costs one row,
+however many attempts it sees. Sessions are random tokens with an expiry.
+
+Both live in the emissions database (``AUTH_STORE=sqlite``, the default),
+so every worker process and restart sees the same state. ``AUTH_STORE=memory``
+keeps them in a bounded in-process LRU instead, for single-process runs.
+Expired entries are swept at most every ``SWEEP_INTERVAL`` seconds::
+
+    allowed, retry_after = auth_store.login_limiter().check(username)
+    auth_store.login_limiter().record_failure(username)
+    token = auth_store.start_session(username)
+"""
+import os
+import time
+import secrets
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Callable, Optional, Tuple
+
+import db
+import queries
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+LOGIN_MAX_ATTEMPTS = int(os.environ.get("LOGIN_MAX_ATTEMPTS", "5"))
+LOGIN_WINDOW_SECONDS = float(os.environ.get("LOGIN_WINDOW_SECONDS", "300"))
+SESSION_TTL_SECONDS = float(os.environ.get("SESSION_TTL_HOURS", "8")) * 3600
+REMEMBER_TTL_SECONDS = float(os.environ.get("SESSION_REMEMBER_DAYS", "30")) * 86400
+MEMORY_CAPACITY = int(os.environ.get("AUTH_MEMORY_CAPACITY", "10000"))
+SWEEP_INTERVAL = 60
+
+# Failed attempts in the current and previous window that began at window_start
+Counter = namedtuple("Counter", ["window_start", "current", "previous"])
+
+
+def _roll(counter: Optional[Counter], now: float, window: float) -> Counter:
+    """Move a counter forward to the window containing ``now``."""
+    start = now - now % window
+    if counter is None or counter.window_start <= start - 2 * window:
+        return Counter(start, 0, 0)
+    if counter.window_start <= start - window:
+        return Counter(start, 0, counter.current)
+    return counter
+
+
+def _estimate(counter: Counter, now: float, window: float) -> float:
+    overlap = 1 - (now - counter.window_start) / window
+    return counter.previous * overlap + counter.current
+
+
+def _retry_after(counter: Counter, now: float, window: float, limit: int) -> float:
+    """Seconds until the estimate drops below ``limit`` with no further attempts."""
+    elapsed = now - counter.window_start
+    if counter.current < limit and counter.previous:
+        # The previous window's share shrinks within this window
+        wait = window * (1 - (limit - counter.current) / counter.previous) - elapsed
+    else:
+        # Once this window becomes the previous one, its share shrinks too
+        wait = window - elapsed + window * (1 - limit / counter.current) if counter.current else 0
+    return max(wait, 0.0) + 1
+
+
+class MemoryStore:
+    """In-process store, bounded to ``capacity`` counters and sessions."""
+
+    def __init__(self, capacity: int = MEMORY_CAPACITY):
+        self.capacity = capacity
+        self._counters = OrderedDict()  # key -> (Counter, expires_at)
+        self._sessions = OrderedDict()  # token -> (username, expires_at)
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+
+    def _put(self, entries: OrderedDict, key, value):
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > self.capacity:
+            entries.popitem(last=False)
+
+    def _sweep(self, now: float):
+        if now >= self._next_sweep:
+            for entries in (self._counters, self._sessions):
+                for key in [key for key, (_, expires_at) in entries.items() if expires_at <= now]:
+                    del entries[key]
+            self._next_sweep = now + SWEEP_INTERVAL
+
+    def counter(self, key: str) -> Optional[Counter]:
+        with self._lock:
+            entry = self._counters.get(key)
+            return entry[0] if entry else None
+
+    def update_counter(self, key: str, update: Callable[[Optional[Counter]], Tuple[Counter, float]]) -> Counter:
+        with self._lock:
+            entry = self._counters.get(key)
+            counter, expires_at = update(entry[0] if entry else None)
+            self._put(self._counters, key, (counter, expires_at))
+            self._sweep(time.time())
+            return counter
+
+    def delete_counter(self, key: str):
+        with self._lock:
+            self._counters.pop(key, None)
+
+    def create_session(self, token: str, username: str, expires_at: float):
+        with self._lock:
+            self._put(self._sessions, token, (username, expires_at))
+            self._sweep(time.time())
+
+    def session_user(self, token: str, now: float) -> Optional[str]:
+        with self._lock:
+            entry = self._sessions.get(token)
+            return entry[0] if entry and entry[1] > now else None
+
+    def delete_session(self, token: str):
+        with self._lock:
+            self._sessions.pop(token, None)
+
+
+class SQLiteStore:
+    """Store in the emissions database, shared by every process using it."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+
+    def _sweep(self, now: float):
+        with self._lock:
+            if now < self._next_sweep:
+                return
+            self._next_sweep = now + SWEEP_INTERVAL
+        with db.transaction() as conn:
+            attempts = conn.execute("DELETE FROM LoginAttempts WHERE expires_at <= ?", (now,)).rowcount
+            sessions = conn.execute("DELETE FROM Sessions WHERE expires_at <= ?", (now,)).rowcount
+        if attempts or sessions:
+            logging.info(f"Swept {attempts} expired login counters and {sessions} expired sessions")
+
+    def counter(self, key: str) -> Optional[Counter]:
+        row = db.fetchone(queries.LOGIN_COUNTER, (key,))
+        return Counter(*row) if row else None
+
+    def update_counter(self, key: str, update: Callable[[Optional[Counter]], Tuple[Counter, float]]) -> Counter:
+        # Read and write in one write transaction so concurrent workers never lose a count
+        with db.transaction() as conn:
+            row = conn.execute(queries.LOGIN_COUNTER, (key,)).fetchone()
+            counter, expires_at = update(Counter(*row) if row else None)
+            conn.execute("""
+                INSERT INTO LoginAttempts (key, window_start, current, previous, expires_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    window_start = excluded.window_start,
+                    current = excluded.current,
+                    previous = excluded.previous,
+                    expires_at = excluded.expires_at""", (key, *counter, expires_at))
+        self._sweep(time.time())
+        return counter
+
+    def delete_counter(self, key: str):
+        db.execute("DELETE FROM LoginAttempts WHERE key = ?", (key,))
+
+    def create_session(self, token: str, username: str, expires_at: float):
+        db.execute("INSERT INTO Sessions (token, username, created_at, expires_at) VALUES (?, ?, ?, ?)",
+                   (token, username, time.time(), expires_at))
+        self._sweep(time.time())
+
+    def session_user(self, token: str, now: float) -> Optional[str]:
+        row = db.fetchone(queries.SESSION_USER, (token, now))
+        return row[0] if row else None
+
+    def delete_session(self, token: str):
+        db.execute("DELETE FROM Sessions WHERE token = ?", (token,))
+
+
+class RateLimiter:
+    """Allow at most ``limit`` failures per key in any sliding ``window`` seconds."""
+
+    def __init__(self, store, limit: int = LOGIN_MAX_ATTEMPTS, window: float = LOGIN_WINDOW_SECONDS,
+                 prefix: str = "login"):
+        self.store = store
+        self.limit = limit
+        self.window = window
+        self.prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def check(self, key: str, now: Optional[float] = None) -> Tuple[bool, float]:
+        """Return whether ``key`` may try again, and if not, how many seconds to wait."""
+        now = time.time() if now is None else now
+        try:
+            counter = self.store.counter(self._key(key))
+        except sqlite3.Error as e:
+            # Fail closed: a locked database must not switch throttling off
+            logging.error(f"Could not read login attempts for {key}: {e}")
+            return False, self.window
+        if counter is None:
+            return True, 0.0
+        counter = _roll(counter, now, self.window)
+        if _estimate(counter, now, self.window) < self.limit:
+            return True, 0.0
+        return False, _retry_after(counter, now, self.window, self.limit)
+
+    def record_failure(self, key: str, now: Optional[float] = None):
+        """Count a failed attempt for ``key``."""
+        now = time.time() if now is None else now
+
+        def update(counter):
+            counter = _roll(counter, now, self.window)
+            counter = counter._replace(current=counter.current + 1)
+            return counter, counter.window_start + 2 * self.window
+
+        try:
+            self.store.update_counter(self._key(key), update)
+        except sqlite3.Error as e:
+            logging.error(f"Could not record login attempt for {key}: {e}")
+
+    def reset(self, key: str):
+        """Forget the failures of ``key``, e.g. after a successful sign-in."""
+        try:
+            self.store.delete_counter(self._key(key))
+        except sqlite3.Error as e:
+            logging.error(f"Could not reset login attempts for {key}: {e}")
+
+
+_lock = threading.RLock()
+_instances = {}
+
+
+def get_store():
+    """Return the process-wide store selected by ``AUTH_STORE``."""
+    with _lock:
+        if "store" not in _instances:
+            kind = os.environ.get("AUTH_STORE", "sqlite").lower()
+            _instances["store"] = MemoryStore() if kind == "memory" else SQLiteStore()
+        return _instances["store"]
+
+
+def login_limiter() -> RateLimiter:
+    """Return the limiter for failed sign-ins, keyed by username."""
+    with _lock:
+        if "login" not in _instances:
+            _instances["login"] = RateLimiter(get_store())
+        return _instances["login"]
+
+
+def start_session(username: str, remember: bool = False) -> Optional[str]:
+    """Create a session for ``username`` and return its token, or None if it could not be stored."""
+    token = secrets.token_urlsafe(32)
+    ttl = REMEMBER_TTL_SECONDS if remember else SESSION_TTL_SECONDS
+    try:
+        get_store().create_session(token, username, time.time() + ttl)
+    except sqlite3.Error as e:
+        logging.error(f"Could not create session for {username}: {e}")
+        return None
+    return token
+
+
+def session_user(token: Optional[str]) -> Optional[str]:
+    """Return the user of a live session, or None if it expired or was ended."""
+    if not token:
+        return None
+    try:
+        return get_store().session_user(token, time.time())
+    except sqlite3.Error as e:
+        logging.error(f"Could not read session: {e}")
+        return None
+
+
+def end_session(token: Optional[str]):
+    """End a session, e.g. on logout."""
+    if not token:
+        return
+    try:
+        get_store().delete_session(token)
+    except sqlite3.Error as e:
+        logging.error(f"Could not end session: {e}")
@@ -0,0 +1,276 @@
+"""Render detailed PDF reports for many events at once.
+
+Each event gets a multi-page report: a summary by scope, a breakdown by
+source, a monthly timeline and a detail table for every source. Events are
+rendered in parallel worker processes, each writing its PDF straight to
+disk, and reports whose data has not changed since the last run are reused
+(see report_cache.py)::
+
+    python batch_reports.py --all
+    python batch_reports.py --from 2025-01-01 --to 2025-12-31 --workers 4
+    python batch_reports.py --event "Annual Meet" --event "Expo" --out reports/2025
+
+One JSON line per event is printed with the report's path and timings.
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import multiprocessing
+from io import BytesIO
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, List, Optional
+from xml.sax.saxutils import escape
+
+import db
+import queries
+import report_cache
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+KIND = "detailed"
+SCOPES = ("Scope 1", "Scope 2", "Scope 3")
+SCOPE_COLORS = {"Scope 1": "#1E90FF", "Scope 2": "#4dfa9c", "Scope 3": "#ff9f43"}
+
+# 📌 Sources: title, detail query and column headers for each summary source
+SOURCES = {
+    "Scope1": ("Fuel combustion", queries.SCOPE1_BY_FUEL, "Fuel", "Consumption (kWh)"),
+    "HVACEmissions": ("HVAC refrigerant leaks", queries.REPORT_HVAC, "Refrigerant", "Leaked (kg)"),
+    "ElectricityEmissions": ("Electricity", queries.REPORT_ELECTRICITY, "Usage", "Consumption (kWh)"),
+    "Materials": ("Event materials", queries.REPORT_MATERIALS, "Category", "Quantity"),
+    "transport_data": ("Attendee travel", queries.REPORT_TRANSPORT, "Mode", "Distance (km)"),
+    "logistics_emissions": ("Logistics", queries.REPORT_LOGISTICS, "Transport mode", "Distance (km)"),
+    "food_choices": ("Food", queries.REPORT_FOOD, "Item", "Servings"),
+}
+
+# Everyday equivalents, as in the executive summary
+TREE_KG_PER_YEAR = 21
+HOME_KG_PER_MONTH = 386
+CAR_KG_PER_KM = 0.2
+
+
+# 📌 Choosing events
+def select_events(names: Optional[List[str]] = None, start: Optional[str] = None,
+                  end: Optional[str] = None) -> List[str]:
+    """Return the events to report on, each once.
+
+    ``names`` are taken as given. Otherwise every event with emissions is
+    returned, limited to events with activity between ``start`` and ``end``
+    (ISO dates, inclusive) when either is given.
+    """
+    if names:
+        return list(dict.fromkeys(names))
+    events = [row[0] for row in db.fetchall(queries.REPORT_EVENTS)]
+    if not start and not end:
+        return events
+    start, end = start or "0000-01-01", (end or "9999-12-31") + " 23:59:59"
+    active = {event for event, first, last in db.fetchall(queries.REPORT_EVENT_ACTIVITY)
+              if first and last and first <= end and last >= start}
+    return [event for event in events if event in active]
+
+
+# 📌 Data
+def collect(event: str) -> Dict[str, list]:
+    """Read everything the report shows for ``event``."""
+    sources = [list(row[:6]) for row in db.fetchall(queries.EVENT_TOTALS, (event,))]  # without LastUpdated
+    if not sources:
+        raise ValueError(f"No emissions recorded for {event}")
+    details = {}
+    for source in sorted({row[1] for row in sources}):
+        if source in SOURCES:
+            details[source] = [list(row) for row in db.fetchall(SOURCES[source][1], (event,))]
+    months = defaultdict(float)
+    for _, emission, timestamp in db.fetchall(queries.EMISSION_JOURNEY, (event,) * 7):
+        if timestamp and emission:
+            months[str(timestamp)[:7]] += emission
+    return {"sources": sources, "details": details, "months": sorted(months.items())}
+
+
+def _chart(draw, width=6.5, height=3.0):
+    """Draw with matplotlib's object API (no pyplot state, safe in workers) and return a flowable."""
+    from matplotlib.figure import Figure
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Image
+
+    fig = Figure(figsize=(width, height))
+    draw(fig.subplots())
+    fig.tight_layout()
+    buffer = BytesIO()
+    fig.savefig(buffer, format="png", dpi=110)
+    buffer.seek(0)
+    return Image(buffer, width=width * inch, height=height * inch)
+
+
+def _table(header, rows, widths=None):
+    from reportlab.lib import colors
+    from reportlab.platypus import Table, TableStyle
+
+    table = Table([header] + rows, colWidths=widths, repeatRows=1)
+    table.setStyle(TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#203a43")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+        ("ALIGN", (1, 0), (-1, -1), "RIGHT"),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f1f4f8")]),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#c8d6e5")),
+    ]))
+    return table
+
+
+def render(event: str, data: Dict[str, list], path: str):
+    """Write the detailed report for ``event`` to ``path``."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer
+
+    styles = getSampleStyleSheet()
+    story = []
+    sources = data["sources"]
+    by_scope = defaultdict(float)
+    for category, _, total, *_ in sources:
+        by_scope[category] += total
+    total = sum(by_scope.values())
+
+    # Summary
+    story.append(Paragraph(f"Emissions Report - {escape(event)}", styles["Title"]))
+    story.append(Paragraph(f"Generated on {datetime.now():%Y-%m-%d %H:%M}", styles["Normal"]))
+    if data["months"]:
+        story.append(Paragraph(f"Activity from {data['months'][0][0]} to {data['months'][-1][0]}", styles["Normal"]))
+    story.append(Spacer(1, 12))
+    story.append(Paragraph("Summary by scope", styles["Heading2"]))
+    story.append(_table(
+        ["Scope", "Emission (kg CO2e)", "Share"],
+        [[scope, f"{by_scope.get(scope, 0):,.2f}", f"{by_scope.get(scope, 0) / total:.1%}" if total else "-"]
+         for scope in SCOPES] + [["Total", f"{total:,.2f}", "100%" if total else "-"]],
+        widths=[150, 150, 100]))
+    story.append(Spacer(1, 12))
+    story.append(Paragraph(
+        f"Equivalent to the yearly absorption of {total / TREE_KG_PER_YEAR:,.1f} trees, "
+        f"{total / HOME_KG_PER_MONTH:,.1f} homes powered for a month, or "
+        f"{total / CAR_KG_PER_KM:,.0f} km driven in a petrol car.", styles["Normal"]))
+    scoped = [(scope, by_scope[scope]) for scope in SCOPES if by_scope.get(scope, 0) > 0]
+    if scoped:
+        story.append(_chart(lambda ax: ax.pie(
+            [value for _, value in scoped], labels=[scope for scope, _ in scoped], autopct="%1.1f%%",
+            colors=[SCOPE_COLORS[scope] for scope, _ in scoped]), width=4.5, height=3.2))
+
+    # Sources and timeline
+    story.append(PageBreak())
+    story.append(Paragraph("Breakdown by source", styles["Heading2"]))
+    ordered = sorted(sources, key=lambda row: (row[0], -row[2]))
+    story.append(_table(
+        ["Scope", "Source", "Entries", "Total (kg)", "Smallest", "Largest"],
+        [[category, SOURCES.get(source, (source,))[0], entries, f"{value:,.2f}",
+          f"{low or 0:,.2f}", f"{high or 0:,.2f}"]
+         for category, source, value, entries, low, high in ordered]))
+    if ordered:
+        story.append(Spacer(1, 12))
+        story.append(_chart(lambda ax: ax.barh(
+            [SOURCES.get(row[1], (row[1],))[0] for row in ordered], [row[2] for row in ordered],
+            color=[SCOPE_COLORS.get(row[0], "#888888") for row in ordered]), height=2.8))
+    if data["months"]:
+        story.append(Paragraph("Emissions by month", styles["Heading2"]))
+        story.append(_chart(lambda ax: ax.bar(
+            [month for month, _ in data["months"]], [value for _, value in data["months"]], color="#4e8cff"),
+            height=2.6))
+
+    # One section per scope, one table per source
+    for scope in SCOPES:
+        scope_sources = [row for row in ordered if row[0] == scope and row[1] in data["details"]]
+        if not scope_sources:
+            continue
+        story.append(PageBreak())
+        story.append(Paragraph(scope, styles["Heading1"]))
+        for _, source, value, *_ in scope_sources:
+            title, _, label, quantity = SOURCES[source]
+            story.append(Paragraph(f"{title}: {value:,.2f} kg CO2e", styles["Heading3"]))
+            story.append(_table(
+                [label, quantity, "Emission (kg)", "Entries"],
+                [[str(name), f"{amount or 0:,.2f}", f"{emission or 0:,.2f}", entries]
+                 for name, amount, emission, entries in sorted(data["details"][source], key=lambda r: -(r[2] or 0))],
+                widths=[190, 110, 110, 60]))
+            story.append(Spacer(1, 10))
+
+    def number_page(canvas, doc):
+        canvas.setFont("Helvetica", 8)
+        canvas.drawRightString(A4[0] - 40, 25, f"{event} - page {doc.page}")
+
+    doc = SimpleDocTemplate(path, pagesize=A4, title=f"Emissions Report - {event}")
+    doc.build(story, onFirstPage=number_page, onLaterPages=number_page)
+
+
+# 📌 Workers
+def _init_worker(db_path: str, report_dir: str):
+    db.DB_PATH = db_path
+    report_cache.REPORT_DIR = report_dir
+
+
+def report_event(event: str) -> dict:
+    """Build (or reuse) the detailed report for one event; runs in a worker."""
+    started = time.perf_counter()
+    data = collect(event)
+    rows = [[key, value] for key, value in data.items()]
+    path, built = report_cache.write(event, rows, lambda partial: render(event, data, partial), KIND)
+    return {"event": event, "path": path, "built": built, "seconds": round(time.perf_counter() - started, 3)}
+
+
+def run(events: List[str], workers: int, report_dir: str):
+    """Yield one result per event as workers finish."""
+    # Workers are spawned, not forked, so none inherits the parent's open SQLite connections
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker,
+                             initargs=(db.DB_PATH, report_dir)) as pool:
+        futures = {pool.submit(report_event, event): event for event in events}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                logging.error(f"Report for {futures[future]} failed: {e}")
+                yield {"event": futures[future], "error": str(e)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--event", action="append", help="event to report on (repeatable)")
+    parser.add_argument("--all", action="store_true", help="every event with emissions")
+    parser.add_argument("--from", dest="start", help="only events with activity on or after this date (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="end", help="only events with activity on or before this date (YYYY-MM-DD)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--out", default=report_cache.REPORT_DIR, help="directory for the reports")
+    parser.add_argument("--db", help="database to read (default: the emissions database)")
+    args = parser.parse_args(argv)
+
+    if not (args.event or args.all or args.start or args.end):
+        parser.error("give --event, --all, or a --from/--to date range")
+    if args.db:
+        db.DB_PATH = args.db
+
+    events = select_events(args.event, args.start, args.end)
+    if not events:
+        print("No events match.", file=sys.stderr)
+        return 1
+
+    started = time.perf_counter()
+    built = reused = failed = 0
+    for result in run(events, max(1, min(args.workers, len(events))), os.path.abspath(args.out)):
+        print(json.dumps(result))
+        if "error" in result:
+            failed += 1
+        elif result["built"]:
+            built += 1
+        else:
+            reused += 1
+    elapsed = time.perf_counter() - started
+    print(f"{len(events)} events in {elapsed:.1f}s: {built} built, {reused} unchanged, {failed} failed",
+          file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
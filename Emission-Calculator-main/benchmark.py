@@ -0,0 +1,298 @@
+"""Benchmark harness for the emissions database and dashboard data paths.
+
+Builds a throw-away database filled with synthetic events, times the write
+and read paths the app uses, and prints the results as JSON so runs can be
+compared before and after a change::
+
+    python benchmark.py --rows 100000 --output before.json
+    python benchmark.py --rows 100000 --compare before.json
+
+The database under test is a temporary file (or a copy of ``--base-db``);
+the real ``data/emissions.db`` is never touched.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import sqlite3
+import logging
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from datetime import datetime, timedelta
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Source tables and their share of the generated rows
+TABLE_WEIGHTS = {
+    "Scope1": 0.05,
+    "HVACEmissions": 0.05,
+    "ElectricityEmissions": 0.15,
+    "transport_data": 0.30,
+    "logistics_emissions": 0.10,
+    "Materials": 0.15,
+    "food_choices": 0.20,
+}
+
+FUELS = ["Diesel", "Petrol", "LPG", "CNG"]
+USAGES = ["Lighting and other electrical uses", "Cooling", "Solar", "Wind"]
+REFRIGERANTS = ["R-22", "R-410A", "R-32", "R-134a"]
+MODES = [("Road", "Car Petrol"), ("Road", "Bike"), ("Rail", "Electric"), ("Air", "Domestic")]
+CITIES = ["Mumbai", "Delhi", "Pune", "Chennai", "Kolkata", "Bengaluru", "Hyderabad", "Jaipur"]
+MATERIALS = ["Trophies", "Banners", "Momentoes", "Kit"]
+FOODS = ["Rice", "Dal", "Paneer", "Chicken", "Salad", "Bread", "Coffee", "Tea"]
+
+
+def generate_rows(table, n, events, rng):
+    """Return ``(insert sql, rows)`` with ``n`` synthetic rows for ``table``."""
+    event = rng.choice(events, n)
+    emission = np.round(rng.gamma(2.0, 25.0, n), 3)
+    start = datetime(2025, 1, 1)
+    stamps = [(start + timedelta(minutes=int(m))).strftime("%Y-%m-%d %H:%M:%S")
+              for m in rng.integers(0, 365 * 24 * 60, n)]
+
+    if table == "Scope1":
+        fuel = rng.choice(FUELS, n)
+        rows = [(e, json.dumps([f]), json.dumps([float(c)]), json.dumps([float(x)]), float(x), ts)
+                for e, f, c, x, ts in zip(event, fuel, np.round(rng.uniform(1, 500, n), 2), emission, stamps)]
+        sql = "INSERT INTO Scope1 (event, fuels, consumptions, emissions, total_emission, Timestamp) VALUES (?, ?, ?, ?, ?, ?)"
+    elif table == "HVACEmissions":
+        rows = list(zip(event, rng.choice(REFRIGERANTS, n), np.round(rng.uniform(0.1, 5, n), 3), emission, stamps))
+        sql = "INSERT INTO HVACEmissions (event, Refrigerant, MassLeak, Emission, Timestamp) VALUES (?, ?, ?, ?, ?)"
+    elif table == "ElectricityEmissions":
+        rows = list(zip(event, rng.choice(USAGES, n), np.round(rng.uniform(1, 1000, n), 2), emission, stamps))
+        sql = "INSERT INTO ElectricityEmissions (event, Usage, Value, Emission, Timestamp) VALUES (?, ?, ?, ?, ?)"
+    elif table == "transport_data":
+        modes = [MODES[i] for i in rng.integers(0, len(MODES), n)]
+        rows = [(e, m, t, o, d, float(km), float(x)) for e, (m, t), o, d, km, x in zip(
+            event, modes, rng.choice(CITIES, n), rng.choice(CITIES, n), np.round(rng.uniform(5, 2000, n), 2), emission)]
+        sql = "INSERT INTO transport_data (event, mode, type, origin, destination, distance, Emission) VALUES (?, ?, ?, ?, ?, ?, ?)"
+    elif table == "logistics_emissions":
+        rows = list(zip(event, rng.choice(MATERIALS, n), rng.choice(["Truck", "Rail", "Air"], n),
+                        rng.choice(CITIES, n), rng.choice(CITIES, n), np.round(rng.uniform(5, 2000, n), 2),
+                        np.round(rng.uniform(1, 5000, n), 1), emission, stamps))
+        sql = ("INSERT INTO logistics_emissions (Event, material, transport_mode, origin, destination, "
+               "distance_km, weight_kg, total_emission, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)")
+    elif table == "Materials":
+        rows = list(zip(event, rng.choice(MATERIALS, n), np.round(rng.uniform(0.1, 20, n), 2),
+                        rng.integers(1, 100, n).astype(float), emission, stamps))
+        sql = "INSERT INTO Materials (event, Category, Weight, Quantity, Emission, Timestamp) VALUES (?, ?, ?, ?, ?, ?)"
+    elif table == "food_choices":
+        rows = list(zip(event, [f"s{i % 5000}" for i in range(n)], rng.choice(["Veg", "Non-Veg", "Vegan"], n),
+                        rng.choice(FOODS, n), emission))
+        sql = "INSERT INTO food_choices (event, session_id, dietary_pattern, food_item, emission) VALUES (?, ?, ?, ?, ?)"
+    else:
+        raise ValueError(f"Unknown table: {table}")
+
+    # numpy scalars -> Python types sqlite3 can bind
+    return sql, [tuple(v.item() if isinstance(v, np.generic) else v for v in row) for row in rows]
+
+
+def measure(name, fn, repeat=3, number=1):
+    """Time ``fn`` and return a result record; failures are recorded, not raised."""
+    times = []
+    try:
+        fn()  # warm-up (imports, statement cache, page cache)
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            times.append((time.perf_counter() - start) / number)
+    except Exception as e:
+        logging.error(f"Benchmark {name} failed: {e}")
+        return {"name": name, "status": "error", "error": f"{type(e).__name__}: {e}"}
+    return {
+        "name": name,
+        "status": "ok",
+        "calls": repeat * number,
+        "min_ms": round(min(times) * 1000, 3),
+        "median_ms": round(statistics.median(times) * 1000, 3),
+        "max_ms": round(max(times) * 1000, 3),
+    }
+
+
+def bulk_load(rows_total, events, rng):
+    """Load synthetic rows through the real schema (triggers included)."""
+    import db
+
+    results = []
+    for table, weight in TABLE_WEIGHTS.items():
+        n = max(1, int(rows_total * weight))
+        sql, rows = generate_rows(table, n, events, rng)
+        start = time.perf_counter()
+        db.executemany(sql, rows)
+        elapsed = time.perf_counter() - start
+        results.append({
+            "name": f"bulk_insert.{table}",
+            "status": "ok",
+            "rows": n,
+            "total_ms": round(elapsed * 1000, 3),
+            "rows_per_sec": round(n / elapsed, 1) if elapsed else None,
+        })
+    return results
+
+
+def trigger_overhead(n, events, rng):
+    """Compare inserting into Materials (with triggers) against a trigger-less copy."""
+    import db
+
+    sql, rows = generate_rows("Materials", n, events, rng)
+    with db.connection() as conn:
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS bench_materials AS SELECT * FROM Materials WHERE 0")
+    plain_sql = sql.replace("INSERT INTO Materials", "INSERT INTO temp.bench_materials")
+
+    timings = {}
+    for label, query in (("with_triggers", sql), ("without_triggers", plain_sql)):
+        start = time.perf_counter()
+        db.executemany(query, rows)
+        timings[label] = time.perf_counter() - start
+    with db.connection() as conn:
+        conn.execute("DROP TABLE temp.bench_materials")
+
+    per_row = (timings["with_triggers"] - timings["without_triggers"]) / n
+    return {
+        "name": "summary_triggers.Materials",
+        "status": "ok",
+        "rows": n,
+        "with_triggers_ms": round(timings["with_triggers"] * 1000, 3),
+        "without_triggers_ms": round(timings["without_triggers"] * 1000, 3),
+        "overhead_us_per_row": round(per_row * 1e6, 3),
+    }
+
+
+def run(args):
+    rng = np.random.default_rng(args.seed)
+    events = [f"Bench Event {i}" for i in range(args.events)]
+    target = events[0]
+
+    # Schema, events and bulk data
+    import db
+    import queries
+    import migrations
+
+    migrations.migrate()
+
+    db.executemany("INSERT INTO Events (name) VALUES (?)", [(name,) for name in reversed(events)])
+    results = bulk_load(args.rows, events, rng)
+    results.append(trigger_overhead(min(args.rows, 10000), events, rng))
+
+    # Per-call insert functions used by the calculators
+    from modules.sc1_emissions import insert_scope1_data
+    from modules.electricity import insert_electricity_data, insert_hvac_data
+    from modules.material import insert_material_data
+    from modules.logistics import store_logistics_data
+
+    number = args.calls
+    results += [
+        measure("insert.scope1", lambda: insert_scope1_data(target, ["Diesel"], [10.0], [26.8], 26.8), args.repeat, number),
+        measure("insert.electricity", lambda: insert_electricity_data(target, "Cooling", 120.0, 85.1), args.repeat, number),
+        measure("insert.hvac", lambda: insert_hvac_data(target, "R-32", 0.5, 337.5), args.repeat, number),
+        measure("insert.material", lambda: insert_material_data(target, "Kit", 1.2, 10, 4.2), args.repeat, number),
+        measure("insert.logistics", lambda: store_logistics_data(
+            target, "Tables", "Truck", "Delhi", "Mumbai", 1400.0, 100.0, 4200.0), args.repeat, number),
+    ]
+
+    # Dashboard and chatbot read paths
+    from visualizations.OverallAnalysis import fetch_emissions_data, get_emission_journey
+    from visualizations.report import fetch_emissions_summary, generate_pdf
+    from app_pages.chatbot import load_emission_data
+
+    summary = fetch_emissions_summary(target)
+    results += [
+        measure("read.fetch_emissions_data", lambda: fetch_emissions_data(target), args.repeat),
+        measure("read.get_emission_journey", lambda: get_emission_journey(target), args.repeat),
+        measure("read.scope1_by_fuel", lambda: db.fetchall(queries.SCOPE1_BY_FUEL, (target,)), args.repeat),
+        measure("read.load_emission_data", load_emission_data, args.repeat),
+        measure("report.generate_pdf", lambda: generate_pdf(target, summary), args.repeat),
+    ]
+    return results
+
+
+def metadata(args):
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "rows": args.rows,
+        "events": args.events,
+        "seed": args.seed,
+        "repeat": args.repeat,
+    }
+
+
+def compare(current, baseline, tolerance):
+    """Print per-benchmark ratios against a baseline; return True if none regressed."""
+    def key_metric(result):
+        return result.get("median_ms", result.get("total_ms"))
+
+    before = {r["name"]: r for r in baseline["results"] if r.get("status") == "ok"}
+    ok = True
+    print(f"{'benchmark':40} {'before':>12} {'after':>12} {'ratio':>8}", file=sys.stderr)
+    for result in current:
+        old = before.get(result["name"])
+        if result.get("status") != "ok" or old is None or not key_metric(old):
+            continue
+        ratio = key_metric(result) / key_metric(old)
+        flag = " REGRESSION" if ratio > 1 + tolerance else ""
+        ok = ok and not flag
+        print(f"{result['name']:40} {key_metric(old):12.3f} {key_metric(result):12.3f} {ratio:8.2f}{flag}", file=sys.stderr)
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000, help="synthetic rows across all source tables")
+    parser.add_argument("--events", type=int, default=10, help="number of synthetic events")
+    parser.add_argument("--repeat", type=int, default=5, help="timed repetitions per benchmark")
+    parser.add_argument("--calls", type=int, default=50, help="calls per repetition for single-row inserts")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--base-db", help="start from a copy of this database instead of an empty one")
+    parser.add_argument("--output", help="write JSON results here instead of stdout")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown before flagging (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="emissions-bench-")
+    db_path = os.path.join(workdir, "emissions.db")
+    if args.base_db:
+        shutil.copyfile(args.base_db, db_path)
+    # Must be set before db is imported
+    os.environ["EMISSIONS_DB_PATH"] = db_path
+    sys.path.insert(0, BASE_DIR)
+
+    try:
+        report = {"meta": metadata(args), "results": run(args)}
+    finally:
+        import db
+        db.close_all()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if not compare(report["results"], baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""Compute and store emissions from the command line, without Streamlit.
+
+Reads one activity per JSON line (or CSV row) from a file or stdin, computes
+its emission with the same core functions the dashboard uses, stores it,
+and prints one JSON result per line::
+
+    echo '{"kind": "electricity", "usage": "Cooling", "value": 120}' | python calculate.py --event "Annual Meet"
+    python calculate.py fuel.csv --kind scope1 --event "Annual Meet"
+    python calculate.py activities.jsonl --dry-run
+
+Kinds and their fields:
+    scope1       fuel, consumption (or lists: fuels, consumptions)
+    electricity  usage, value
+    hvac         refrigerant, mass_leak
+    material     category, weight, quantity
+    logistics    material, transport_mode, origin, destination, weight [, distance]
+    travel       mode, type, distance [, origin, destination]
+
+Every record may carry an ``event``; otherwise --event or the latest event is
+used. Large spreadsheets are better served by importer.py.
+"""
+import sys
+import csv
+import math
+import json
+import sqlite3
+import logging
+import argparse
+from typing import Iterator, Optional
+
+import factors
+from core import LookupFailed
+from core import electricity, logistics, material, scope1, travel
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+class InvalidRecord(ValueError):
+    """Raised for a record that cannot be computed; the run continues."""
+
+
+def _number(record, field, default=None) -> float:
+    value = record.get(field, default)
+    if value is None or value == "":
+        raise InvalidRecord(f"missing {field}")
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise InvalidRecord(f"invalid {field}: {value!r}")
+    if not math.isfinite(number):
+        raise InvalidRecord(f"invalid {field}: {value!r}")
+    if number < 0:
+        raise InvalidRecord(f"negative {field}: {value!r}")
+    return number
+
+
+def _text(record, field, default=None) -> str:
+    value = str(record.get(field) or default or "").strip()
+    if not value:
+        raise InvalidRecord(f"missing {field}")
+    return value
+
+
+def _known(table, key, field):
+    if key not in factors.FACTORS[table]:
+        raise InvalidRecord(f"unknown {field}: {key!r}")
+    return key
+
+
+def _as_list(value):
+    if isinstance(value, list):
+        return value
+    return [v.strip() for v in str(value).split(";")] if value not in (None, "") else []
+
+
+# 📌 One handler per kind: (record, event, store) -> result
+def _scope1(record, event, store):
+    fuels = _as_list(record.get("fuels") or record.get("fuel"))
+    consumptions = _as_list(record.get("consumptions") or record.get("consumption"))
+    if not fuels or len(fuels) != len(consumptions):
+        raise InvalidRecord("fuels and consumptions must be non-empty and of equal length")
+    fuels = [_known("fuel", str(fuel), "fuel") for fuel in fuels]
+    consumptions = [_number({"consumption": c}, "consumption") for c in consumptions]
+    emissions, total = scope1.calculate_entries(fuels, consumptions)
+    row_id = scope1.save_scope1(event, fuels, consumptions, emissions, total) if store else None
+    return {"emission": total, "id": row_id}
+
+
+def _electricity(record, event, store):
+    usage = _known("electricity", _text(record, "usage"), "usage")
+    value = _number(record, "value")
+    emission = electricity.calculate_electricity_emission(usage, value)
+    row_id = electricity.save_electricity(event, usage, value, emission) if store else None
+    return {"emission": emission, "id": row_id}
+
+
+def _hvac(record, event, store):
+    refrigerant = _known("refrigerant", _text(record, "refrigerant"), "refrigerant")
+    mass_leak = _number(record, "mass_leak")
+    emission = electricity.calculate_hvac_emission(refrigerant, mass_leak)
+    row_id = electricity.save_hvac(event, refrigerant, mass_leak, emission) if store else None
+    return {"emission": emission, "id": row_id}
+
+
+def _material(record, event, store):
+    category = _known("material", _text(record, "category"), "category")
+    weight, quantity = _number(record, "weight"), _number(record, "quantity", 1)
+    emission = material.calculate_material_emission(category, weight, quantity)
+    row_id = material.save_material(event, category, weight, quantity, emission) if store else None
+    return {"emission": emission, "id": row_id}
+
+
+def _logistics(record, event, store):
+    mode = _known("freight", _text(record, "transport_mode"), "transport_mode")
+    origin, destination = _text(record, "origin"), _text(record, "destination")
+    weight = _number(record, "weight")
+    if record.get("distance") in (None, ""):
+        try:
+            distance = logistics.distance_for(mode, origin, destination)
+        except LookupFailed as e:
+            raise InvalidRecord(str(e))
+        if distance is None:
+            raise InvalidRecord(f"no distance found from {origin} to {destination}")
+    else:
+        distance = _number(record, "distance")
+    emission = logistics.freight_emission(mode, distance, weight)
+    row_id = logistics.save_logistics(event, _text(record, "material"), mode, origin, destination,
+                                      distance, weight, emission) if store else None
+    return {"emission": emission, "distance": distance, "id": row_id}
+
+
+def _travel(record, event, store):
+    mode = _text(record, "mode")
+    if mode not in travel.MODE_TABLES:
+        raise InvalidRecord(f"unknown mode: {mode!r}")
+    type_ = str(record.get("type") or "")
+    distance = _number(record, "distance")
+    emission = travel.travel_emission(mode, type_, distance)
+    leg = (mode, type_, record.get("origin") or "", record.get("destination") or "", distance, emission)
+    row_id = travel.save_travel_legs(event, [leg])[0] if store else None
+    return {"emission": emission, "id": row_id}
+
+
+KINDS = {
+    "scope1": _scope1,
+    "electricity": _electricity,
+    "hvac": _hvac,
+    "material": _material,
+    "logistics": _logistics,
+    "travel": _travel,
+}
+
+
+def read_records(stream, file_format: str) -> Iterator[dict]:
+    """Yield records from JSON lines or CSV, one at a time."""
+    if file_format == "csv":
+        yield from csv.DictReader(stream)
+        return
+    for number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            yield {"_error": f"line {number}: {e}"}
+
+
+def process(record: dict, kind: Optional[str] = None, event: Optional[str] = None, store: bool = True) -> dict:
+    """Compute (and unless ``store`` is False, save) one record."""
+    if not isinstance(record, dict):
+        raise InvalidRecord("record must be a JSON object")
+    if "_error" in record:
+        raise InvalidRecord(record["_error"])
+    kind = (record.get("kind") or kind or "").strip().lower()
+    if kind not in KINDS:
+        raise InvalidRecord(f"unknown kind: {kind!r}")
+    event = str(record.get("event") or event or "").strip()
+    if not event:
+        raise InvalidRecord("no event given and no events exist")
+    result = KINDS[kind](record, event, store)
+    return {"kind": kind, "event": event, **result}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file", nargs="?", help="JSON lines or CSV file (default: stdin)")
+    parser.add_argument("--kind", choices=sorted(KINDS), help="kind for records without a 'kind' field")
+    parser.add_argument("--event", help="event for records without one (default: the latest event)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="input format (default: from the file name)")
+    parser.add_argument("--dry-run", action="store_true", help="compute without storing")
+    args = parser.parse_args(argv)
+
+    file_format = args.format or ("csv" if args.file and args.file.lower().endswith(".csv") else "jsonl")
+    store = not args.dry_run
+
+    event = args.event
+    if store:
+        import migrations
+        migrations.migrate()
+    if not event:
+        try:
+            from events import latest_event
+            event = latest_event()
+        except sqlite3.Error:
+            event = None
+
+    stream = open(args.file, newline="", encoding="utf-8") if args.file else sys.stdin
+    stored = failed = 0
+    total = 0.0
+    try:
+        for number, record in enumerate(read_records(stream, file_format), 1):
+            try:
+                result = process(record, args.kind, event, store)
+            except (InvalidRecord, sqlite3.Error) as e:
+                failed += 1
+                print(json.dumps({"record": number, "error": str(e)}), file=sys.stderr)
+                continue
+            stored += 1
+            total += result["emission"]
+            print(json.dumps(result))
+    finally:
+        if args.file:
+            stream.close()
+
+    verb = "computed" if args.dry_run else "stored"
+    print(f"{stored} records {verb}, {failed} failed, {total:.3f} kg CO₂e in total", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
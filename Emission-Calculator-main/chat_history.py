@@ -0,0 +1,138 @@
+"""Bounded chat history for the sidebar assistant.
+
+Every message is stored in ``ChatMessages`` under its conversation. A
+session keeps only the newest ``CHAT_WINDOW`` messages in memory and the
+chat renders just those, so a rerun costs the same however long the
+conversation has grown. Older messages are read from the database one page
+at a time, newest first, through the (conversation, id) index, and only
+when asked for. Each conversation is trimmed to its newest
+``CHAT_HISTORY_LIMIT`` messages::
+
+    history = chat_history.ChatHistory("alice")
+    history.append("user", "What are my total emissions?")
+    for message in history.visible():
+        ...
+"""
+import os
+import sqlite3
+import logging
+from collections import deque, namedtuple
+from typing import List, Optional, Tuple
+
+import db
+import queries
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+CHAT_WINDOW = int(os.environ.get("CHAT_WINDOW", "20"))
+PAGE_SIZE = int(os.environ.get("CHAT_PAGE_SIZE", "20"))
+HISTORY_LIMIT = int(os.environ.get("CHAT_HISTORY_LIMIT", "1000"))
+
+# Appends between trims of a conversation
+COMPACT_EVERY = 50
+
+# Upper bound for message ids, so the first page uses the same query as the rest
+_NEWEST = 2 ** 63 - 1
+
+Message = namedtuple("Message", ["id", "role", "content"])
+
+
+def page(conversation: str, before: Optional[int] = None, limit: int = PAGE_SIZE) -> Tuple[List[Message], bool]:
+    """Return up to ``limit`` messages older than id ``before``, oldest first, and whether more remain."""
+    rows = db.fetchall(queries.CHAT_HISTORY_PAGE, (conversation, before or _NEWEST, limit + 1))
+    return [Message(*row) for row in reversed(rows[:limit])], len(rows) > limit
+
+
+def save(conversation: str, role: str, content: str) -> int:
+    """Store a message and return its id."""
+    return db.execute("INSERT INTO ChatMessages (conversation, role, content) VALUES (?, ?, ?)",
+                      (conversation, role, content))
+
+
+def compact(conversation: str, keep: int = HISTORY_LIMIT) -> int:
+    """Delete all but the newest ``keep`` messages of a conversation; return how many went."""
+    with db.transaction() as conn:
+        return conn.execute("""
+            DELETE FROM ChatMessages
+            WHERE conversation = ? AND id <= (SELECT id FROM ChatMessages WHERE conversation = ?
+                                              ORDER BY id DESC LIMIT 1 OFFSET ?)""",
+                            (conversation, conversation, keep)).rowcount
+
+
+def clear(conversation: str):
+    """Delete a whole conversation."""
+    db.execute("DELETE FROM ChatMessages WHERE conversation = ?", (conversation,))
+
+
+class ChatHistory:
+    """One session's view of a conversation: the newest messages plus any earlier pages it loaded."""
+
+    def __init__(self, conversation: str, window: int = CHAT_WINDOW):
+        self.conversation = conversation
+        self.tail = deque(maxlen=window)
+        self.earlier: List[Message] = []
+        self.has_earlier = False
+        self._appended = 0
+        try:
+            messages, self.has_earlier = page(conversation, limit=window)
+        except sqlite3.Error as e:
+            logging.error(f"Could not load chat history for {conversation}: {e}")
+            messages = []
+        self.tail.extend(messages)
+
+    def _oldest_id(self) -> Optional[int]:
+        for message in self.earlier or self.tail:
+            if message.id is not None:
+                return message.id
+        return None
+
+    def append(self, role: str, content: str) -> Message:
+        """Add a message to the conversation, keeping it in memory if it cannot be stored."""
+        try:
+            message = Message(save(self.conversation, role, content), role, content)
+        except sqlite3.Error as e:
+            logging.error(f"Could not save chat message for {self.conversation}: {e}")
+            message = Message(None, role, content)
+        if len(self.tail) == self.tail.maxlen:
+            # The oldest message leaves the window; keep loaded pages contiguous
+            if self.earlier:
+                self.earlier.append(self.tail[0])
+            elif self.tail[0].id is not None:
+                self.has_earlier = True
+        self.tail.append(message)
+
+        self._appended += 1
+        if self._appended % COMPACT_EVERY == 0:
+            try:
+                removed = compact(self.conversation)
+            except sqlite3.Error as e:
+                logging.error(f"Could not trim chat history for {self.conversation}: {e}")
+            else:
+                if removed:
+                    logging.info(f"Trimmed {removed} old chat messages for {self.conversation}")
+        return message
+
+    def load_earlier(self) -> bool:
+        """Read the page before the oldest loaded message; return whether anything was added."""
+        oldest = self._oldest_id()
+        if oldest is None:
+            self.has_earlier = False
+            return False
+        try:
+            messages, self.has_earlier = page(self.conversation, before=oldest)
+        except sqlite3.Error as e:
+            logging.error(f"Could not load earlier chat messages for {self.conversation}: {e}")
+            return False
+        self.earlier[:0] = messages
+        return bool(messages)
+
+    def hide_earlier(self):
+        """Forget loaded pages so only the window is rendered again."""
+        if self.earlier:
+            self.earlier = []
+            self.has_earlier = True
+
+    def visible(self) -> List[Message]:
+        """Return the messages to render, oldest first."""
+        return self.earlier + list(self.tail)
@@ -0,0 +1,391 @@
+"""Turn chatbot questions into filtered aggregate queries.
+
+A question is tokenized and matched, longest phrase first, against a
+compiled phrase index of intents ("total", "breakdown", "trend", ...) and
+entities: scope, source, fuel, the names of existing events, and a period
+("in March 2025", "from January to March", "since 2024", "last 6 months").
+The resulting :class:`Intent` picks one of the audited query variants in
+``queries`` (``CHAT_TOTALS``, ``CHAT_MONTHLY``, ``CHAT_FUELS``) with its
+filters as parameters; periods are answered from the monthly rollup, so a
+question about one event or month reads only that slice. Results are
+cached per intent until the data version moves, so a repeated question
+costs a dict lookup::
+
+    intent = chat_query.parse("Scope 3 logistics emissions for Annual Meet from January to March")
+    result = chat_query.answer(intent)
+"""
+import re
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict, defaultdict, namedtuple
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+import db
+import queries
+import events
+import data_version
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+RESULT_CACHE_SIZE = 512
+
+# 📌 Vocabulary: value -> phrases that name it
+INTENTS = {
+    "total": ["total", "overall", "footprint", "sum", "how much", "altogether"],
+    "breakdown": ["breakdown", "break down", "split", "category", "categories", "by source", "sources",
+                  "per source", "composition", "by fuel", "fuels"],
+    "trend": ["monthly", "per month", "by month", "each month", "trend", "over time", "timeline"],
+    "top": ["largest", "biggest", "top", "highest", "most", "main", "major"],
+    "tips": ["reduce", "reduction", "tip", "tips", "advice", "lower", "cut"],
+    "explain": ["what is", "what are", "explain", "meaning", "define", "definition"],
+}
+# Which intent wins when a question has words for several; "what is" only
+# asks for an explanation when nothing more specific is asked for
+INTENT_PRIORITY = ["tips", "trend", "top", "breakdown", "total", "explain"]
+
+SCOPES = {
+    "Scope 1": ["scope 1", "scope1", "scope one", "direct"],
+    "Scope 2": ["scope 2", "scope2", "scope two", "purchased energy"],
+    "Scope 3": ["scope 3", "scope3", "scope three", "value chain", "other indirect"],
+}
+SOURCES = {
+    "Scope1": ["fuel", "fuel combustion", "combustion", "generator", "generators"],
+    "HVACEmissions": ["hvac", "refrigerant", "refrigerants", "leak", "leaks", "air conditioning"],
+    "ElectricityEmissions": ["electricity", "electric", "power", "lighting"],
+    "Materials": ["material", "materials", "trophies", "banners", "kit", "kits", "momentoes"],
+    "transport_data": ["travel", "transport", "transportation", "commute", "commuting", "flights"],
+    "logistics_emissions": ["logistics", "freight", "shipping", "shipment", "shipments", "delivery"],
+    "food_choices": ["food", "meal", "meals", "catering", "diet"],
+}
+SOURCE_LABELS = {
+    "Scope1": "fuel combustion",
+    "HVACEmissions": "HVAC refrigerant leaks",
+    "ElectricityEmissions": "electricity",
+    "Materials": "event materials",
+    "transport_data": "attendee travel",
+    "logistics_emissions": "logistics",
+    "food_choices": "food",
+}
+FUELS = {
+    "Diesel": ["diesel"],
+    "Coal": ["coal"],
+    "Petroleum Gas (LPG)": ["lpg", "petroleum gas", "cooking gas"],
+}
+MONTH_NAMES = ["january", "february", "march", "april", "may", "june", "july",
+               "august", "september", "october", "november", "december"]
+MONTHS = {name: number for number, name in enumerate(MONTH_NAMES, 1)}
+MONTHS.update({name[:3]: number for name, number in list(MONTHS.items())})
+MONTHS["sept"] = 9
+
+# Words before a date that make it one end of an open period
+RANGE_WORDS = {
+    "from": "start", "since": "start", "after": "after",
+    "to": "end", "until": "end", "till": "end", "through": "end", "before": "before",
+}
+
+# start and end are inclusive 'YYYY-MM' months; either may be None for an open period
+Intent = namedtuple("Intent", ["kind", "event", "scope", "source", "fuel", "start", "end"])
+Intent.__new__.__defaults__ = (None,) * 6
+
+
+def tokenize(text: str) -> List[str]:
+    return re.findall(r"[a-z0-9]+", (text or "").lower())
+
+
+class PhraseIndex:
+    """Maps token sequences to (slot, value), matched longest first."""
+
+    def __init__(self, entries: Dict[Tuple[str, ...], Tuple[str, object]]):
+        self.entries = entries
+        self.longest = max((len(phrase) for phrase in entries), default=0)
+
+    @classmethod
+    def from_vocabulary(cls, slot: str, vocabulary: Dict[object, List[str]]) -> "PhraseIndex":
+        return cls({tuple(tokenize(phrase)): (slot, value)
+                    for value, phrases in vocabulary.items() for phrase in phrases})
+
+    def match_at(self, tokens: List[str], start: int) -> Optional[Tuple[int, Tuple[str, object]]]:
+        for length in range(min(self.longest, len(tokens) - start), 0, -1):
+            hit = self.entries.get(tuple(tokens[start:start + length]))
+            if hit is not None:
+                return length, hit
+        return None
+
+
+# The fixed vocabulary is compiled once; event names are recompiled when they change
+_VOCABULARY = PhraseIndex({
+    **PhraseIndex.from_vocabulary("kind", INTENTS).entries,
+    **PhraseIndex.from_vocabulary("scope", SCOPES).entries,
+    **PhraseIndex.from_vocabulary("source", SOURCES).entries,
+    **PhraseIndex.from_vocabulary("fuel", FUELS).entries,
+    **{(name,): ("month", number) for name, number in MONTHS.items()},
+})
+_event_index = {"names": None, "index": PhraseIndex({})}
+_event_lock = threading.Lock()
+
+
+def _events() -> PhraseIndex:
+    names = tuple(events.list_events())
+    if names != _event_index["names"]:
+        with _event_lock:
+            _event_index["index"] = PhraseIndex({tuple(tokenize(name)): ("event", name)
+                                                  for name in reversed(names) if tokenize(name)})
+            _event_index["names"] = names
+    return _event_index["index"]
+
+
+def _month_index(year: int, month: int) -> int:
+    return year * 12 + month - 1
+
+
+def _month(index: int) -> str:
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def _relative(tokens: List[str], position: int, today: date) -> Optional[Tuple[int, int, int]]:
+    """Match 'this month', 'last year', 'last 6 months', ... as (length, first, last) month indexes."""
+    if tokens[position] not in ("this", "last", "past"):
+        return None
+    now = _month_index(today.year, today.month)
+    words = tokens[position + 1:position + 3]
+    if words[:1] == ["month"]:
+        return 2, now - (tokens[position] != "this"), now - (tokens[position] != "this")
+    if words[:1] == ["year"]:
+        if tokens[position] == "this":
+            return 2, _month_index(today.year, 1), now
+        return 2, _month_index(today.year - 1, 1), _month_index(today.year - 1, 12)
+    if len(words) == 2 and words[0].isdigit() and words[1] in ("months", "years") and int(words[0]) > 0:
+        count = int(words[0]) * (12 if words[1] == "years" else 1)
+        return 3, now - count + 1, now
+    return None
+
+
+def _resolve(points: List[dict], today: date) -> Tuple[Optional[str], Optional[str]]:
+    """Turn the dates found in a question into an inclusive (start, end) range of months."""
+    if not points:
+        return None, None
+    # A month without a year takes the year of the date it is paired with
+    # ("January to March 2025"), else its most recent occurrence
+    for number, point in enumerate(points):
+        if point.get("span") or point["year"]:
+            continue
+        partner = next((p for p in points[number + 1:] + points[:number][::-1] if p["year"]), None)
+        if partner:
+            point["year"] = partner["year"]
+        else:
+            point["year"] = today.year if point["month"] <= today.month else today.year - 1
+    spans = []
+    for point in points:
+        if point.get("span"):
+            spans.append(point["span"])
+        elif point["month"]:
+            spans.append((_month_index(point["year"], point["month"]),) * 2)
+        else:
+            spans.append((_month_index(point["year"], 1), _month_index(point["year"], 12)))
+
+    if len(spans) >= 2:
+        first, last = spans[0][0], spans[1][1]
+        if first > last and not points[0].get("span") and points[0]["month"]:
+            first -= 12  # "November to February 2025" starts in 2024
+        first, last = min(first, last), max(first, last)
+        return _month(first), _month(last)
+    first, last = spans[0]
+    marker = points[0]["marker"]
+    if marker == "start":
+        return _month(first), None
+    if marker == "after":
+        return _month(last + 1), None
+    if marker == "end":
+        return None, _month(last)
+    if marker == "before":
+        return None, _month(first - 1)
+    return _month(first), _month(last)
+
+
+def parse(question: str, today: Optional[date] = None) -> Intent:
+    """Extract the intent and filters from a question."""
+    tokens = tokenize(question)
+    today = today or date.today()
+    event_index = _events()
+    slots = {}
+    kinds = set()
+    points = []
+    position = 0
+    while position < len(tokens):
+        token = tokens[position]
+        marker = RANGE_WORDS.get(tokens[position - 1]) if position else None
+        relative = _relative(tokens, position, today)
+        if relative:
+            length, first, last = relative
+            points.append({"span": (first, last), "marker": marker})
+            position += length
+            continue
+        # Event names win over shorter vocabulary matches ("Solar Power" is an event, not electricity)
+        vocabulary = _VOCABULARY.match_at(tokens, position)
+        named = event_index.match_at(tokens, position)
+        if named and (not vocabulary or named[0] > vocabulary[0]):
+            vocabulary = named
+        if vocabulary:
+            length, (slot, value) = vocabulary
+            position += length
+            if slot == "kind":
+                kinds.add(value)
+            elif slot == "month":
+                # "March 2025"
+                year = None
+                if position < len(tokens) and re.fullmatch(r"20\d\d", tokens[position]):
+                    year = int(tokens[position])
+                    position += 1
+                points.append({"year": year, "month": value, "marker": marker})
+            else:
+                slots.setdefault(slot, value)
+            continue
+        if re.fullmatch(r"20\d\d", token):
+            month = None
+            # "2025-03" and "2025 03"
+            if position + 1 < len(tokens) and re.fullmatch(r"0?[1-9]|1[0-2]", tokens[position + 1]):
+                month = int(tokens[position + 1])
+                position += 1
+            points.append({"year": int(token), "month": month, "marker": marker})
+        position += 1
+
+    if slots.get("fuel"):
+        slots.setdefault("source", "Scope1")
+    slots["start"], slots["end"] = _resolve(points, today)
+    kind = next((k for k in INTENT_PRIORITY if k in kinds), None)
+    if kind is None and any(slots.values()):
+        kind = "total"
+    return Intent(kind=kind or "unknown", **slots)
+
+
+def _month_label(month: str) -> str:
+    year, number = month.split("-")
+    return f"{MONTH_NAMES[int(number) - 1].title()} {year}"
+
+
+def describe(intent: Intent) -> str:
+    """Return the filters of an intent in words, e.g. 'for Scope 3 logistics at Expo in March 2025'."""
+    parts = []
+    subject = " ".join(filter(None, [intent.scope, intent.fuel or SOURCE_LABELS.get(intent.source)]))
+    if subject:
+        parts.append(f"for {subject}")
+    if intent.event:
+        parts.append(f"at {intent.event}")
+    start, end = intent.start, intent.end
+    if start and start == end:
+        parts.append(f"in {_month_label(start)}")
+    elif start and end and start.endswith("-01") and end.endswith("-12") and start[:4] == end[:4]:
+        parts.append(f"in {start[:4]}")
+    elif start and end:
+        first = _month_label(start).split()[0] if start[:4] == end[:4] else _month_label(start)
+        parts.append(f"from {first} to {_month_label(end)}")
+    elif start:
+        parts.append(f"since {_month_label(start)}")
+    elif end:
+        parts.append(f"up to {_month_label(end)}")
+    return " ".join(parts)
+
+
+def period(intent: Intent) -> Optional[Tuple[str, str]]:
+    """Return the inclusive range of 'YYYY-MM' months an intent is limited to, if any."""
+    if not (intent.start or intent.end):
+        return None
+    return intent.start or "0000-01", intent.end or "9999-12"
+
+
+def _timestamps(months: Tuple[str, str]) -> Tuple[str, str]:
+    """Return the [start, end) timestamps covering an inclusive range of months."""
+    first, last = months
+    if last >= "9999-12":
+        # Open-ended: the month after 9999-12 would sort before every real timestamp
+        return f"{first}-01", "9999-12-31 23:59:59"
+    year, month = map(int, last.split("-"))
+    return f"{first}-01", _month(_month_index(year, month) + 1) + "-01"
+
+
+# 📌 Queries
+def _totals(intent: Intent) -> List[Tuple[str, str, float]]:
+    key = (bool(intent.event), bool(intent.scope), bool(intent.source))
+    params = [value for value in (intent.event, intent.scope, intent.source) if value]
+    return [(scope, source, total or 0.0) for scope, source, total in db.fetchall(queries.CHAT_TOTALS[key], params)]
+
+
+def _dated(intent: Intent) -> Tuple[List[Tuple[str, str, float]], Dict[str, float]]:
+    """Return (scope, source, emission) rows and per-month totals from the monthly rollup."""
+    window = period(intent)
+    key = (bool(intent.event), bool(intent.scope), bool(intent.source), bool(window))
+    params = ([intent.event] if intent.event else []) + (list(window) if window else []) \
+        + [value for value in (intent.scope, intent.source) if value]
+    sources, months = defaultdict(float), defaultdict(float)
+    for month, scope, source, emission in db.fetchall(queries.CHAT_MONTHLY[key], params):
+        sources[(scope, source)] += emission or 0
+        months[month] += emission or 0
+    rows = [(scope, source, total) for (scope, source), total in sources.items() if total]
+    return rows, dict(sorted(months.items()))
+
+
+def _fuels(intent: Intent) -> List[Tuple[str, str, float]]:
+    window = period(intent)
+    key = (bool(intent.event), bool(intent.fuel), bool(window))
+    params = [value for value in (intent.event, intent.fuel) if value] + (list(_timestamps(window)) if window else [])
+    return [("Scope 1", fuel, emission or 0.0) for fuel, emission in db.fetchall(queries.CHAT_FUELS[key], params)]
+
+
+def _run(intent: Intent) -> dict:
+    months: Dict[str, float] = {}
+    undated = False
+    if intent.fuel or (intent.source == "Scope1" and intent.kind == "breakdown"):
+        rows, by = _fuels(intent), "fuel"
+    elif period(intent) or intent.kind == "trend":
+        rows, months = _dated(intent)
+        by = "source"
+        # Travel and food entries carry no date, so they cannot be placed in a period
+        if intent.source:
+            undated = intent.source not in queries.CHAT_DATED_SOURCES
+        else:
+            undated = intent.scope in (None, "Scope 3")
+    else:
+        rows, by = _totals(intent), "source"
+    scopes = defaultdict(float)
+    for scope, _, emission in rows:
+        scopes[scope] += emission
+    return {
+        "rows": sorted(rows, key=lambda row: row[2], reverse=True),  # (scope, source or fuel, kg CO₂e)
+        "by": by,
+        "total": sum(scopes.values()),
+        "scopes": dict(scopes),
+        "months": months,
+        "undated_excluded": undated and bool(period(intent)),
+    }
+
+
+_results: "OrderedDict[Intent, dict]" = OrderedDict()
+_results_lock = threading.Lock()
+_results_version = {"version": None}
+
+
+def answer(intent: Intent) -> Optional[dict]:
+    """Return the figures for an intent, from the cache while the data is unchanged."""
+    version = data_version.current()
+    with _results_lock:
+        if version != _results_version["version"]:
+            _results.clear()
+            _results_version["version"] = version
+        result = _results.get(intent)
+        if result is not None:
+            _results.move_to_end(intent)
+            return result
+    try:
+        result = _run(intent)
+    except sqlite3.Error as e:
+        logging.error(f"Chatbot query failed for {intent}: {e}")
+        return None
+    with _results_lock:
+        if _results_version["version"] == version:
+            _results[intent] = result
+            while len(_results) > RESULT_CACHE_SIZE:
+                _results.popitem(last=False)
+    return result
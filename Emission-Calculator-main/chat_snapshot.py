@@ -0,0 +1,112 @@
+"""Emission figures for the chatbot, shared by every session in the process.
+
+The snapshot holds the total, per-scope and per-source emissions from
+``MasterEmissions``; questions about an event or a period are answered by
+``chat_query`` instead. It is rebuilt only when the data version moves,
+and then incrementally: ``MasterEmissions`` is append-only, so only rows
+added since the last build are read, in one grouped query. Serving a
+snapshot costs one read of the data version.
+"""
+import re
+import sqlite3
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import db
+import queries
+import data_version
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+SCOPES = ("Scope 1", "Scope 2", "Scope 3")
+
+DEFAULT_TIPS = [
+    "Use public transportation instead of driving alone",
+    "Switch to LED light bulbs",
+    "Reduce meat consumption, especially beef",
+    "Buy locally produced goods when possible",
+    "Use a programmable thermostat to reduce energy use",
+    "Properly insulate your home",
+    "Reduce, reuse, recycle in that order",
+    "Consider offsetting your carbon footprint through verified programs",
+]
+
+_lock = threading.Lock()
+_state = {
+    "version": None,
+    "last_id": 0,
+    "totals": defaultdict(float),  # (scope, source) -> kg CO₂e
+    "tips": None,
+    "snapshot": None,
+}
+
+
+def scope_label(category: str) -> str:
+    """Return 'Scope 1' for 'Scope1', 'scope 1' or 'Scope 1'."""
+    match = re.match(r"\s*scope\s*(\d)", category or "", re.IGNORECASE)
+    return f"Scope {match.group(1)}" if match else (category or "Unknown")
+
+
+def _tips() -> List[str]:
+    try:
+        tips = [row[0] for row in db.fetchall(queries.CHAT_TIPS)]
+    except sqlite3.Error:
+        tips = []
+    return tips or list(DEFAULT_TIPS)
+
+
+def _fold(rows: List[Tuple]) -> int:
+    """Add grouped rows to the running totals and return the highest id seen."""
+    last_id = _state["last_id"]
+    totals = _state["totals"]
+    for category, source, emission, max_id in rows:
+        totals[(scope_label(category), source)] += emission or 0
+        last_id = max(last_id, max_id)
+    return last_id
+
+
+def _build() -> dict:
+    scopes = dict.fromkeys(SCOPES, 0.0)
+    categories: Dict[str, float] = defaultdict(float)
+    for (scope, source), emission in _state["totals"].items():
+        scopes[scope] = scopes.get(scope, 0.0) + emission
+        categories[source] += emission
+    return {
+        "total": sum(scopes.values()),
+        "scopes": scopes,
+        "categories": dict(categories),
+        "reduction_tips": _state["tips"] or list(DEFAULT_TIPS),
+    }
+
+
+def get() -> dict:
+    """Return the current snapshot, updating it first if the data has changed."""
+    version = data_version.current()
+    snapshot = _state["snapshot"]
+    if snapshot is not None and version == _state["version"]:
+        return snapshot
+    with _lock:
+        if _state["snapshot"] is not None and version == _state["version"]:
+            return _state["snapshot"]
+        try:
+            if _state["tips"] is None:
+                _state["tips"] = _tips()
+            rows = db.fetchall(queries.CHAT_SNAPSHOT_SINCE, (_state["last_id"],))
+            if not rows and _state["last_id"] and db.fetchone(queries.CHAT_MAX_ID)[0] < _state["last_id"]:
+                reset()  # the table was emptied or replaced
+                rows = db.fetchall(queries.CHAT_SNAPSHOT_SINCE, (0,))
+            _state["last_id"] = _fold(rows)
+        except sqlite3.Error as e:
+            logging.error(f"Could not update chatbot snapshot: {e}")
+            return _state["snapshot"] or _build()
+        _state["snapshot"] = _build()
+        _state["version"] = version
+        return _state["snapshot"]
+
+
+def reset():
+    """Drop the snapshot so the next :func:`get` rebuilds it from scratch."""
+    _state.update(version=None, last_id=0, totals=defaultdict(float), snapshot=None)
@@ -0,0 +1,10 @@
+"""Calculation and persistence core shared by the dashboard, the travel form and the CLI.
+
+Nothing in this package imports streamlit, plotly or pandas. Functions
+return values and raise ``sqlite3.Error`` or ``LookupFailed``; reporting
+them to the user is left to the caller.
+"""
+
+
+class LookupFailed(Exception):
+    """Raised when a distance or location lookup cannot be answered."""
@@ -0,0 +1,50 @@
+from typing import List, Tuple
+
+import db
+import factors
+
+# ⚡ Electricity Consumption Emission Factors (kg CO₂ per kWh)
+ELECTRICITY_EMISSION_FACTORS = factors.FACTORS["electricity"]
+
+# ❄ HVAC Refrigerant Emission Factors
+HVAC_REFRIGERANTS = {name: {"EF (kg CO₂eq/kg)": ef} for name, ef in factors.FACTORS["refrigerant"].items()}
+
+
+def calculate_electricity_emission(category: str, value: float) -> float:
+    """Calculate emissions based on electricity consumption."""
+    return factors.emission("electricity", category, value)  # kg CO₂, 0 if no match found
+
+
+def calculate_hvac_emission(refrigerant: str, mass_leak: float) -> float:
+    """Calculate emissions based on HVAC refrigerant leakage."""
+    return factors.emission("refrigerant", refrigerant, mass_leak)  # kg CO₂eq
+
+
+def suggest_greener_alternatives(current_refrigerant: str) -> List[Tuple[str, float, float]]:
+    """Suggest greener alternatives for a given refrigerant."""
+    current_ef = HVAC_REFRIGERANTS[current_refrigerant]["EF (kg CO₂eq/kg)"]
+    greener_options = []
+
+    for alt_refrigerant, data in HVAC_REFRIGERANTS.items():
+        alt_ef = data["EF (kg CO₂eq/kg)"]
+        if alt_ef < current_ef:
+            reduction = ((current_ef - alt_ef) / current_ef) * 100
+            greener_options.append((alt_refrigerant, alt_ef, reduction))
+
+    return sorted(greener_options, key=lambda x: x[1])  # Sort by EF (ascending)
+
+
+def save_electricity(event: str, category: str, value: float, emission: float) -> int:
+    """Store an electricity entry and return its id."""
+    return db.execute(
+        "INSERT INTO ElectricityEmissions (event, Usage, Value, Emission) VALUES (?, ?, ?, ?)",
+        (event, category, value, emission),
+    )
+
+
+def save_hvac(event: str, refrigerant: str, mass_leak: float, emission: float) -> int:
+    """Store an HVAC leak entry and return its id."""
+    return db.execute(
+        "INSERT INTO HVACEmissions (event, Refrigerant, MassLeak, Emission) VALUES (?, ?, ?, ?)",
+        (event, refrigerant, mass_leak, emission),
+    )
@@ -0,0 +1,97 @@
+import os
+import logging
+from typing import Optional
+
+import db
+import factors
+from geocache import geo_cache
+from core import LookupFailed
+
+# Transport modes (emission factors and efficiencies live in factors.py)
+TRANSPORT_MODES = {
+    "Truck": {"profile": "driving-car"},
+    "Rail": {"profile": "driving-hgv"},  # Heavy Goods Vehicle as a proxy
+    "Air": {"profile": None}  # Geodesic Distance for Air
+}
+
+# Used when no key is passed in; the dashboard passes its Streamlit secret
+GOOGLE_MAPS_API_KEY = os.environ.get("GOOGLE_MAPS_API_KEY")
+
+_geolocator = None
+
+
+def freight_emission(transport_mode: str, distance: float, weight: float) -> float:
+    """Emission in kg CO₂ for moving ``weight`` kg over ``distance`` km."""
+    return round(factors.emission("freight", transport_mode, distance, weight), 2)
+
+
+def save_logistics(event, material, transport_mode, origin, destination, distance, weight, total_emission) -> int:
+    """Store a logistics entry and return its id."""
+    return db.execute('''
+        INSERT INTO logistics_emissions
+        (Event, material, transport_mode, origin, destination, distance_km, weight_kg, total_emission)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', (event, material, transport_mode, origin, destination, distance, weight, total_emission))
+
+
+# HTTP and geocoding libraries load on the first lookup only
+def _google_road_distance(origin, destination, api_key):
+    import requests
+
+    if not api_key:
+        raise LookupFailed("No Google Maps API key configured")
+    url = f"https://maps.googleapis.com/maps/api/distancematrix/json?units=metric&origins={origin}&destinations={destination}&key={api_key}"
+    try:
+        data = requests.get(url, timeout=10).json()
+    except (requests.RequestException, ValueError) as e:
+        raise LookupFailed(f"Error fetching distance: {e}")
+
+    if data["status"] != "OK":
+        raise LookupFailed("Google Maps API error: " + data.get("error_message", "Unknown error"))
+    try:
+        distance_text = data["rows"][0]["elements"][0]["distance"]["text"]
+    except (KeyError, IndexError):
+        raise LookupFailed(f"No road route from {origin} to {destination}")
+    return round(float(distance_text.replace(" km", "").replace(",", "")), 2)
+
+
+def road_distance(origin: str, destination: str, api_key: Optional[str] = None) -> float:
+    """Road distance in km, served from the geocode cache when known."""
+    key = api_key or GOOGLE_MAPS_API_KEY
+    return geo_cache.cached("road_distance", lambda o, d: _google_road_distance(o, d, key), origin, destination)
+
+
+def _nominatim_coords(place):
+    global _geolocator
+    if _geolocator is None:
+        from geopy.geocoders import Nominatim
+        # One geocoder per process; Nominatim asks clients to reuse a session
+        _geolocator = Nominatim(user_agent="logistics_app", timeout=10)
+    location = _geolocator.geocode(place)
+    return [location.latitude, location.longitude] if location else None
+
+
+def _geodesic_air_distance(origin, destination):
+    from geopy.distance import geodesic
+
+    try:
+        origin_coords = geo_cache.cached("nominatim:geocode", _nominatim_coords, origin)
+        destination_coords = geo_cache.cached("nominatim:geocode", _nominatim_coords, destination)
+    except Exception as e:
+        raise LookupFailed(f"Error getting coordinates: {e}")
+    if not (origin_coords and destination_coords):
+        logging.warning(f"Could not geocode {origin} or {destination}")
+        return None
+    return round(geodesic(origin_coords, destination_coords).km, 2)
+
+
+def air_distance(origin: str, destination: str) -> Optional[float]:
+    """Great-circle distance in km, served from the geocode cache when known."""
+    return geo_cache.cached("air_distance", _geodesic_air_distance, origin, destination)
+
+
+def distance_for(transport_mode: str, origin: str, destination: str, api_key: Optional[str] = None) -> Optional[float]:
+    """Distance for a freight leg: great-circle for air, by road otherwise."""
+    if transport_mode == "Air":
+        return air_distance(origin, destination)
+    return road_distance(origin, destination, api_key)
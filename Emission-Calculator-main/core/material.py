@@ -0,0 +1,45 @@
+import db
+import factors
+
+# 🏆 Emission Factors (kg CO₂ per kg)
+EMISSION_FACTORS = factors.MATERIAL_COMPONENTS
+
+CATEGORIES = list(factors.FACTORS["material"])
+
+
+def calculate_material_emission(category: str, weight: float, quantity: int) -> float:
+    """Calculate emissions for ``quantity`` items of a material category."""
+    return factors.emission("material", category, weight, quantity)
+
+
+def calculate_trophy_emission(weight: float, quantity: int) -> float:
+    """Calculate emissions for trophies."""
+    return calculate_material_emission("Trophies", weight, quantity)
+
+
+def calculate_banner_emission(weight: float, quantity: int) -> float:
+    """Calculate emissions for banners."""
+    return calculate_material_emission("Banners", weight, quantity)
+
+
+def calculate_momento_emission(weight: float, quantity: int) -> float:
+    """Calculate emissions for momentoes."""
+    return calculate_material_emission("Momentoes", weight, quantity)
+
+
+def calculate_kit_emission(weight: float, quantity: int) -> float:
+    """Calculate emissions for kits."""
+    return calculate_material_emission("Kit", weight, quantity)
+
+
+def calculate_kit_item_emission(category: str, weight: float, quantity: int) -> float:
+    """Calculate emissions for individual kit items."""
+    return factors.emission("kit_item", category, weight, quantity)
+
+
+def save_material(event: str, category: str, weight: float, quantity: int, emission: float) -> int:
+    """Store a material entry and return its id."""
+    return db.execute(
+        "INSERT INTO Materials (event, Category, Weight, Quantity, Emission) VALUES (?, ?, ?, ?, ?)",
+        (event, category, weight, quantity, emission),
+    )
@@ -0,0 +1,28 @@
+import json
+from typing import List, Tuple
+
+import db
+import factors
+
+# Emission factors (kg CO₂ per kWh)
+EMISSION_FACTORS = factors.FACTORS["fuel"]
+
+
+def calculate_emission(fuel_type: str, consumption: float) -> float:
+    """Calculate emission based on fuel type and consumption."""
+    return factors.emission("fuel", fuel_type, consumption)
+
+
+def calculate_entries(fuels: List[str], consumptions: List[float]) -> Tuple[List[float], float]:
+    """Return the emission of every fuel entry and their total."""
+    emissions = [calculate_emission(fuel, consumption) for fuel, consumption in zip(fuels, consumptions)]
+    return emissions, sum(emissions)
+
+
+def save_scope1(event: str, fuels: List[str], consumptions: List[float], emissions: List[float],
+                total_emission: float) -> int:
+    """Store one Scope 1 submission and return its id."""
+    return db.execute(
+        "INSERT INTO Scope1 (event, fuels, consumptions, emissions, total_emission) VALUES (?, ?, ?, ?, ?)",
+        (event, json.dumps(fuels), json.dumps(consumptions), json.dumps(emissions), total_emission),
+    )
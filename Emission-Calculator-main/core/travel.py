@@ -0,0 +1,24 @@
+from typing import Iterable, List, Sequence
+
+import db
+import factors
+
+# Travel modes and the factor table each one uses; "Distance" entries are
+# typed in by hand and priced as road travel
+MODE_TABLES = {"Road": "road", "Rail": "rail", "Air": "air", "Distance": "road"}
+
+
+def travel_emission(mode: str, type_: str, distance: float) -> float:
+    """Emission in kg CO₂e for one travel leg."""
+    if mode == "Air":
+        return factors.emission("air", "Flight", distance)
+    return factors.emission(MODE_TABLES.get(mode, "road"), type_, distance)
+
+
+def save_travel_legs(event: str, legs: Iterable[Sequence]) -> List[int]:
+    """Save every leg of a trip in one transaction and return the row ids.
+
+    ``legs`` holds ``(mode, type, origin, destination, distance, emission)`` tuples.
+    """
+    return db.insert_many('''INSERT INTO transport_data (Event, mode, type, origin, destination, distance, emission)
+                 VALUES (?, ?, ?, ?, ?, ?, ?)''', [(event, *leg) for leg in legs])
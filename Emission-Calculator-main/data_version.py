@@ -0,0 +1,31 @@
+import sqlite3
+import logging
+from typing import Iterable, Optional
+
+import db
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def current(tables: Optional[Iterable[str]] = None) -> int:
+    """Return the data version of ``tables`` (all tracked tables by default).
+
+    The counters in ``DataVersion`` are bumped by triggers on every insert,
+    update and delete, so the sum only ever grows and any change to the
+    watched tables yields a new value. Reading it is a single primary-key
+    scan over a handful of rows.
+    """
+    try:
+        if tables is None:
+            row = db.fetchone("SELECT COALESCE(SUM(version), 0) FROM DataVersion")
+        else:
+            tables = list(tables)
+            placeholders = ", ".join("?" for _ in tables)
+            row = db.fetchone(
+                f"SELECT COALESCE(SUM(version), 0) FROM DataVersion WHERE name IN ({placeholders})", tables
+            )
+    except sqlite3.Error as e:
+        logging.error(f"Could not read data version: {e}")
+        return 0
+    return row[0]
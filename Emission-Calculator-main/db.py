@@ -0,0 +1,233 @@
+import os
+import atexit
+import queue
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterable, List, Optional, Sequence
+
+import timing
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.environ.get(
+    "EMISSIONS_DB_PATH", os.path.join(BASE_DIR, "..", "data", "emissions.db")
+)
+
+# Connections are held only for the duration of a call, so the pool needs one
+# per thread that can query at the same moment: the travel form's entry and
+# lookup pools (8 + 16 workers, form/logistics.py), the report builder thread
+# and the Streamlit script threads. Connections are opened lazily, so an idle
+# pool costs nothing.
+POOL_SIZE = int(os.environ.get("EMISSIONS_DB_POOL_SIZE", "32"))
+BUSY_TIMEOUT_MS = 5000
+
+# Pragmas applied to every pooled connection. WAL lets readers (dashboards)
+# run while a form submission holds the write lock.
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",
+)
+
+
+class ConnectionPool:
+    """A small, thread-aware pool of SQLite connections.
+
+    Connections are opened lazily up to ``size`` and handed out one thread at a
+    time. A thread that already holds a connection gets the same one back, so
+    nested helpers share a transaction instead of deadlocking on a second
+    writer. Each connection keeps its own prepared-statement cache, which is
+    why reusing them is cheaper than reconnecting per query.
+    """
+
+    def __init__(self, path: str, size: int = POOL_SIZE, cached_statements: int = 256):
+        self.path = path
+        self.size = size
+        self.cached_statements = cached_statements
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False,
+            isolation_level=None,  # transactions are managed explicitly below
+            cached_statements=self.cached_statements,
+        )
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._opened < self.size:
+                self._opened += 1
+                try:
+                    return self._connect()
+                except sqlite3.Error:
+                    self._opened -= 1
+                    raise
+        try:
+            return self._idle.get(timeout=BUSY_TIMEOUT_MS / 1000)
+        except queue.Empty:
+            # Surface as a database error so callers' sqlite3.Error handling applies
+            raise sqlite3.OperationalError("connection pool exhausted") from None
+
+    def _release(self, conn: sqlite3.Connection):
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        """Check out a connection for the current thread."""
+        held = getattr(self._local, "conn", None)
+        if held is not None:
+            yield held
+            return
+
+        conn = self._acquire()
+        self._local.conn = conn
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            self._release(conn)
+
+    @contextmanager
+    def transaction(self):
+        """Run the enclosed statements in a single write transaction.
+
+        ``BEGIN IMMEDIATE`` takes the write lock up front so concurrent writers
+        wait on ``busy_timeout`` rather than failing mid-transaction. Nested
+        calls join the outer transaction.
+        """
+        with self.connection() as conn:
+            if conn.in_transaction:
+                yield conn
+                return
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+
+    def close(self):
+        """Close every idle connection."""
+        with self._lock:
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                conn.close()
+                self._opened -= 1
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(path: Optional[str] = None) -> ConnectionPool:
+    """Return the shared pool for ``path`` (defaults to the emissions database)."""
+    path = os.path.abspath(path or DB_PATH)
+    pool = _pools.get(path)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(path)
+            if pool is None:
+                pool = _pools[path] = ConnectionPool(path)
+                logging.info(f"Opened connection pool for {path}")
+    return pool
+
+
+def connection():
+    """Context manager yielding a pooled connection."""
+    return get_pool().connection()
+
+
+def transaction():
+    """Context manager yielding a pooled connection inside a write transaction."""
+    return get_pool().transaction()
+
+
+def _timed(query: str):
+    """Time a query in the current rerun's breakdown (a no-op elsewhere)."""
+    if not timing.recording():
+        return timing.span(query, "query")
+    return timing.span(timing.query_name(query), "query")
+
+
+def execute(query: str, params: Sequence[Any] = ()) -> int:
+    """Execute a single write statement and return the new row id."""
+    with _timed(query), transaction() as conn:
+        return conn.execute(query, params).lastrowid
+
+
+def executemany(query: str, rows: Iterable[Sequence[Any]]) -> int:
+    """Execute a write statement for every row in one transaction."""
+    with _timed(query), transaction() as conn:
+        return conn.executemany(query, rows).rowcount
+
+
+def insert_many(query: str, rows: Iterable[Sequence[Any]]) -> List[int]:
+    """Insert every row in one transaction and return the new row ids in order.
+
+    The rows go through a single ``executemany``, so ``AFTER INSERT`` triggers
+    still fire once per row. The transaction holds the write lock, so the new
+    ids are consecutive and can be derived from ``last_insert_rowid()``; this
+    assumes a plain INSERT whose rows do not supply their own ids.
+    """
+    rows = list(rows)
+    if not rows:
+        return []
+    with _timed(query), transaction() as conn:
+        count = conn.executemany(query, rows).rowcount
+        last = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+    return list(range(last - count + 1, last + 1))
+
+
+def fetchone(query: str, params: Sequence[Any] = ()) -> Optional[tuple]:
+    """Return the first row of a query, or None."""
+    with _timed(query), connection() as conn:
+        return conn.execute(query, params).fetchone()
+
+
+def fetchall(query: str, params: Sequence[Any] = ()) -> List[tuple]:
+    """Return every row of a query."""
+    with _timed(query), connection() as conn:
+        return conn.execute(query, params).fetchall()
+
+
+def read_sql(query: str, params: Sequence[Any] = ()):
+    """Run a query and return the result as a pandas DataFrame."""
+    import pandas as pd
+
+    with _timed(query), connection() as conn:
+        return pd.read_sql_query(query, conn, params=params)
+
+
+def close_all():
+    """Close every pooled connection (used on shutdown and in scripts)."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+
+
+atexit.register(close_all)
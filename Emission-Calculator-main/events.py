@@ -0,0 +1,90 @@
+import os
+import time
+import sqlite3
+import logging
+import threading
+from typing import List, Optional
+
+import db
+import queries
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# How long the active event is trusted before the Events table is re-read.
+# Writes made through this module invalidate it immediately; the TTL only
+# bounds how long another process's new event can go unnoticed.
+CACHE_TTL = float(os.environ.get("EVENT_CACHE_TTL", "5"))
+
+# Session key holding an explicitly selected event
+SESSION_KEY = "selected_event"
+
+_lock = threading.Lock()
+_cache = {"latest": None, "events": None, "expires_at": 0.0}
+
+
+def _refresh():
+    rows = db.fetchall(queries.LATEST_EVENTS)
+    names = [row[0] for row in rows]
+    _cache["events"] = names
+    _cache["latest"] = names[0] if names else None
+    _cache["expires_at"] = time.time() + CACHE_TTL
+
+
+def _cached(field):
+    with _lock:
+        if time.time() >= _cache["expires_at"]:
+            try:
+                _refresh()
+            except sqlite3.Error as e:
+                logging.error(f"Error fetching events: {e}")
+                return _cache[field]
+        return _cache[field]
+
+
+def latest_event() -> Optional[str]:
+    """Return the most recently created event, or None if there is none."""
+    return _cached("latest")
+
+
+def list_events() -> List[str]:
+    """Return every event name, newest first."""
+    return list(_cached("events") or [])
+
+
+def invalidate():
+    """Forget the cached events so the next lookup re-reads the table."""
+    with _lock:
+        _cache["expires_at"] = 0.0
+
+
+def create_event(name: str) -> int:
+    """Insert a new event, make it the latest one and return its id."""
+    event_id = db.execute("INSERT INTO Events (name) VALUES (?)", (name,))
+    invalidate()
+    return event_id
+
+
+def current_event() -> Optional[str]:
+    """Return the event the current session is looking at.
+
+    That is the event picked with :func:`select_event`, or the latest event
+    when nothing was picked. Outside a Streamlit session it is always the
+    latest event.
+    """
+    try:
+        import streamlit as st
+        selected = st.session_state.get(SESSION_KEY)
+    except ImportError:
+        selected = None
+    return selected or latest_event()
+
+
+def select_event(name: Optional[str]):
+    """Pin the current session to ``name``; ``None`` follows the latest event."""
+    import streamlit as st
+
+    if name:
+        st.session_state[SESSION_KEY] = name
+    else:
+        st.session_state.pop(SESSION_KEY, None)
@@ -0,0 +1,187 @@
+"""Emission factors for every calculator, in one place.
+
+Factors are grouped in tables (``"fuel"``, ``"electricity"``, ``"food"``, ...)
+mapping an activity type to kg CO₂e per unit of activity. Single entries use
+:func:`emission`; bulk paths hand whole arrays or DataFrame columns to
+:func:`calculate`, which looks every type up and multiplies in one NumPy pass::
+
+    factors.emission("fuel", "Diesel", 10.0)
+    factors.calculate("road", df["type"], df["distance"])
+    factors.calculate_frame(df, "food", key="food_item", quantity=None)
+"""
+from collections import namedtuple
+from typing import Dict, Iterable, Optional
+
+# NumPy and pandas are imported by the vectorized functions only, so
+# single-entry callers (the CLI, batch jobs) start without them.
+
+# 📌 Composite materials: kg CO₂ per kg of each component, and each component's share of the weight
+MATERIAL_COMPONENTS = {
+    "Trophies": {"metal": 2.54, "plastic": 1.32},
+    "Banners": {"banner": 7.342},
+    "Momentoes": {"metal": 4.98, "plastic": 0.425},
+    "Kit": {"recycled_paper": 1.58, "seed_papers": 0.005, "pen": 2.28, "plant": 0},
+}
+MATERIAL_SHARES = {
+    "Trophies": {"metal": 3 / 5, "plastic": 2 / 5},
+    "Momentoes": {"metal": 3 / 5, "plastic": 2 / 5},
+}
+
+# 📌 Freight: kg CO₂ per km per kg, scaled by each mode's efficiency
+FREIGHT_FACTOR = 1.58
+FREIGHT_EFFICIENCY = {"Truck": 1.9, "Rail": 0.6, "Air": 3.0}
+
+# 📌 Factor tables (kg CO₂e per unit of activity)
+FACTORS: Dict[str, Dict[str, float]] = {
+    # Scope 1 fuels, per kWh
+    "fuel": {
+        "Diesel": 0.2496,
+        "Coal": 0.3230,
+        "Petroleum Gas (LPG)": 0.2106,
+        "Electricity": 0.82,
+    },
+    # Electricity use, per kWh
+    "electricity": {
+        "Lighting and other electrical uses": 1.238,
+        "Cooling": 0.709,
+        "Nuclear": 0.012,
+        "Solar": 0.041,
+        "Wind": 0.011,
+        "Hydroelectric": 0.024,
+    },
+    # HVAC refrigerant leaks, per kg leaked
+    "refrigerant": {
+        "R134a": 1300,
+        "R-32": 677,
+        "R-410A": 2088,
+        "R-290": 3,
+        "R-404A": 3922,
+        "R-407C": 1774,
+        "R-407A": 2107,
+        "R-407F": 1824,
+        "R-1234yf": 4,
+        "R-1234ze(E)": 6,
+        "R-600a": 3,
+        "R-744": 1,
+        "R-123": 77,
+        "R-245fa": 1030,
+        "R-600": 3,
+        "R-32/R-125": 677,
+        "R-507A": 3985,
+        "R-508B": 13900,
+        "R-23": 14800,
+        "R-134": 1300,
+        "R-717": 1,
+    },
+    # Event materials, per kg of one item
+    "material": {
+        name: sum(MATERIAL_SHARES.get(name, {}).get(part, 1.0) * ef for part, ef in parts.items())
+        for name, parts in MATERIAL_COMPONENTS.items()
+    },
+    # Individual kit items, per kg
+    "kit_item": dict(MATERIAL_COMPONENTS["Kit"]),
+    # Attendee travel, per km
+    "road": {
+        "Auto CNG": 0.107,
+        "Bike": 0.049,
+        "Car Petrol": 0.187,
+        "Electric bike": 0.031,
+        "Car CNG": 0.68,
+    },
+    "rail": {"Electric": 0.82},
+    "air": {"Flight": 1.58},
+    # Logistics, per km per kg
+    "freight": {mode: FREIGHT_FACTOR * efficiency for mode, efficiency in FREIGHT_EFFICIENCY.items()},
+    # Food, per serving
+    "food": {
+        "Vegetarian Diet": 0.723, "Non-Vegetarian Diet": 1.30, "Vegan Diet": 0.7,
+        "Milk": 0.729, "Eggs": 0.588, "Idli with Sambar": 0.61, "Poha with Vegetables": 0.71,
+        "Paratha with Curd": 0.49, "Upma": 0.28, "Omelette with Toast": 0.419,
+        "Masala Dosa": 0.58, "Puri Bhaji": 1.2, "Aloo Paratha": 0.40,
+        "Medu Vada": 1.5, "Sabudana Khichdi": 1.0, "Dhokla": 0.8,
+        "Chole Bhature": 1.1, "Besan Cheela": 0.7, "Pongal": 0.6,
+        "Kachumber Salad": 0.4, "Sprouted Moong Salad": 0.3,
+        "Cucumber Raita Salad": 0.2, "Tomato Onion Salad": 0.3,
+        "Carrot and Cabbage Salad": 0.25, "Gulab Jamun": 0.725, "Rasgulla": 0.725,
+        "Kheer": 0.348, "Jalebi": 0.07, "Kaju Katli": 0.065, "Barfi": 0.069,
+        "Halwa (Carrot or Bottle Gourd)": 0.11, "Laddu": 0.040, "Single Banana": 0.1,
+    },
+}
+
+# Factor used for types a table does not list
+DEFAULTS = {
+    "road": 0.012,  # any other road vehicle
+    "rail": 2.651,  # diesel traction
+    "air": 1.58,
+}
+
+_Table = namedtuple("_Table", ["index", "values", "default"])
+_compiled: Dict[str, _Table] = {}
+
+
+def register(table: str, entries: Dict[str, float], default: Optional[float] = None):
+    """Add or replace factors in ``table``."""
+    FACTORS.setdefault(table, {}).update(entries)
+    if default is not None:
+        DEFAULTS[table] = default
+    _compiled.pop(table, None)
+
+
+def _table(table: str) -> _Table:
+    import numpy as np
+    import pandas as pd
+
+    compiled = _compiled.get(table)
+    if compiled is None:
+        if table not in FACTORS:
+            raise KeyError(f"Unknown factor table: {table}")
+        entries = FACTORS[table]
+        compiled = _compiled[table] = _Table(
+            pd.Index(list(entries)), np.array(list(entries.values()), dtype=float), DEFAULTS.get(table, 0.0))
+    return compiled
+
+
+def factor(table: str, key: str) -> float:
+    """Return the factor for one activity type (the table default if unknown)."""
+    return float(FACTORS[table].get(key, DEFAULTS.get(table, 0.0)))
+
+
+def factors(table: str, keys: Iterable[str]):
+    """Return the factor for every activity type in ``keys`` as an array."""
+    import numpy as np
+    import pandas as pd
+
+    compiled = _table(table)
+    positions = compiled.index.get_indexer(pd.Index(keys))
+    return np.where(positions >= 0, compiled.values[positions], compiled.default)
+
+
+def calculate(table: str, keys: Iterable[str], quantities=1.0, scale=1.0):
+    """Return ``factor * quantity * scale`` for every row as an array.
+
+    ``quantities`` and ``scale`` may be arrays of the same length as ``keys``
+    or scalars; ``scale`` carries a second multiplier such as freight weight.
+    """
+    import numpy as np
+
+    return factors(table, keys) * np.asarray(quantities, dtype=float) * np.asarray(scale, dtype=float)
+
+
+def calculate_frame(df, table: str, key: str = "activity", quantity: Optional[str] = "quantity",
+                    scale: Optional[str] = None, out: str = "emission"):
+    """Return a copy of the DataFrame ``df`` with an ``out`` column of emissions.
+
+    ``quantity`` and ``scale`` name columns of ``df``; ``None`` means 1.
+    """
+    result = df.copy()
+    result[out] = calculate(
+        table, df[key],
+        1.0 if quantity is None else df[quantity].to_numpy(dtype=float),
+        1.0 if scale is None else df[scale].to_numpy(dtype=float),
+    )
+    return result
+
+
+def emission(table: str, key: str, quantity: float = 1.0, scale: float = 1.0) -> float:
+    """Return the emission of a single entry."""
+    return factor(table, key) * quantity * scale
@@ -0,0 +1,170 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+import db
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+DEFAULT_TTL_SECONDS = float(os.environ.get("GEOCACHE_TTL_DAYS", "30")) * 86400
+DEFAULT_CAPACITY = int(os.environ.get("GEOCACHE_CAPACITY", "2048"))
+
+def normalize_key(*parts) -> str:
+    """Build a cache key that ignores case, spacing and coordinate noise."""
+    def norm(part):
+        if isinstance(part, str):
+            return " ".join(part.casefold().split())
+        if isinstance(part, float):
+            return round(part, 4)  # ~11 m, well below geocoding precision
+        if isinstance(part, (tuple, list)):
+            return [norm(p) for p in part]
+        return part
+    return json.dumps([norm(p) for p in parts], ensure_ascii=False)
+
+
+class GeoCache:
+    """Two-level cache for geocoding and distance lookups.
+
+    An in-process LRU sits in front of the ``GeoCache`` table in the emissions
+    database, so repeated lookups within a worker cost a dict probe and
+    lookups already made by any worker cost one indexed read. Entries expire
+    after ``ttl`` seconds. Failed lookups (``None``) are never cached.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL_SECONDS, capacity: int = DEFAULT_CAPACITY):
+        self.ttl = ttl
+        self.capacity = capacity
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _remember(self, key, value, expires_at):
+        with self._lock:
+            self._memory[key] = (value, expires_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.capacity:
+                self._memory.popitem(last=False)
+
+    def get(self, kind: str, *query) -> Optional[Any]:
+        """Return the cached answer for ``query`` or None."""
+        key = (kind, normalize_key(*query))
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                del self._memory[key]
+
+        try:
+            row = db.fetchone(
+                "SELECT value, expires_at FROM GeoCache WHERE kind = ? AND query = ? AND expires_at > ?",
+                (key[0], key[1], now),
+            )
+        except sqlite3.Error as e:
+            logging.warning(f"GeoCache read failed: {e}")
+            row = None
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        value = json.loads(row[0])
+        self._remember(key, value, row[1])
+        with self._lock:
+            self.disk_hits += 1
+        return value
+
+    def set(self, kind: str, *query, value: Any, ttl: Optional[float] = None):
+        """Store an answer in memory and on disk."""
+        if value is None:
+            return
+        key = (kind, normalize_key(*query))
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        self._remember(key, value, expires_at)
+        try:
+            db.execute(
+                "INSERT OR REPLACE INTO GeoCache (kind, query, value, expires_at) VALUES (?, ?, ?, ?)",
+                (key[0], key[1], json.dumps(value, default=float), expires_at),
+            )
+        except sqlite3.Error as e:
+            logging.warning(f"GeoCache write failed: {e}")
+
+    def cached(self, kind: str, fn: Callable, *args):
+        """Return ``fn(*args)``, served from the cache when possible."""
+        value = self.get(kind, *args)
+        if value is None:
+            value = fn(*args)
+            self.set(kind, *args, value=value)
+        return value
+
+    def purge_expired(self) -> int:
+        """Delete stale rows from disk and return how many were removed."""
+        with db.transaction() as conn:
+            return conn.execute("DELETE FROM GeoCache WHERE expires_at <= ?", (time.time(),)).rowcount
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits, disk_hits, misses, entries = self.hits, self.disk_hits, self.misses, len(self._memory)
+        lookups = hits + disk_hits + misses
+        return {
+            "memory_hits": hits,
+            "disk_hits": disk_hits,
+            "misses": misses,
+            "hit_rate": (hits + disk_hits) / lookups if lookups else 0.0,
+            "memory_entries": entries,
+        }
+
+    def warm(self, geocode: Optional[Callable] = None, kind: str = "google:geocode") -> int:
+        """Pre-populate the cache from submissions already in the database.
+
+        Logistics rows carry a resolved road/air distance per origin and
+        destination, so those are stored as-is. If ``geocode`` is given, every
+        distinct place name from ``transport_data`` and ``logistics_emissions``
+        is resolved once and stored under ``kind``.
+        """
+        warmed = 0
+        rows = db.fetchall(
+            "SELECT transport_mode, origin, destination, MAX(distance_km) FROM logistics_emissions "
+            "GROUP BY transport_mode, origin, destination"
+        )
+        for mode, origin, destination, distance in rows:
+            if distance:
+                distance_kind = "air_distance" if mode == "Air" else "road_distance"
+                if self.get(distance_kind, origin, destination) is None:
+                    self.set(distance_kind, origin, destination, value=distance)
+                    warmed += 1
+
+        if geocode is not None:
+            places = db.fetchall(
+                "SELECT origin FROM transport_data UNION SELECT destination FROM transport_data "
+                "UNION SELECT origin FROM logistics_emissions UNION SELECT destination FROM logistics_emissions"
+            )
+            for (place,) in places:
+                if place and place.strip() and self.get(kind, place) is None:
+                    if self.cached(kind, geocode, place) is not None:
+                        warmed += 1
+        logging.info(f"GeoCache warmed with {warmed} entries")
+        return warmed
+
+
+# Shared per-process cache
+geo_cache = GeoCache()
+
+
+if __name__ == "__main__":
+    import migrations
+    migrations.migrate()
+    geo_cache.warm()
+    print(f"Purged {geo_cache.purge_expired()} expired entries")
+    print(geo_cache.stats())
@@ -0,0 +1,445 @@
+"""Bulk import of activity data from CSV or Excel files.
+
+Files are read in fixed-size chunks, so memory use does not grow with the
+file. Each chunk goes through the same steps: its columns are mapped to a
+target table, rows are validated, emissions are computed with
+``factors.calculate``, and the valid rows are written in one transaction::
+
+    python importer.py fuel_log.csv --table Scope1 --event "Annual Meet"
+    python importer.py bills.xlsx --table ElectricityEmissions --map kwh=value
+    python importer.py manifest.csv --table logistics_emissions --errors rejected.csv
+"""
+import os
+import re
+import sys
+import csv
+import json
+import time
+import logging
+import sqlite3
+import argparse
+from typing import Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+import db
+import factors
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+CHUNK_SIZE = int(os.environ.get("IMPORT_CHUNK_SIZE", "10000"))
+MAX_ERROR_SAMPLES = 50  # rejected rows kept in memory for display; the rest go to the errors file
+
+# 📌 Import targets
+# columns:  field -> accepted header names (compared after lower-casing and
+#           turning spaces and dashes into underscores)
+# required: fields every row must have; event may come from the caller instead
+# numeric:  fields that must parse as non-negative numbers
+# factor:   (factor table, key field, quantity field, scale field or None)
+# strict:   reject rows whose key has no factor instead of using the table default
+TARGETS = {
+    "Scope1": {
+        "columns": {
+            "event": ["event", "event_name"],
+            "fuel": ["fuel", "fuel_type", "fuels"],
+            "consumption": ["consumption", "consumption_kwh", "kwh", "quantity"],
+            "timestamp": ["timestamp", "date", "datetime"],
+        },
+        "required": ["fuel", "consumption"],
+        "numeric": ["consumption"],
+        "factor": ("fuel", "fuel", "consumption", None),
+        "strict": True,
+    },
+    "ElectricityEmissions": {
+        "columns": {
+            "event": ["event", "event_name"],
+            "usage": ["usage", "category", "energy_use"],
+            "value": ["value", "kwh", "consumption", "units"],
+            "timestamp": ["timestamp", "date", "bill_date"],
+        },
+        "required": ["usage", "value"],
+        "numeric": ["value"],
+        "factor": ("electricity", "usage", "value", None),
+        "strict": True,
+    },
+    "HVACEmissions": {
+        "columns": {
+            "event": ["event", "event_name"],
+            "refrigerant": ["refrigerant", "gas"],
+            "mass_leak": ["mass_leak", "massleak", "leak_kg", "mass"],
+            "timestamp": ["timestamp", "date"],
+        },
+        "required": ["refrigerant", "mass_leak"],
+        "numeric": ["mass_leak"],
+        "factor": ("refrigerant", "refrigerant", "mass_leak", None),
+        "strict": True,
+    },
+    "logistics_emissions": {
+        "columns": {
+            "event": ["event", "event_name"],
+            "material": ["material", "materials", "item"],
+            "transport_mode": ["transport_mode", "mode"],
+            "origin": ["origin", "from", "source"],
+            "destination": ["destination", "to"],
+            "distance_km": ["distance_km", "distance"],
+            "weight_kg": ["weight_kg", "weight"],
+            "timestamp": ["timestamp", "created_at", "date"],
+        },
+        "required": ["material", "transport_mode", "origin", "destination", "distance_km", "weight_kg"],
+        "numeric": ["distance_km", "weight_kg"],
+        "factor": ("freight", "transport_mode", "distance_km", "weight_kg"),
+        "strict": True,
+    },
+    "Materials": {
+        "columns": {
+            "event": ["event", "event_name"],
+            "category": ["category", "material"],
+            "weight": ["weight", "weight_kg"],
+            "quantity": ["quantity", "qty", "count"],
+            "timestamp": ["timestamp", "date"],
+        },
+        "required": ["category", "weight", "quantity"],
+        "numeric": ["weight", "quantity"],
+        "factor": ("material", "category", "weight", "quantity"),
+        "strict": True,
+    },
+    "transport_data": {
+        "columns": {
+            "event": ["event", "event_name"],
+            "mode": ["mode"],
+            "type": ["type", "vehicle", "vehicle_type"],
+            "origin": ["origin", "from"],
+            "destination": ["destination", "to"],
+            "distance": ["distance", "distance_km"],
+        },
+        "required": ["mode", "distance"],
+        "numeric": ["distance"],
+        "factor": None,  # per mode, see _transport_emission
+        "strict": False,
+    },
+}
+
+# Travel modes and the factor table each one uses
+TRAVEL_MODES = {"Road": "road", "Rail": "rail", "Air": "air"}
+
+INSERTS = {
+    "Scope1": "INSERT INTO Scope1 (event, fuels, consumptions, emissions, total_emission, Timestamp) "
+              "VALUES (?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))",
+    "ElectricityEmissions": "INSERT INTO ElectricityEmissions (event, Usage, Value, Emission, Timestamp) "
+                            "VALUES (?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))",
+    "HVACEmissions": "INSERT INTO HVACEmissions (event, Refrigerant, MassLeak, Emission, Timestamp) "
+                     "VALUES (?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))",
+    "logistics_emissions": "INSERT INTO logistics_emissions (Event, material, transport_mode, origin, destination, "
+                           "distance_km, weight_kg, total_emission, created_at) "
+                           "VALUES (?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))",
+    "Materials": "INSERT INTO Materials (event, Category, Weight, Quantity, Emission, Timestamp) "
+                 "VALUES (?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))",
+    "transport_data": "INSERT INTO transport_data (event, mode, type, origin, destination, distance, Emission) "
+                      "VALUES (?, ?, ?, ?, ?, ?, ?)",
+}
+
+
+class ImportFailed(ValueError):
+    """Raised when a file cannot be imported at all (as opposed to bad rows)."""
+
+
+def normalize_header(name) -> str:
+    return re.sub(r"[\s\-]+", "_", str(name).strip().lower())
+
+
+def column_mapping(headers: List[str], table: str, overrides: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Map file headers to the target's fields; returns ``{header: field}``."""
+    spec = TARGETS[table]
+    overrides = {normalize_header(k): v for k, v in (overrides or {}).items()}
+    mapping = {}
+    for header in headers:
+        key = normalize_header(header)
+        if key in overrides:
+            field = overrides[key]
+        else:
+            field = next((f for f, aliases in spec["columns"].items() if key in aliases), None)
+        if field in spec["columns"] and field not in mapping.values():
+            mapping[header] = field
+    return mapping
+
+
+# 📌 Readers
+def _read_csv(source, chunksize) -> Iterator[pd.DataFrame]:
+    yield from pd.read_csv(source, chunksize=chunksize, dtype=str, keep_default_na=False, skipinitialspace=True)
+
+
+def _read_excel(source, chunksize, sheet=None) -> Iterator[pd.DataFrame]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportFailed("Reading Excel files needs openpyxl (pip install openpyxl)")
+    # read_only streams rows from the archive instead of loading the sheet
+    workbook = load_workbook(source, read_only=True, data_only=True)
+    try:
+        rows = (workbook[sheet] if sheet else workbook.active).iter_rows(values_only=True)
+        headers = [str(h) if h is not None else "" for h in next(rows, [])]
+        batch = []
+        for row in rows:
+            batch.append(["" if v is None else str(v) for v in row])
+            if len(batch) >= chunksize:
+                yield pd.DataFrame(batch, columns=headers)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=headers)
+    finally:
+        workbook.close()
+
+
+def read_chunks(source, chunksize: int = CHUNK_SIZE, file_format: Optional[str] = None,
+                sheet: Optional[str] = None) -> Iterator[pd.DataFrame]:
+    """Yield the file as string DataFrames of at most ``chunksize`` rows."""
+    name = source if isinstance(source, str) else getattr(source, "name", "")
+    file_format = file_format or os.path.splitext(str(name))[1].lstrip(".").lower() or "csv"
+    if file_format in ("xlsx", "xlsm"):
+        return _read_excel(source, chunksize, sheet)
+    if file_format in ("csv", "txt"):
+        return _read_csv(source, chunksize)
+    raise ImportFailed(f"Unsupported file type: {file_format}")
+
+
+# 📌 Validation and emissions
+def _transport_emission(df: pd.DataFrame) -> np.ndarray:
+    emission = np.zeros(len(df))
+    for mode, table in TRAVEL_MODES.items():
+        mask = (df["mode"] == mode).to_numpy()
+        if mask.any():
+            emission[mask] = factors.calculate(table, df.loc[mask, "type"], df.loc[mask, "distance"].to_numpy())
+    return emission
+
+
+def prepare(chunk: pd.DataFrame, table: str, mapping: Dict[str, str], event: Optional[str] = None):
+    """Validate a mapped chunk and compute its emissions.
+
+    Returns ``(valid rows with an emission column, rejected rows with a reason column)``.
+    """
+    spec = TARGETS[table]
+    df = chunk[list(mapping)].rename(columns=mapping)
+    for field in spec["columns"]:
+        if field not in df:
+            df[field] = ""
+    text_fields = [f for f in spec["columns"] if f not in spec["numeric"]]
+    df[text_fields] = df[text_fields].apply(lambda col: col.astype(str).str.strip())
+    if event:
+        df["event"] = df["event"].mask(df["event"] == "", event)
+
+    reason = pd.Series("", index=df.index)
+    for field in ["event"] + spec["required"]:
+        if field not in spec["numeric"]:
+            reason = reason.mask((reason == "") & (df[field] == ""), f"missing {field}")
+    for field in spec["numeric"]:
+        raw = df[field]
+        df[field] = pd.to_numeric(raw, errors="coerce")
+        # NaN, inf and -inf all fail the finiteness check
+        reason = reason.mask((reason == "") & ~np.isfinite(df[field].astype(float)), f"invalid {field}")
+        reason = reason.mask((reason == "") & (df[field] < 0), f"negative {field}")
+
+    if "timestamp" in spec["columns"]:
+        # Stored in the schema's 'YYYY-MM-DD HH:MM:SS' UTC form so the monthly
+        # rollup can bucket every row. ISO dates are read as such; only the rest
+        # are read day-first, for dates like 15/03/2025
+        raw = df["timestamp"]
+        parsed = pd.to_datetime(raw.mask(raw == ""), errors="coerce", format="ISO8601", utc=True)
+        retry = (raw != "") & parsed.isna()
+        if retry.any():
+            parsed[retry] = pd.to_datetime(raw[retry], errors="coerce", format="mixed", dayfirst=True, utc=True)
+        reason = reason.mask((reason == "") & (raw != "") & parsed.isna(), "invalid timestamp")
+        df["timestamp"] = parsed.dt.strftime("%Y-%m-%d %H:%M:%S").where(parsed.notna(), "")
+
+    if spec["factor"]:
+        factor_table, key, quantity, scale = spec["factor"]
+        if spec["strict"]:
+            known = df[key].isin(factors.FACTORS[factor_table].keys())
+            reason = reason.mask((reason == "") & ~known, f"unknown {key}")
+    else:
+        reason = reason.mask((reason == "") & ~df["mode"].isin(TRAVEL_MODES.keys()), "unknown mode")
+
+    ok = (reason == "").to_numpy()
+    valid = df[ok].copy()
+    if spec["factor"]:
+        valid["emission"] = factors.calculate(
+            factor_table, valid[key], valid[quantity].to_numpy(),
+            1.0 if scale is None else valid[scale].to_numpy())
+    else:
+        valid["emission"] = _transport_emission(valid)
+
+    rejected = chunk[~ok].copy()
+    rejected["reason"] = reason[~ok].to_numpy()
+    return valid, rejected
+
+
+def _timestamps(df):
+    return [t or None for t in df["timestamp"]]
+
+
+def rows_for(table: str, df: pd.DataFrame) -> List[tuple]:
+    """Build insert parameters for validated rows."""
+    if table == "Scope1":
+        return list(zip(
+            df["event"], ("[%s]" % json.dumps(f) for f in df["fuel"]),
+            ("[%r]" % float(c) for c in df["consumption"]), ("[%r]" % float(e) for e in df["emission"]),
+            df["emission"].astype(float), _timestamps(df)))
+    if table == "ElectricityEmissions":
+        return list(zip(df["event"], df["usage"], df["value"].astype(float), df["emission"].astype(float), _timestamps(df)))
+    if table == "HVACEmissions":
+        return list(zip(df["event"], df["refrigerant"], df["mass_leak"].astype(float), df["emission"].astype(float),
+                        _timestamps(df)))
+    if table == "logistics_emissions":
+        return list(zip(df["event"], df["material"], df["transport_mode"], df["origin"], df["destination"],
+                        df["distance_km"].astype(float), df["weight_kg"].astype(float),
+                        df["emission"].round(2).astype(float), _timestamps(df)))
+    if table == "Materials":
+        return list(zip(df["event"], df["category"], df["weight"].astype(float), df["quantity"].astype(float),
+                        df["emission"].astype(float), _timestamps(df)))
+    if table == "transport_data":
+        return list(zip(df["event"], df["mode"], df["type"], df["origin"], df["destination"],
+                        df["distance"].astype(float), df["emission"].astype(float)))
+    raise ImportFailed(f"Unknown import target: {table}")
+
+
+def write(table: str, df: pd.DataFrame) -> int:
+    """Insert validated rows, and any events they name, in one transaction."""
+    rows = rows_for(table, df)
+    if not rows:
+        return 0
+    with db.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO Events (name) SELECT ? WHERE NOT EXISTS (SELECT 1 FROM Events WHERE name = ?)",
+            [(name, name) for name in df["event"].unique()])
+        conn.executemany(INSERTS[table], rows)
+    return len(rows)
+
+
+# 📌 Pipeline
+def import_file(source, table: str, event: Optional[str] = None, mapping: Optional[Dict[str, str]] = None,
+                chunksize: int = CHUNK_SIZE, progress: Optional[Callable[[dict], None]] = None,
+                errors_path: Optional[str] = None, file_format: Optional[str] = None,
+                sheet: Optional[str] = None) -> dict:
+    """Import ``source`` (a path or file object) into ``table``.
+
+    ``event`` fills rows without an event column or value. ``progress`` is
+    called with the running totals after every chunk. Rejected rows are
+    written to ``errors_path`` with a ``reason`` column when it is given.
+    """
+    if table not in TARGETS:
+        raise ImportFailed(f"Unknown import target: {table}")
+    spec = TARGETS[table]
+
+    size = None
+    if isinstance(source, str):
+        size = os.path.getsize(source)
+    elif getattr(source, "size", None):
+        size = source.size
+    handle = open(source, "rb") if isinstance(source, str) else source
+
+    stats = {"table": table, "rows": 0, "imported": 0, "rejected": 0, "fraction": 0.0, "errors": [], "seconds": 0.0}
+    started = time.perf_counter()
+    errors_file = writer = None
+    header_map = None
+    try:
+        for chunk in read_chunks(handle, chunksize, file_format, sheet):
+            if header_map is None:
+                header_map = column_mapping(list(chunk.columns), table, mapping)
+                missing = [f for f in spec["required"] if f not in header_map.values()]
+                if "event" not in header_map.values() and not event:
+                    missing.append("event")
+                if missing:
+                    raise ImportFailed(
+                        f"{table} needs columns for: {', '.join(missing)}. Found: {', '.join(map(str, chunk.columns))}")
+
+            valid, rejected = prepare(chunk, table, header_map, event)
+            try:
+                stats["imported"] += write(table, valid)
+            except sqlite3.Error as e:
+                # The chunk's transaction was rolled back; report its rows and go on
+                logging.error(f"Could not write a chunk of {len(valid)} rows to {table}: {e}")
+                failed = chunk.loc[valid.index].copy()
+                failed["reason"] = f"database error: {e}"
+                rejected = pd.concat([rejected, failed])
+            stats["rows"] += len(chunk)
+            stats["rejected"] += len(rejected)
+
+            if len(rejected):
+                room = MAX_ERROR_SAMPLES - len(stats["errors"])
+                if room > 0:
+                    stats["errors"] += rejected.head(room).to_dict("records")
+                if errors_path:
+                    if writer is None:
+                        errors_file = open(errors_path, "w", newline="", encoding="utf-8")
+                        writer = csv.writer(errors_file)
+                        writer.writerow(list(rejected.columns))
+                    writer.writerows(rejected.itertuples(index=False, name=None))
+
+            if size:
+                try:
+                    stats["fraction"] = min(handle.tell() / size, 1.0)
+                except (OSError, ValueError):
+                    pass
+            stats["seconds"] = time.perf_counter() - started
+            if progress:
+                progress(dict(stats))
+    finally:
+        if errors_file:
+            errors_file.close()
+        if isinstance(source, str):
+            handle.close()
+
+    stats["fraction"] = 1.0
+    stats["seconds"] = time.perf_counter() - started
+    logging.info(f"Imported {stats['imported']} of {stats['rows']} rows into {table} "
+                 f"({stats['rejected']} rejected) in {stats['seconds']:.1f}s")
+    try:
+        from events import invalidate
+        invalidate()  # imported rows may name new events
+    except ImportError:
+        pass
+    return stats
+
+
+def expected_columns(table: str) -> Dict[str, List[str]]:
+    """Return each field of ``table`` with the headers accepted for it."""
+    return dict(TARGETS[table]["columns"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file", help="CSV or Excel file to import")
+    parser.add_argument("--table", required=True, choices=sorted(TARGETS), help="target table")
+    parser.add_argument("--event", help="event for rows without one")
+    parser.add_argument("--map", action="append", default=[], metavar="HEADER=FIELD",
+                        help="map a file header to a field (repeatable)")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_SIZE, help="rows per chunk and transaction")
+    parser.add_argument("--sheet", help="Excel sheet to read (defaults to the active sheet)")
+    parser.add_argument("--errors", help="write rejected rows to this CSV")
+    args = parser.parse_args(argv)
+
+    mapping = dict(item.split("=", 1) for item in args.map)
+
+    def report(stats):
+        print(f"\r{stats['fraction']:6.1%}  {stats['rows']:>10} rows  {stats['imported']:>10} imported  "
+              f"{stats['rejected']:>8} rejected", end="", file=sys.stderr)
+
+    import migrations
+    migrations.migrate()
+    try:
+        stats = import_file(args.file, args.table, args.event, mapping, args.chunksize, report,
+                            args.errors, sheet=args.sheet)
+    except ImportFailed as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    print(file=sys.stderr)
+    for error in stats["errors"][:10]:
+        print(f"rejected: {error}", file=sys.stderr)
+    print(f"{stats['imported']} rows imported into {args.table}, {stats['rejected']} rejected, "
+          f"{stats['seconds']:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""Numbered schema migrations for the emissions database.
+
+Each file in ``data/migrations`` named ``NNNN_description.sql`` is one
+migration. They are applied in order, each in its own transaction, and
+recorded in ``schema_version`` with a checksum of the file. ``PRAGMA
+user_version`` mirrors the newest applied version, so a database that is
+already current costs a pragma read and a checksum lookup, and no DDL::
+
+    python migrations.py              # migrate data/emissions.db
+    python migrations.py --status     # list applied and pending migrations
+
+Never edit a migration once it has shipped; add a new one instead. An edited
+file no longer matches its recorded checksum and migrate() refuses to run.
+"""
+import os
+import re
+import sys
+import time
+import hashlib
+import sqlite3
+import logging
+import argparse
+import threading
+from collections import namedtuple
+from typing import List, Optional
+
+import db
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+MIGRATIONS_DIR = os.path.join(BASE_DIR, "..", "data", "migrations")
+
+FILENAME = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_version (
+    version INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    checksum TEXT NOT NULL,
+    applied_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    duration_ms REAL
+)
+"""
+
+Migration = namedtuple("Migration", ["version", "name", "sql", "checksum"])
+
+
+class MigrationError(Exception):
+    """Raised when the migrations on disk and in the database disagree."""
+
+
+_lock = threading.Lock()
+_loaded = {}      # directory -> list of migrations
+_current = set()  # databases this process has already brought up to date
+
+
+def checksum(sql: str) -> str:
+    """Hash a migration, ignoring line endings and surrounding whitespace."""
+    text = sql.replace("\r\n", "\n").strip()
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def load_migrations(directory: str = MIGRATIONS_DIR) -> List[Migration]:
+    """Read every migration file in ``directory``, ordered by version."""
+    directory = os.path.abspath(directory)
+    if directory in _loaded:
+        return _loaded[directory]
+
+    migrations = {}
+    for filename in sorted(os.listdir(directory)):
+        match = FILENAME.match(filename)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise MigrationError(f"Duplicate migration version {version}: {filename}")
+        with open(os.path.join(directory, filename), encoding="utf-8") as f:
+            sql = f.read()
+        migrations[version] = Migration(version, match.group(2), sql, checksum(sql))
+
+    ordered = [migrations[v] for v in sorted(migrations)]
+    _loaded[directory] = ordered
+    return ordered
+
+
+def split_statements(sql: str) -> List[str]:
+    """Split a script into statements, keeping trigger bodies intact."""
+    statements, buffer = [], ""
+    for piece in sql.split(";"):
+        buffer += piece + ";"
+        if sqlite3.complete_statement(buffer):
+            statements.append(buffer.strip())
+            buffer = ""
+    if buffer.strip(" \t\r\n;"):
+        raise MigrationError(f"Incomplete statement at end of migration: {buffer.strip()[:80]}")
+    return statements
+
+
+def user_version(conn) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def applied(conn) -> dict:
+    """Return ``{version: checksum}`` for every migration recorded in ``conn``."""
+    try:
+        return dict(conn.execute("SELECT version, checksum FROM schema_version"))
+    except sqlite3.OperationalError:  # nothing applied yet
+        return {}
+
+
+def verify(conn, migrations: List[Migration]):
+    """Raise MigrationError if an applied migration was changed on disk."""
+    recorded = applied(conn)
+    changed = [m.version for m in migrations if m.version in recorded and recorded[m.version] != m.checksum]
+    if changed:
+        raise MigrationError(
+            f"Applied migrations were modified: {', '.join(map(str, changed))}. "
+            "Restore them and add a new migration instead."
+        )
+
+
+def apply(conn, migration: Migration) -> bool:
+    """Apply one migration in its own transaction.
+
+    Returns False if another process applied it while we waited for the
+    write lock.
+    """
+    started = time.perf_counter()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if user_version(conn) >= migration.version:
+            conn.rollback()
+            return False
+        for statement in split_statements(migration.sql):
+            conn.execute(statement)
+        conn.execute(
+            "INSERT OR REPLACE INTO schema_version (version, name, checksum, duration_ms) VALUES (?, ?, ?, ?)",
+            (migration.version, migration.name, migration.checksum, (time.perf_counter() - started) * 1000),
+        )
+        conn.execute(f"PRAGMA user_version = {migration.version:d}")
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+    logging.info(f"Applied migration {migration.version:04d}_{migration.name}")
+    return True
+
+
+def migrate(conn: Optional[sqlite3.Connection] = None, directory: str = MIGRATIONS_DIR) -> int:
+    """Bring the database up to the newest migration and return its version.
+
+    ``conn`` defaults to a pooled connection to the emissions database.
+    """
+    migrations = load_migrations(directory)
+    head = migrations[-1].version if migrations else 0
+
+    if conn is None:
+        if db.DB_PATH in _current:
+            return head
+        with _lock, db.connection() as pooled:
+            version = migrate(pooled, directory)
+            _current.add(db.DB_PATH)
+            return version
+
+    verify(conn, migrations)
+    current = user_version(conn)
+    if current > head:
+        logging.warning(f"Database schema version {current} is newer than the code ({head})")
+        return current
+    if current == head:
+        return head
+
+    conn.execute(VERSION_TABLE)
+    for migration in migrations:
+        if migration.version > current:
+            apply(conn, migration)
+    return head
+
+
+def status(conn, directory: str = MIGRATIONS_DIR) -> List[tuple]:
+    """Return ``(version, name, state)`` for every migration on disk."""
+    recorded = applied(conn)
+    rows = []
+    for migration in load_migrations(directory):
+        if migration.version not in recorded:
+            state = "pending"
+        elif recorded[migration.version] != migration.checksum:
+            state = "modified"
+        else:
+            state = "applied"
+        rows.append((migration.version, migration.name, state))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", default=db.DB_PATH, help="database to migrate")
+    parser.add_argument("--status", action="store_true", help="list migrations without applying them")
+    args = parser.parse_args(argv)
+
+    conn = sqlite3.connect(args.db, isolation_level=None)
+    try:
+        if not args.status:
+            migrate(conn)
+        for version, name, state in status(conn):
+            print(f"{version:04d}  {name:30} {state}")
+    except MigrationError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
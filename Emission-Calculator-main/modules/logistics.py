@@ -2,100 +2,49 @@ import sqlite3
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-from geopy.geocoders import Nominatim
-from geopy.distance import geodesic
-from streamlit_autorefresh import st_autorefresh
 import logging
-import os
-import requests
-
-GOOGLE_MAPS_API_KEY = st.secrets["google"]["maps_api_key"]
+from core import LookupFailed
+from core.logistics import TRANSPORT_MODES, air_distance, freight_emission, road_distance, save_logistics
+from events import current_event
+
+try:
+    GOOGLE_MAPS_API_KEY = st.secrets["google"]["maps_api_key"]
+except (FileNotFoundError, KeyError):
+    GOOGLE_MAPS_API_KEY = None  # road distances unavailable; the rest of the module still works
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR,"..", "..", "data", "emissions.db")
-
-
-def fetch_latest_event():
-    """Fetch the latest event name from the database."""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("SELECT name FROM Events ORDER BY id DESC LIMIT 1")
-    event = c.fetchone()
-    conn.close()
-    return event[0] if event else "No events found"
-
-Event = fetch_latest_event()
-
 
 def store_logistics_data(Event, material, transport_mode, origin, destination, distance, weight, total_emission):
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO logistics_emissions 
-            (Event, material, transport_mode, origin, destination, distance_km, weight_kg, total_emission) 
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (Event, material, transport_mode, origin, destination, distance, weight, total_emission))
-        
-        conn.commit()
-        conn.close()
+        save_logistics(Event, material, transport_mode, origin, destination, distance, weight, total_emission)
         st.success("✅ Data inserted successfully!")
     except sqlite3.Error as e:
         st.warning(f"❌ Database error: {e}")
 
 def get_distance_google_maps(origin, destination):
+    """Road distance in km, served from the geocode cache when known."""
     try:
-        url = f"https://maps.googleapis.com/maps/api/distancematrix/json?units=metric&origins={origin}&destinations={destination}&key={GOOGLE_MAPS_API_KEY}"
-        response = requests.get(url)
-        data = response.json()
-
-        if data["status"] == "OK":
-            distance_text = data["rows"][0]["elements"][0]["distance"]["text"]
-            distance_km = float(distance_text.replace(" km", "").replace(",", ""))
-            return round(distance_km, 2)
-        else:
-            st.error("Google Maps API error: " + data.get("error_message", "Unknown error"))
-            return None
-    except Exception as e:
-        st.error(f"Error fetching distance: {e}")
+        return road_distance(origin, destination, GOOGLE_MAPS_API_KEY)
+    except LookupFailed as e:
+        st.error(str(e))
         return None
 
 def calculate_air_distance(origin, destination):
-    geolocator = Nominatim(user_agent="logistics_app")
+    """Great-circle distance in km, served from the geocode cache when known."""
     try:
-        origin_loc = geolocator.geocode(origin)
-        destination_loc = geolocator.geocode(destination)
-        if origin_loc and destination_loc:
-            origin_coords = (origin_loc.latitude, origin_loc.longitude)
-            destination_coords = (destination_loc.latitude, destination_loc.longitude)
-            return round(geodesic(origin_coords, destination_coords).km, 2)
-        else:
-            return None
-    except Exception as e:
-        st.error(f"Error getting coordinates: {e}")
+        return air_distance(origin, destination)
+    except LookupFailed as e:
+        st.error(str(e))
         return None
 
 
 
-# Constants
-EMISSION_FACTOR = 1.58  # Emission factor per km per kg
-
-# Transport modes and efficiency
-TRANSPORT_MODES = {
-    "Truck": {"profile": "driving-car", "efficiency": 1.9},
-    "Rail": {"profile": "driving-hgv", "efficiency": 0.6},  # Heavy Goods Vehicle as a proxy
-    "Air": {"profile": None, "efficiency": 3.0}  # Geodesic Distance for Air
-}
-
-
-
 # Streamlit UI
 def logist_calculator():
     """Display the logistics emission calculator."""
     st.title("📦 Logistics Emission Calculator")
+    Event = current_event()
     st.write("Event: ", Event)
     st.subheader("computeing CO₂ emissions for logistics transportation")
 
@@ -116,8 +65,7 @@ def logist_calculator():
 
     # Compute Emission
     if distance:
-        efficiency_factor = TRANSPORT_MODES[transport_mode]["efficiency"]
-        total_emission = round(distance * weight * EMISSION_FACTOR * efficiency_factor, 2)
+        total_emission = freight_emission(transport_mode, distance, weight)
         
 
         # Display Metrics
@@ -1,71 +1,29 @@
-import os
 import streamlit as st
 import sqlite3
 import logging
-from typing import Dict, Optional
-
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR,"..", "..", "data", "emissions.db")
+from core.material import (
+    calculate_banner_emission,
+    calculate_kit_emission,
+    calculate_kit_item_emission,
+    calculate_momento_emission,
+    calculate_trophy_emission,
+    save_material,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
-# 🏆 Emission Factors (kg CO₂ per kg)
-EMISSION_FACTORS = {
-    "Trophies": {"metal": 2.54, "plastic": 1.32},
-    "Banners": {"banner": 7.342},
-    "Momentoes": {"metal": 4.98, "plastic": 0.425},
-    "Kit": {"recycled_paper": 1.58, "seed_papers": 0.005, "pen": 2.28, "plant": 0},
-}
-
 # 📌 Insert Data into DB
 def insert_material_data(event: str, category: str, weight: float, quantity: int, emission: float):
     """Insert material emission data into the database."""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            c = conn.cursor()
-            c.execute(
-                "INSERT INTO Materials (event, Category, Weight, Quantity, Emission) VALUES (?, ?, ?, ?, ?)",
-                (event, category, weight, quantity, emission),
-            )
-            conn.commit()
-            st.success("Material emission data saved successfully!")
-            logging.info(f"Inserted material data for {category} ({event})")
+        save_material(event, category, weight, quantity, emission)
+        st.success("Material emission data saved successfully!")
+        logging.info(f"Inserted material data for {category} ({event})")
     except sqlite3.Error as e:
         st.error(f"Database error: {e}")
         logging.error(f"Failed to insert material data: {e}")
 
-# 🧮 Calculate Emission for Trophies
-def calculate_trophy_emission(weight: float, quantity: int) -> float:
-    """Calculate emissions for trophies."""
-    metal_emission = (3 / 5) * weight * EMISSION_FACTORS["Trophies"]["metal"]
-    plastic_emission = (2 / 5) * weight * EMISSION_FACTORS["Trophies"]["plastic"]
-    return (metal_emission + plastic_emission) * quantity
-
-# 🧮 Calculate Emission for Banners
-def calculate_banner_emission(weight: float, quantity: int) -> float:
-    """Calculate emissions for banners."""
-    return weight * EMISSION_FACTORS["Banners"]["banner"] * quantity
-
-# 🧮 Calculate Emission for Momentoes
-def calculate_momento_emission(weight: float, quantity: int) -> float:
-    """Calculate emissions for momentoes."""
-    metal_emission = (3 / 5) * weight * EMISSION_FACTORS["Momentoes"]["metal"]
-    plastic_emission = (2 / 5) * weight * EMISSION_FACTORS["Momentoes"]["plastic"]
-    return (metal_emission + plastic_emission) * quantity
-
-# 🧮 Calculate Emission for Kit
-def calculate_kit_emission(weight: float, quantity: int) -> float:
-    """Calculate emissions for kits."""
-    return (EMISSION_FACTORS["Kit"]["recycled_paper"] + EMISSION_FACTORS["Kit"]["seed_papers"] + EMISSION_FACTORS["Kit"]["pen"] + EMISSION_FACTORS["Kit"]["plant"]) * weight * quantity
-
-# 🧮 Calculate Emission for Individual Kit Items
-def calculate_kit_item_emission(category: str, weight: float, quantity: int) -> float:
-    """Calculate emissions for individual kit items."""
-    if category in EMISSION_FACTORS["Kit"]:
-        return weight * EMISSION_FACTORS["Kit"][category] * quantity
-    return 0
-
 # 🏆 Show Material Calculator
 def show_material_calculator(event):
     """Display the material emission calculator."""
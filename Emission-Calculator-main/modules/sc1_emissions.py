@@ -1,51 +1,20 @@
 import streamlit as st
 import sqlite3
-import json
 import logging
 from typing import List, Dict
-import os
-
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR,"..", "..", "data", "emissions.db")
+from core.scope1 import EMISSION_FACTORS, calculate_emission, save_scope1
 
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
-# Emission factors dictionary
-EMISSION_FACTORS = {
-    "Diesel": 0.2496,
-    "Coal": 0.3230,
-    "Petroleum Gas (LPG)": 0.2106,
-    "Electricity": 0.82,
-}
-
-# 🧮 Calculate Emission
-def calculate_emission(fuel_type: str, consumption: float) -> float:
-    """Calculate emission based on fuel type and consumption."""
-    return consumption * EMISSION_FACTORS.get(fuel_type, 0)
-
 # 📌 Insert Scope 1 Data into DB
 def insert_scope1_data(event: str, fuels: List[str], consumptions: List[float], emissions: List[float], total_emission: float):
     """Insert multiple fuel entries into the database."""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            c = conn.cursor()
-
-            # Convert lists to JSON strings
-            fuels_json = json.dumps(fuels)
-            consumptions_json = json.dumps(consumptions)
-            emissions_json = json.dumps(emissions)
-
-            c.execute("""
-                INSERT INTO Scope1 (event, fuels, consumptions, emissions, total_emission)
-                VALUES (?, ?, ?, ?, ?)""",
-                (event, fuels_json, consumptions_json, emissions_json, total_emission)
-            )
-
-            conn.commit()
-            st.success("Emission data saved successfully!")
-            logging.info(f"Inserted Scope 1 data for event: {event}")
+        save_scope1(event, fuels, consumptions, emissions, total_emission)
+        st.success("Emission data saved successfully!")
+        logging.info(f"Inserted Scope 1 data for event: {event}")
     except sqlite3.Error as e:
         st.error(f"Database error: {e}")
         logging.error(f"Failed to insert Scope 1 data: {e}")
@@ -0,0 +1,222 @@
+from collections import namedtuple
+
+# Every read query the dashboards, chatbot and form run against the emissions
+# database. Keeping them here lets query_audit.py check each one against the
+# schema's indexes with EXPLAIN QUERY PLAN.
+#
+# allow_scan marks queries that aggregate a whole table by design; the audit
+# reports their plans but does not fail on them.
+Query = namedtuple("Query", ["name", "sql", "allow_scan"])
+
+REGISTRY = {}
+
+
+def register(name: str, sql: str, allow_scan: bool = False) -> str:
+    """Register a query under ``name`` and return its SQL."""
+    REGISTRY[name] = Query(name, sql, allow_scan)
+    return sql
+
+
+# 📌 Events
+LATEST_EVENTS = register("events.all", "SELECT name FROM Events ORDER BY id DESC")
+
+# 📌 Overall analysis and report
+EVENT_TOTALS = register("overall.event_totals", """
+    SELECT Category, SourceTable, Total AS Emission, Entries, MinEmission, MaxEmission, LastUpdated
+    FROM EventEmissionTotals WHERE Event = ?""")
+
+EVENT_SCOPE_TOTALS = register("report.scope_totals", """
+    SELECT Category, SUM(Total) as TotalEmission
+    FROM EventEmissionTotals
+    WHERE Event = ?
+    GROUP BY Category""")
+
+EMISSION_JOURNEY = register("overall.emission_journey", """
+    SELECT SourceTable, Emission, Timestamp FROM (
+        SELECT 'HVACEmissions' AS SourceTable, Emission, Timestamp FROM HVACEmissions WHERE event = ?
+        UNION ALL
+        SELECT 'Scope1', total_emission AS Emission, Timestamp FROM Scope1 WHERE event = ?
+        UNION ALL
+        SELECT 'ElectricityEmissions', Emission, Timestamp FROM ElectricityEmissions WHERE event = ?
+        UNION ALL
+        SELECT 'transport_data', Emission, NULL AS Timestamp FROM transport_data WHERE event = ?
+        UNION ALL
+        SELECT 'Materials', Emission, Timestamp FROM Materials WHERE event = ?
+        UNION ALL
+        SELECT 'logistics_emissions', total_emission AS Emission, created_at AS Timestamp FROM logistics_emissions WHERE Event = ?
+        UNION ALL
+        SELECT 'food_choices', emission AS Emission, NULL FROM food_choices WHERE event = ?
+    )""")
+
+# 📌 Scope pages
+SCOPE1_LINES_BY_EVENT = register("scope1.lines_by_event", """
+    SELECT s.id, s.event, l.fuel, l.consumption, l.emission, s.total_emission, s.Timestamp
+    FROM Scope1 AS s
+    JOIN Scope1Lines AS l ON l.scope1_id = s.id
+    WHERE s.event = ?
+    ORDER BY s.id, l.line_no""")
+
+SCOPE1_BY_FUEL = register("scope1.by_fuel", """
+    SELECT l.fuel, SUM(l.consumption), SUM(l.emission), COUNT(*)
+    FROM Scope1 AS s
+    JOIN Scope1Lines AS l ON l.scope1_id = s.id
+    WHERE s.event = ?
+    GROUP BY l.fuel""")
+
+ELECTRICITY_BY_EVENT = register("scope2.electricity_by_event", "SELECT * FROM ElectricityEmissions WHERE event = ?")
+HVAC_BY_EVENT = register("scope2.hvac_by_event", "SELECT * FROM HVACEmissions WHERE event = ?")
+
+MATERIALS_BY_EVENT = register("scope3.materials_by_event", "SELECT * FROM Materials WHERE event=?")
+MATERIALS_BY_CATEGORY = register(
+    "scope3.materials_by_category",
+    "SELECT id, event, Weight, Quantity, Emission, Timestamp FROM Materials WHERE Category = ? AND event=?")
+
+TRANSPORT_BY_EVENT = register(
+    "scope3.transport_by_event",
+    "SELECT mode, type, origin, destination, distance, Emission FROM transport_data WHERE event = ?")
+
+FOOD_BY_EVENT = register(
+    "scope3.food_by_event",
+    "SELECT dietary_pattern, food_item, emission FROM food_choices WHERE event = ?")
+
+LOGISTICS_BY_EVENT = register("scope3.logistics_by_event", """
+    SELECT *
+    FROM logistics_emissions
+    WHERE Event = ?
+    ORDER BY created_at DESC""")
+
+# 📌 Batch reports: one row per activity type, as (label, quantity, emission, entries)
+REPORT_EVENTS = register("report.events", """
+    SELECT Event, SUM(Total) FROM EventEmissionTotals GROUP BY Event ORDER BY Event""", allow_scan=True)
+
+REPORT_EVENT_ACTIVITY = register("report.event_activity", """
+    SELECT event, MIN(first), MAX(last) FROM (
+        SELECT event, MIN(Timestamp) AS first, MAX(Timestamp) AS last FROM Scope1 GROUP BY event
+        UNION ALL
+        SELECT event, MIN(Timestamp), MAX(Timestamp) FROM HVACEmissions GROUP BY event
+        UNION ALL
+        SELECT event, MIN(Timestamp), MAX(Timestamp) FROM ElectricityEmissions GROUP BY event
+        UNION ALL
+        SELECT event, MIN(Timestamp), MAX(Timestamp) FROM Materials GROUP BY event
+        UNION ALL
+        SELECT Event, MIN(created_at), MAX(created_at) FROM logistics_emissions GROUP BY Event
+    )
+    GROUP BY event""", allow_scan=True)
+
+REPORT_HVAC = register("report.hvac_by_refrigerant", """
+    SELECT Refrigerant, SUM(MassLeak), SUM(Emission), COUNT(*)
+    FROM HVACEmissions WHERE event = ? GROUP BY Refrigerant""")
+
+REPORT_ELECTRICITY = register("report.electricity_by_usage", """
+    SELECT Usage, SUM(Value), SUM(Emission), COUNT(*)
+    FROM ElectricityEmissions WHERE event = ? GROUP BY Usage""")
+
+REPORT_MATERIALS = register("report.materials_by_category", """
+    SELECT Category, SUM(Quantity), SUM(Emission), COUNT(*)
+    FROM Materials WHERE event = ? GROUP BY Category""")
+
+REPORT_TRANSPORT = register("report.transport_by_mode", """
+    SELECT mode || COALESCE(' - ' || NULLIF(type, ''), ''), SUM(distance), SUM(Emission), COUNT(*)
+    FROM transport_data WHERE event = ? GROUP BY mode, type""")
+
+REPORT_LOGISTICS = register("report.logistics_by_mode", """
+    SELECT transport_mode, SUM(distance_km), SUM(total_emission), COUNT(*)
+    FROM logistics_emissions WHERE Event = ? GROUP BY transport_mode""")
+
+REPORT_FOOD = register("report.food_by_item", """
+    SELECT food_item, COUNT(*), SUM(emission), COUNT(*)
+    FROM food_choices WHERE event = ? GROUP BY food_item""")
+
+# 📌 Travel form
+FORM_TRANSPORT = register("form.transport_by_event", "SELECT mode, distance FROM transport_data WHERE Event = ?")
+FORM_FOOD = register("form.food_by_event", "SELECT food_item FROM food_choices WHERE Event = ?")
+
+# 📌 Chatbot (whole-database summaries)
+# Rows added after a given id, grouped for the incremental chatbot snapshot
+CHAT_SNAPSHOT_SINCE = register("chatbot.snapshot_since", """
+    SELECT Category, SourceTable, SUM(Emission), MAX(id)
+    FROM MasterEmissions NOT INDEXED  -- walk the rowid range, not the whole category index
+    WHERE id > ?
+    GROUP BY 1, 2""")
+CHAT_MAX_ID = register("chatbot.max_id", "SELECT COALESCE(MAX(id), 0) FROM MasterEmissions")
+CHAT_TIPS = register("chatbot.tips", "SELECT tip FROM reduction_tips_table", allow_scan=True)
+
+# 📌 Chatbot history: newest first, one page at a time
+CHAT_HISTORY_PAGE = register("chatbot.history_page", """
+    SELECT id, role, content FROM ChatMessages
+    WHERE conversation = ? AND id < ?
+    ORDER BY id DESC LIMIT ?""")
+
+# 📌 Chatbot questions: one query per combination of filters, so every
+# variant the question engine can run is audited. Without an event filter
+# they aggregate a whole table by design.
+CHAT_SOURCE_SCOPES = {
+    "Scope1": "Scope 1",
+    "HVACEmissions": "Scope 1",
+    "ElectricityEmissions": "Scope 2",
+    "Materials": "Scope 3",
+    "transport_data": "Scope 3",
+    "logistics_emissions": "Scope 3",
+    "food_choices": "Scope 3",
+}
+
+# Sources with a date per entry, rolled up by month in EventMonthlyTotals
+CHAT_DATED_SOURCES = ("Scope1", "HVACEmissions", "ElectricityEmissions", "Materials", "logistics_emissions")
+
+
+def _filtered(conditions) -> str:
+    used = [condition for condition, on in conditions if on]
+    return " WHERE " + " AND ".join(used) if used else ""
+
+
+def _variant(name, flags) -> str:
+    return name + "".join(f".{flag}" for flag, on in flags if on)
+
+
+# (by_event, by_scope, by_source) -> totals per scope and source
+CHAT_TOTALS = {}
+for _event in (False, True):
+    for _scope in (False, True):
+        for _source in (False, True):
+            CHAT_TOTALS[(_event, _scope, _source)] = register(
+                _variant("chatbot.totals", [("event", _event), ("scope", _scope), ("source", _source)]),
+                "SELECT Category, SourceTable, SUM(Total) FROM EventEmissionTotals"
+                + _filtered([("Event = ?", _event), ("Category = ?", _scope), ("SourceTable = ?", _source)])
+                + " GROUP BY Category, SourceTable",
+                allow_scan=not _event)
+
+# (by_event, by_scope, by_source, by_period) -> totals per 'YYYY-MM', scope and
+# source; a period is an inclusive range of months
+CHAT_MONTHLY = {}
+for _event in (False, True):
+    for _scope in (False, True):
+        for _source in (False, True):
+            for _period in (False, True):
+                CHAT_MONTHLY[(_event, _scope, _source, _period)] = register(
+                    _variant("chatbot.monthly", [("event", _event), ("scope", _scope),
+                                                 ("source", _source), ("period", _period)]),
+                    "SELECT Month, Category, SourceTable, SUM(Total) FROM EventMonthlyTotals"
+                    + _filtered([("Event = ?", _event), ("Month BETWEEN ? AND ?", _period),
+                                 ("Category = ?", _scope), ("SourceTable = ?", _source)])
+                    + " GROUP BY Month, Category, SourceTable",
+                    allow_scan=not (_event or _period))
+
+# (by_event, by_fuel, by_period) -> emissions per fuel
+CHAT_FUELS = {}
+for _event in (False, True):
+    for _fuel in (False, True):
+        for _period in (False, True):
+            CHAT_FUELS[(_event, _fuel, _period)] = register(
+                _variant("chatbot.fuels", [("event", _event), ("fuel", _fuel), ("period", _period)]),
+                "SELECT l.fuel, SUM(l.emission) FROM Scope1 AS s JOIN Scope1Lines AS l ON l.scope1_id = s.id"
+                + _filtered([("s.event = ?", _event), ("l.fuel = ?", _fuel),
+                             ("s.Timestamp >= ? AND s.Timestamp < ?", _period)])
+                + " GROUP BY l.fuel",
+                allow_scan=not (_event or _period))
+
+del _event, _scope, _source, _fuel, _period
+
+# 📌 Login rate limits and sessions
+LOGIN_COUNTER = register("auth.login_counter",
+                         "SELECT window_start, current, previous FROM LoginAttempts WHERE key = ?")
+SESSION_USER = register("auth.session_user", "SELECT username FROM Sessions WHERE token = ? AND expires_at > ?")
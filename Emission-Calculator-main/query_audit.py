@@ -0,0 +1,118 @@
+"""Check every registered query against the schema's indexes.
+
+Runs ``EXPLAIN QUERY PLAN`` for each query in ``queries.REGISTRY`` on a
+scratch copy of the database with every migration applied, and exits
+non-zero if any query scans a large table instead of searching an index,
+or no longer compiles against the schema::
+
+    python query_audit.py                 # audit a copy of data/emissions.db
+    python query_audit.py --db other.db   # audit another database
+    python query_audit.py --verbose       # print every plan
+"""
+import os
+import re
+import sys
+import shutil
+import sqlite3
+import argparse
+import tempfile
+
+import queries
+import migrations
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB = os.path.join(BASE_DIR, "..", "data", "emissions.db")
+
+# Tables that grow with every submission. A full scan of any of them is
+# reported regardless of how many rows the audited copy happens to hold.
+LARGE_TABLES = {
+    "Scope1", "Scope1Lines", "HVACEmissions", "ElectricityEmissions", "ElectricConsumption", "transport_data",
+    "logistics_emissions", "Materials", "food_choices", "EmissionsSummary", "MasterEmissions",
+}
+
+# Plans name an aliased table by its alias ("SCAN l", or "SCAN TABLE Scope1Lines AS l"
+# on older SQLite), so aliases are mapped back to tables from the query text
+SCAN = re.compile(r"\bSCAN (?:TABLE )?(\w+)(?: AS \w+)?")
+ALIAS = re.compile(r"\b(?:FROM|JOIN)\s+(\w+)\s+AS\s+(\w+)", re.IGNORECASE)
+
+
+def table_sizes(conn):
+    names = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+    return {name: conn.execute(f'SELECT COUNT(*) FROM "{name}"').fetchone()[0] for name in names}
+
+
+def explain(conn, sql):
+    params = (None,) * sql.count("?")
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def full_scans(plan, large, sql=""):
+    """Return the large tables a plan scans without an index."""
+    aliases = {alias: table for table, alias in ALIAS.findall(sql)}
+    scanned = []
+    for step in plan:
+        match = SCAN.search(step)
+        if not match:
+            continue
+        table = aliases.get(match.group(1), match.group(1))
+        if table in large:
+            scanned.append(table)
+    return scanned
+
+
+def audit(conn, min_rows=None, verbose=False):
+    sizes = table_sizes(conn)
+    large = set(LARGE_TABLES)
+    if min_rows is not None:
+        large |= {name for name, count in sizes.items() if count >= min_rows}
+
+    failures = 0
+    for query in queries.REGISTRY.values():
+        try:
+            plan = explain(conn, query.sql)
+        except sqlite3.OperationalError as e:
+            # A query that no longer compiles against the schema is broken
+            failures += 1
+            print(f"ERROR {query.name}: {e}")
+            continue
+        scanned = full_scans(plan, large, query.sql)
+        if scanned and not query.allow_scan:
+            failures += 1
+            status = "FAIL"
+        elif scanned:
+            status = "SCAN"  # whole-table aggregate, allowed
+        else:
+            status = "OK"
+        detail = f" (full scan of {', '.join(sorted(set(scanned)))})" if scanned else ""
+        print(f"{status:5} {query.name}{detail}")
+        if verbose or status == "FAIL":
+            for step in plan:
+                print(f"        {step}")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", default=DEFAULT_DB, help="database to audit (a scratch copy is used)")
+    parser.add_argument("--min-rows", type=int, help="also treat any table with at least this many rows as large")
+    parser.add_argument("--verbose", action="store_true", help="print the plan of every query")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="emissions-audit-")
+    try:
+        path = os.path.join(workdir, "audit.db")
+        if os.path.exists(args.db):
+            shutil.copyfile(args.db, path)
+        conn = sqlite3.connect(path, isolation_level=None)
+        migrations.migrate(conn)
+        failures = audit(conn, args.min_rows, args.verbose)
+        conn.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\n{len(queries.REGISTRY)} queries audited, {failures} failed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+import os
+import streamlit as st
+
+import data_version
+import events
+
+# How often open pages check for new data, in seconds
+POLL_INTERVAL = float(os.environ.get("DATA_POLL_SECONDS", "2"))
+
+
+@st.fragment(run_every=POLL_INTERVAL)
+def _poll(key, tables):
+    version = data_version.current(tables)
+    seen = st.session_state.get(key)
+    st.session_state[key] = version
+    if seen is not None and version != seen:
+        events.invalidate()  # the change may be a new event
+        st.rerun()
+
+
+def watch_data(tables=None, key="data_version"):
+    """Rerun the app when the watched tables change.
+
+    Only a small fragment reruns on the timer, and it costs one query; the
+    full script (and every page query) reruns only when the data version
+    moves. Call once per script run.
+    """
+    _poll(key, tuple(tables) if tables is not None else None)
@@ -0,0 +1,122 @@
+"""On-disk cache of generated PDF reports.
+
+A report is keyed by its event and a digest of the rows it is drawn from,
+so it is rebuilt only when that event's emissions change and every viewer
+and worker shares the same file. Builds run on one background thread;
+concurrent requests for the same report wait on the same build::
+
+    path = report_cache.cached(event, rows)          # None until built
+    path = report_cache.build(event, rows, render)   # render() -> bytes or BytesIO
+
+Renderers that write the file themselves (the batch reports) use
+:func:`write` with ``render(path)`` instead.
+"""
+import os
+import re
+import json
+import hashlib
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+REPORT_DIR = os.environ.get("REPORT_CACHE_DIR", os.path.join(BASE_DIR, "..", "data", "reports"))
+
+# Bump when the PDF layout changes so existing files are not reused
+LAYOUT_VERSION = 1
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report")
+_pending: Dict[str, Future] = {}
+_lock = threading.Lock()
+
+
+def _slug(event: str) -> str:
+    """Return a file-safe name that stays unique for events differing in punctuation."""
+    readable = re.sub(r"[^A-Za-z0-9_-]+", "_", event).strip("_")[:60] or "event"
+    return f"{readable}-{hashlib.sha256(event.encode('utf-8')).hexdigest()[:6]}"
+
+
+def digest(event: str, rows: Sequence[Sequence]) -> str:
+    """Return a short fingerprint of the event and the rows its report shows."""
+    payload = json.dumps([LAYOUT_VERSION, event, [list(row) for row in rows]], default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def path_for(event: str, rows: Sequence[Sequence], kind: str = "summary") -> str:
+    """Return where the report for ``event`` and ``rows`` is (or will be) stored."""
+    return os.path.join(REPORT_DIR, f"{_slug(event)}.{kind}.{digest(event, rows)}.pdf")
+
+
+def cached(event: str, rows: Sequence[Sequence], kind: str = "summary") -> Optional[str]:
+    """Return the path of an up-to-date report, or None if it has not been built."""
+    path = path_for(event, rows, kind)
+    return path if os.path.exists(path) else None
+
+
+def _save(event: str, kind: str, path: str, render_to: Callable[[str], None]) -> str:
+    os.makedirs(REPORT_DIR, exist_ok=True)
+    partial = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        render_to(partial)
+        os.replace(partial, path)  # readers never see a half-written file
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+
+    # Older versions of this event's report are stale now
+    prefix = f"{_slug(event)}.{kind}."
+    for name in os.listdir(REPORT_DIR):
+        if name.startswith(prefix) and name.endswith(".pdf") and os.path.join(REPORT_DIR, name) != path:
+            try:
+                os.remove(os.path.join(REPORT_DIR, name))
+            except OSError:
+                pass
+    logging.info(f"Built {kind} report for {event}: {os.path.basename(path)}")
+    return path
+
+
+def _write(event: str, kind: str, path: str, render: Callable[[], object]) -> str:
+    def render_to(partial):
+        data = render()
+        if hasattr(data, "getvalue"):
+            data = data.getvalue()
+        with open(partial, "wb") as f:
+            f.write(data)
+    return _save(event, kind, path, render_to)
+
+
+def write(event: str, rows: Sequence[Sequence], render_to: Callable[[str], None], kind: str) -> Tuple[str, bool]:
+    """Build a report in this thread unless it is cached; ``render_to(path)`` writes the file.
+
+    Returns the report's path and whether it had to be built. Safe to call
+    from several processes at once.
+    """
+    path = path_for(event, rows, kind)
+    if os.path.exists(path):
+        return path, False
+    return _save(event, kind, path, render_to), True
+
+
+def submit(event: str, rows: Sequence[Sequence], render: Callable[[], object], kind: str = "summary") -> Future:
+    """Build the report in the background unless it is cached or already building."""
+    path = path_for(event, rows, kind)
+    with _lock:
+        future = _pending.get(path)
+        if future is not None:
+            return future
+        if os.path.exists(path):
+            future = Future()
+            future.set_result(path)
+            return future
+        future = _pending[path] = _executor.submit(_write, event, kind, path, render)
+    future.add_done_callback(lambda _: _pending.pop(path, None))
+    return future
+
+
+def build(event: str, rows: Sequence[Sequence], render: Callable[[], object], kind: str = "summary") -> str:
+    """Return the path of the report, building it first if needed."""
+    return submit(event, rows, render, kind).result()
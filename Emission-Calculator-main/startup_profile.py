@@ -0,0 +1,77 @@
+"""Report how long each part of the dashboard takes to import from cold.
+
+Every target is imported in a fresh interpreter with ``python -X importtime``,
+so the numbers are what a new Streamlit process pays on its first run. The
+login page should stay light; the dashboard pages are imported on first
+navigation (see ``PAGES`` in app.py)::
+
+    python startup_profile.py             # all targets, top 8 dependencies each
+    python startup_profile.py --top 15
+    python startup_profile.py visualizations.OverallAnalysis
+"""
+import os
+import re
+import sys
+import argparse
+import subprocess
+from collections import defaultdict
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# What app.py imports before the login page renders, then each lazy page
+TARGETS = {
+    "login": "app_pages.Login, common, refresh",
+    "sidebar": "app_pages.sidebar",
+    "Overview": "app_pages.overview",
+    "Analysis": "visualizations.OverallAnalysis",
+    "Import": "app_pages.import_data",
+}
+
+# import time:       self [us] |   cumulative | imported package
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def profile(modules: str) -> dict:
+    """Import ``modules`` in a fresh interpreter and return its import timings."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modules}"],
+        cwd=BASE_DIR, env=env, capture_output=True, text=True,
+    )
+    packages = defaultdict(int)  # top-level package -> cumulative µs
+    total = 0
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if not match:
+            continue
+        cumulative, depth, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        if depth == 1:  # imported directly by the -c statement
+            total += cumulative
+        if "." not in name:
+            packages[name] = max(packages[name], cumulative)
+    error = None
+    if result.returncode:
+        error = (result.stderr.strip().splitlines() or ["import failed"])[-1]
+    return {"total_ms": total / 1000, "packages": packages, "error": error}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", help="modules to profile instead of the default targets")
+    parser.add_argument("--top", type=int, default=8, help="dependencies to list per target")
+    args = parser.parse_args(argv)
+
+    targets = {name: name for name in args.modules} if args.modules else TARGETS
+    for label, modules in targets.items():
+        report = profile(modules)
+        print(f"{label:<10} {report['total_ms']:8.0f} ms  ({modules})")
+        if report["error"]:
+            print(f"{'':<10} failed: {report['error']}")
+        heaviest = sorted(report["packages"].items(), key=lambda item: item[1], reverse=True)
+        for name, micros in heaviest[:args.top]:
+            print(f"{'':<10} {micros / 1000:8.0f} ms  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Where the time goes in one rerun of the dashboard.
+
+app.py calls :func:`start` at the top of a rerun and :func:`finish` at the
+end. In between, pages and chart sections are timed with :func:`timed` or
+:func:`span`, and every query through ``db`` is timed automatically. The
+spans nest, so the breakdown shows which queries ran inside which page::
+
+    @timing.timed("page")
+    def overview_page(): ...
+
+    with timing.span("PDF", "chart"):
+        pdf = generate_pdf(event, df)
+
+Outside a rerun (scripts, the CLI, the import pipeline) recording is off and
+a span costs one attribute lookup. Reruns run on one thread per session, so
+the recording is thread-local.
+"""
+import os
+import time
+import logging
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, List, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Reruns slower than this are logged as warnings, in milliseconds
+SLOW_RERUN_MS = float(os.environ.get("SLOW_RERUN_MS", "1000"))
+
+Span = namedtuple("Span", ["kind", "name", "ms", "depth"])
+
+_local = threading.local()
+_query_names: Dict[str, str] = {}
+
+
+def start(label: str):
+    """Begin recording a rerun."""
+    _local.spans = []
+    _local.depth = 0
+    _local.label = label
+    _local.started = time.perf_counter()
+
+
+def recording() -> bool:
+    return getattr(_local, "spans", None) is not None
+
+
+@contextmanager
+def span(name: str, kind: str = "page"):
+    """Time the enclosed block as one entry of the current rerun."""
+    spans = getattr(_local, "spans", None)
+    if spans is None:
+        yield
+        return
+    depth = _local.depth
+    index = len(spans)
+    spans.append(None)  # keep spans in the order they started
+    _local.depth = depth + 1
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _local.depth = depth
+        spans[index] = Span(kind, name, (time.perf_counter() - started) * 1000, depth)
+
+
+def timed(kind: str = "page", name: Optional[str] = None):
+    """Decorator form of :func:`span`, named after the function by default."""
+    def decorator(func):
+        label = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(label, kind):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def query_name(sql: str) -> str:
+    """Return the registered name of a query, or the start of its SQL."""
+    import queries
+
+    if len(_query_names) != len(queries.REGISTRY):
+        _query_names.clear()
+        _query_names.update({query.sql: query.name for query in queries.REGISTRY.values()})
+    return _query_names.get(sql) or " ".join(sql.split())[:60]
+
+
+def totals(spans: List[Span]) -> Dict[str, dict]:
+    """Sum time and count per kind, counting only the outermost span of a kind."""
+    result: Dict[str, dict] = {}
+    open_kinds: List[str] = []
+    for s in spans:
+        del open_kinds[s.depth:]
+        if s.kind not in open_kinds:
+            entry = result.setdefault(s.kind, {"count": 0, "ms": 0.0})
+            entry["count"] += 1
+            entry["ms"] += s.ms
+        open_kinds.append(s.kind)
+    return result
+
+
+def finish() -> Optional[dict]:
+    """Stop recording, log the breakdown and return it."""
+    spans = getattr(_local, "spans", None)
+    if spans is None:
+        return None
+    _local.spans = None
+    spans = [s for s in spans if s is not None]  # spans still open, if any
+    report = {
+        "label": _local.label,
+        "total_ms": (time.perf_counter() - _local.started) * 1000,
+        "spans": spans,
+        "totals": totals(spans),
+    }
+    parts = ", ".join(f"{kind} {entry['ms']:.0f} ms ({entry['count']})" for kind, entry in report["totals"].items())
+    level = logging.WARNING if report["total_ms"] > SLOW_RERUN_MS else logging.INFO
+    logging.log(level, f"Rendered {report['label']} in {report['total_ms']:.0f} ms: {parts or 'nothing timed'}")
+    return report
@@ -1,24 +1,25 @@
 import ast
 import json
-import os
 import streamlit as st
+import timing
 import pandas as pd
 import plotly.express as px
-import sqlite3
+import db
+import queries
+from events import current_event
 import plotly.graph_objects as go
 import logging
-from streamlit_autorefresh import st_autorefresh
 from plotly.subplots import make_subplots
 from visualizations.report import report
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR,"..", "..", "data", "emissions.db")
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
-# Custom CSS for better styling
-st.markdown("""
+# Custom CSS for better styling, injected on every render since the
+# module is imported once, on first navigation
+def inject_styles():
+    st.markdown("""
 <style>
     .main {
         background-color: #343E49;
@@ -60,29 +61,15 @@ st.markdown("""
         margin-bottom: 20px;
     }
 </style>
-""", unsafe_allow_html=True)
-
-######################## - GET THE LATEST EVENT DETAILS - #############################
-def get_latest_event():
-    """Fetch the latest event name from the Events table."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute("SELECT name FROM Events ORDER BY id DESC LIMIT 1")
-    event = cursor.fetchone()
-    return event[0] if event else None
-
-st_autorefresh(interval=1000, key="latest_event_refres")
-event_name = get_latest_event()
-
-
-##############################################################################################
+    """, unsafe_allow_html=True)
 
 def fetch_emissions_data(event_name):
-    conn = sqlite3.connect(DB_PATH)
-    query = "SELECT * FROM EmissionsSummary WHERE Event = ?"
-    df = pd.read_sql_query(query, conn, params=(event_name,))
-    conn.close()
-    return df
+    """Per-source totals for an event, one row per (Category, SourceTable).
+
+    Reads the trigger-maintained EventEmissionTotals table, so the cost does
+    not grow with the number of submissions.
+    """
+    return db.read_sql(queries.EVENT_TOTALS, (event_name,))
 ## Calculate totals by scope
 def calculate_scope_totals(df):
     scope_totals = df.groupby('Category')['Emission'].sum().to_dict()
@@ -102,9 +89,8 @@ def create_metric_card(title, value, color):
 
 
 
+@timing.timed("chart")
 def get_emission_journey(event_name):
-    conn = sqlite3.connect(DB_PATH)
-
     scope_map = {
         "HVACEmissions": "Scope 1",
         "Scope1": "Scope 1",
@@ -115,37 +101,19 @@ def get_emission_journey(event_name):
         "food_choices": "Scope 3"
     }
 
-    query = f"""
-    SELECT SourceTable, Emission, Timestamp FROM (
-        SELECT 'HVACEmissions' AS SourceTable, Emission, Timestamp FROM HVACEmissions WHERE event = ?
-        UNION ALL
-        SELECT 'Scope1', total_emission AS Emission, Timestamp FROM Scope1 WHERE event = ?
-        UNION ALL
-        SELECT 'ElectricityEmissions', Emission, Timestamp FROM ElectricityEmissions WHERE event = ?
-        UNION ALL
-        SELECT 'transport_data', Emission, NULL AS Timestamp FROM transport_data WHERE event = ?
-        UNION ALL
-        SELECT 'Materials', Emission, Timestamp FROM Materials WHERE event = ?
-        UNION ALL
-        SELECT 'logistics_emissions', total_emission AS Emission, created_at AS Timestamp FROM logistics_emissions WHERE Event = ?
-        UNION ALL
-        SELECT 'food_choices', emission AS Emission, NULL FROM food_choices WHERE event = ?
-    )
-    """
-    df = pd.read_sql_query(query, conn, params=[event_name]*7)
-    conn.close()
+    df = db.read_sql(queries.EMISSION_JOURNEY, [event_name]*7)
 
-    df["Timestamp"] = pd.to_datetime(df["Timestamp"]).fillna(method="ffill")
+    df["Timestamp"] = pd.to_datetime(df["Timestamp"]).ffill()
     df["Scope"] = df["SourceTable"].map(scope_map)
     df = df.sort_values("Timestamp")
 
     return df
 
-def visual2_what_if_simulation():
+@timing.timed("chart")
+def visual2_what_if_simulation(df):
     st.subheader("🔮 What-If Scenario Simulator")
 
-    # Real emission data
-    df = fetch_emissions_data(event_name)
+    # Real emission data (already fetched by vis)
     actual_total = df["Emission"].sum()
     col1, col2 = st.columns(2)
     with col1:
@@ -218,8 +186,12 @@ input[type=range]::-moz-range-track {
 
 
 # Main dashboard function
+@timing.timed("page")
 def vis():
+    inject_styles()
+
     # Fetch and prepare data
+    event_name = current_event()
     df = fetch_emissions_data(event_name)
     scope_totals = calculate_scope_totals(df)
     
@@ -321,7 +293,7 @@ def vis():
     )
     st.plotly_chart(fig, use_container_width=True)
     st.markdown("---")
-    visual2_what_if_simulation()
+    visual2_what_if_simulation(df)
     st.markdown("---")
     report()
 
@@ -1,10 +1,12 @@
 import streamlit as st
+import timing
 import sqlite3
+import db
+import queries
+from events import current_event, invalidate
 import pandas as pd
 import plotly.express as px
 from streamlit_extras.dataframe_explorer import dataframe_explorer
-import os
-from streamlit_autorefresh import st_autorefresh
 
 st.set_page_config(
     page_title="Emission Analytics Dashboard",
@@ -14,32 +16,12 @@ st.set_page_config(
 
 
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR,"..", "..", "data", "emissions.db")
-
-######################### LATEST EVENT ###############################################
-def get_latest_event():
-    """Fetch the latest event name from the Events table."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute("SELECT name FROM Events ORDER BY id DESC LIMIT 1")
-    event = cursor.fetchone()
-    return event[0] if event else None
-
-event_name = get_latest_event()
-st_autorefresh(interval=1000, key="lat_event_refresh")
-latest_event = get_latest_event()
-st.write(f"Event: {latest_event}")
-#######################################################################################
 
 def fetch_data(event, table_name):
     """Fetch data from the database for a specific event name or all events."""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        query = f"SELECT * FROM {table_name} WHERE event = ?"
-        df = pd.read_sql(query, conn, params=(event,))
-        conn.close()
-        return df
+        query = {"ElectricityEmissions": queries.ELECTRICITY_BY_EVENT, "HVACEmissions": queries.HVAC_BY_EVENT}[table_name]
+        return db.read_sql(query, (event,))
     except sqlite3.Error as e:
         st.error(f"Database error: {e}")
         return pd.DataFrame()
@@ -86,12 +68,14 @@ def plot_graphs(df, event_name, category, value_col):
         fig.update_traces(texttemplate='%{text}', textposition='outside')
         st.plotly_chart(fig, use_container_width=True)
 
+@timing.timed("chart")
 def electricity_visual():
     """Display electricity and HVAC emissions visualizations."""
-    global event_name
     if st.button("Refresh"):
-        event_name = get_latest_event()
+        invalidate()
         st.rerun()
+    event_name = current_event()
+    st.write(f"Event: {event_name}")
     tab1, tab2 = st.tabs(["⚡ Electricity Emissions", "❄️ HVAC Emissions"])
 
     with tab1:
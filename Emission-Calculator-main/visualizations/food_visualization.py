@@ -1,43 +1,29 @@
-import os
 import streamlit as st
+import timing
 import sqlite3
+import db
+import queries
+from events import current_event
 import pandas as pd
 import matplotlib.pyplot as plt
 import plotly.express as px
 from streamlit_extras.dataframe_explorer import dataframe_explorer
-from streamlit_autorefresh import st_autorefresh
 import logging 
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR,"..", "..", "data", "emissions.db")
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 
 def fetch_food_data(latest_event):
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute(f"SELECT dietary_pattern, food_item, emission FROM food_choices WHERE event = ?", (latest_event,))
-        data = cursor.fetchall()
-        conn.close()
-        return data
+        return db.fetchall(queries.FOOD_BY_EVENT, (latest_event,))
     except sqlite3.Error as e:
         st.error(f"An error occurred: {e}")
         return []
 
-def get_latest_event():
-    """Fetch the latest event name from the Events table."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute("SELECT name FROM Events ORDER BY id DESC LIMIT 1")
-    event = cursor.fetchone()
-    return event[0] if event else None
-
-st_autorefresh(interval=1000, key="latest_event_efresh")
-latest_event = get_latest_event()
-
+@timing.timed("chart")
 def food_visual():
+    latest_event = current_event()
     data = fetch_food_data(latest_event)
 
     st.subheader("🍎 Food Emission Data")
@@ -1,34 +1,19 @@
 import streamlit as st
+import timing
 import pandas as pd
 import plotly.express as px
 import sqlite3
+import db
+import queries
 import logging
-import os
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR,"..", "..", "data", "emissions.db")
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
-######################### LATEST EVENT ###############################################
-def get_latest_event():
-    """Fetch the latest event name from the Events table."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute("SELECT name FROM Events ORDER BY id DESC LIMIT 1")
-    event = cursor.fetchone()
-    return event[0] if event else None
-#######################################################################################
-
 def fetch_material_data(category, event):
     """Fetch material emissions data from the database."""
     try:
-        conn = sqlite3.connect("data/emissions.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, event, Weight, Quantity, Emission, Timestamp FROM Materials WHERE Category = ? AND event=?", (category, event,))
-        data = cursor.fetchall()
-        conn.close()
-        return data
+        return db.fetchall(queries.MATERIALS_BY_CATEGORY, (category, event,))
     except sqlite3.Error as e:
         st.error(f"Database error: {e}")
         logging.error(f"Error fetching material data: {e}")
@@ -60,9 +45,9 @@ def display_descriptive_analytics(df):
     with col6:
         st.metric(label='Day with Highest Emission', value=day_with_highest_emission, delta_color="off")
 
+@timing.timed("chart")
 def visualize(category, event_name):
     """Display material emissions visualizations."""
-    event_name = get_latest_event()
     data = fetch_material_data(category, event_name)
     if not data:
         st.write("No records found.")
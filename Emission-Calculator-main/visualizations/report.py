@@ -1,48 +1,30 @@
 import streamlit as st
-import sqlite3
-import pandas as pd
-import matplotlib.pyplot as plt
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
+import timing
+import db
+import report_cache
+import queries
+from events import current_event
 from io import BytesIO
 import datetime
-import os
-from streamlit_autorefresh import st_autorefresh
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR,"..", "..", "data", "emissions.db")
-
-
-
-# Connect to your SQLite3 DB
-conn = sqlite3.connect(DB_PATH, check_same_thread=False)
-cursor = conn.cursor()
-
-def get_latest_event():
-    """Fetch the latest event name from the Events table."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute("SELECT name FROM Events ORDER BY id DESC LIMIT 1")
-    event = cursor.fetchone()
-    return event[0] if event else None
-
-st_autorefresh(interval=1000, key="latest_event_efresh")
-event = get_latest_event()
 
 def fetch_emissions_summary(event):
-    query = """SELECT Category, SUM(Emission) as TotalEmission 
-               FROM EmissionsSummary 
-               WHERE Event = ? 
-               GROUP BY Category"""
-    return pd.read_sql_query(query, conn, params=(event,))
+    return db.read_sql(queries.EVENT_SCOPE_TOTALS, (event,))
 
+# matplotlib and reportlab load only when a chart or PDF is drawn
 def draw_pie_chart(df):
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots()
     ax.pie(df['TotalEmission'], labels=df['Category'], autopct='%1.1f%%')
     ax.set_title("Emissions by Scope")
     return fig
 
+@timing.timed("chart")
 def generate_pdf(event_name, summary_df):
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+
     buffer = BytesIO()
     c = canvas.Canvas(buffer, pagesize=A4)
     width, height = A4
@@ -87,23 +69,32 @@ def generate_pdf(event_name, summary_df):
     return buffer
 
 # ---------- Streamlit UI Starts ----------
+@timing.timed("page")
 def report():
     st.title("Executive Emissions Report Generator")
 
-    latest_event = get_latest_event()
+    latest_event = current_event()
     
-    summary_df = fetch_emissions_summary(event)
+    summary_df = fetch_emissions_summary(latest_event)
 
     if summary_df.empty:
         st.warning("No emissions data found for the latest event.")
     else:
 
-    # Generate PDF
+    # The PDF is built once per change to the event's totals and kept on disk
         st.subheader("📥 Export Report")
-        pdf_buffer = generate_pdf(latest_event, summary_df)
+        rows = list(summary_df.itertuples(index=False, name=None))
+        path = report_cache.cached(latest_event, rows)
+        if path is None:
+            if not st.button("📄 Prepare Executive Report (PDF)"):
+                return
+            with st.spinner("Generating report..."):
+                path = report_cache.build(latest_event, rows, lambda: generate_pdf(latest_event, summary_df))
+        with open(path, "rb") as f:
+            pdf_bytes = f.read()
         st.download_button(
             label="📄 Download Executive Report (PDF)",
-            data=pdf_buffer,
+            data=pdf_bytes,
             file_name=f"{latest_event}_Executive_Report.pdf",
             mime='application/pdf'
         )
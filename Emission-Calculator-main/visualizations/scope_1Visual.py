@@ -1,61 +1,39 @@
-import os
 import streamlit as st
+import timing
 import pandas as pd
 import sqlite3
+import db
+import queries
+from events import current_event, invalidate
 import plotly.express as px
-import json
 import logging
 from streamlit_extras.dataframe_explorer import dataframe_explorer
-from streamlit_autorefresh import st_autorefresh
 
 
 ############################## EVENT ##################################################
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR,"..", "..", "data", "emissions.db")
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
-############################## EVENT ##################################################
-def get_latest_event():
-    """Fetch the latest event name from the Events table."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute("SELECT name FROM Events ORDER BY id DESC LIMIT 1")
-    event = cursor.fetchone()
-    return event[0] if event else None
-
-st_autorefresh(interval=1000, key="latest_event_efresh")
-event_name = get_latest_event()
-st.write(f"Event: {event_name}")
-######################################################################################
-
 def fetch_data(event):
-    """Fetch and process data from the Scope1 table."""
+    """Fetch one row per fuel line of the event's Scope 1 submissions."""
     try:
-        conn = sqlite3.connect("data/emissions.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, event, fuels, consumptions, emissions, total_emission, Timestamp FROM Scope1 WHERE event = ?", (event,))
-        data = cursor.fetchall()
-        conn.close()
-
-        # Process JSON fields
-        processed_data = []
-        for row in data:
-            id_, event, fuels_json, consumptions_json, emissions_json, total_emission, timestamp = row
-            fuels = json.loads(fuels_json)  # Convert JSON string to list
-            consumptions = json.loads(consumptions_json)
-            emissions = json.loads(emissions_json)
-
-            for fuel, consumption, emission in zip(fuels, consumptions, emissions):
-                processed_data.append([id_, event, fuel, consumption, emission, total_emission, timestamp])
-
-        return processed_data
+        return db.fetchall(queries.SCOPE1_LINES_BY_EVENT, (event,))
     except sqlite3.Error as e:
         st.error(f"Database error: {e}")
         logging.error(f"Error fetching Scope1 data: {e}")
         return []
 
+def fetch_fuel_totals(event):
+    """Fetch consumption and emission totals per fuel for the event."""
+    try:
+        rows = db.fetchall(queries.SCOPE1_BY_FUEL, (event,))
+    except sqlite3.Error as e:
+        st.error(f"Database error: {e}")
+        logging.error(f"Error fetching Scope1 fuel totals: {e}")
+        rows = []
+    return pd.DataFrame(rows, columns=["Fuel Type", "Consumption (kWh)", "Emission (kg CO₂)", "Entries"])
+
 def display_descriptive_analytics(df, column):
     """Display descriptive analytics for a given column."""
     total_val = round(df[column].sum(), 3)
@@ -82,18 +60,20 @@ def display_descriptive_analytics(df, column):
         max_emission_day = df.loc[df[column].idxmax(), "Timestamp"]
         st.metric(label=f"Highest {column} Recorded On", value=max_emission_day, delta_color="off")
 
+@timing.timed("chart")
 def display():
     """Display Scope 1 emissions visualizations."""
     col1, col2, col3 = st.columns(3)
     with col3:
-        global event_name
         if st.button("Refresh"):
-            event_name = get_latest_event()
-            st.rerun
+            invalidate()
+            st.rerun()
     with col1, col2:
         st.header("Emission Analysis")
 
     # Fetch and prepare data
+    event_name = current_event()
+    st.write(f"Event: {event_name}")
     data = fetch_data(event_name)
     if not data:
         st.warning("No data found.")
@@ -124,12 +104,12 @@ def display():
     column = st.selectbox("Select the column for analysis:", ["Consumption (kWh)", "Emission (kg CO₂)"])
 
     if plot_type == "Pie Chart":
-        fig = px.pie(df, values=column, names="Fuel Type", title=f"{column} Breakdown", hole=0.3)
+        fig = px.pie(fetch_fuel_totals(event_name), values=column, names="Fuel Type", title=f"{column} Breakdown", hole=0.3)
     elif plot_type == "Scatter":
         fig = px.scatter(df, x="Fuel Type", y=column, color="Emission (kg CO₂)",
                          title=f"{column} Distribution", template="plotly_dark")
     elif plot_type == "Bar Plot":
-        fig = px.bar(df, x="Fuel Type", y=column, color="Fuel Type", title=f"{column} Bar Chart")
+        fig = px.bar(fetch_fuel_totals(event_name), x="Fuel Type", y=column, color="Fuel Type", title=f"{column} Bar Chart")
 
     st.plotly_chart(fig, use_container_width=True)
 
@@ -1,40 +1,21 @@
-import os
 import streamlit as st
+import timing
 import sqlite3
+import db
+import queries
+from events import current_event, invalidate
 import pandas as pd
 import plotly.express as px
 import logging
-from streamlit_autorefresh import st_autorefresh
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR,"..", "..", "data", "emissions.db")
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
-############################## EVENT ##################################################
-def get_latest_event():
-    """Fetch the latest event name from the Events table."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute("SELECT name FROM Events ORDER BY id DESC LIMIT 1")
-    event = cursor.fetchone()
-    return event[0] if event else None
-
-
-
-######################################################################################
-
-
 def fetch_transport_data(event_name):
     """Fetch transport emissions data from the database."""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT mode, type, origin, destination, distance, Emission FROM transport_data WHERE event = ?", (event_name,))
-        data = cursor.fetchall()
-        conn.close()
-        return data
+        return db.fetchall(queries.TRANSPORT_BY_EVENT, (event_name,))
     except sqlite3.Error as e:
         st.error(f"Database error: {e}")
         logging.error(f"Error fetching transport data: {e}")
@@ -69,13 +50,14 @@ def display_descriptive_analytics(df):
     st.write("")
     st.write("")
 
+@timing.timed("chart")
 def transport_visual():
     """Display transport emissions visualizations."""
     st.subheader("🚗 Transport Emission Data")
-    global event_name
     if st.button("Refresh"):
-        event_name = get_latest_event()
+        invalidate()
         st.rerun()
+    event_name = current_event()
     st.write("Event: ", event_name)
 
     # Fetch data (cached)
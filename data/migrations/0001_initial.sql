@@ -0,0 +1,585 @@
+--------Events table----------------
+CREATE TABLE
+IF NOT EXISTS Events
+(
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL
+);
+
+--- Materials Table
+CREATE TABLE IF NOT EXISTS Materials (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event TEXT NOT NULL,
+    Category TEXT NOT NULL,
+    Weight REAL NOT NULL,
+    Quantity REAL NOT NULL,
+    Emission REAL NOT NULL,
+    Timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (event) REFERENCES Events(name) ON UPDATE CASCADE
+);
+
+-- Transport Emissions Table
+CREATE TABLE IF NOT EXISTS transport_data (
+                        event TEXT NOT NULL,
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        mode TEXT NOT NULL,
+                        type TEXT NOT NULL,
+                        origin TEXT NOT NULL,
+                        destination TEXT NOT NULL,
+                        distance REAL NOT NULL,
+                        Emission REAL NOT NULL);
+
+-- Electric Vehicles Consumption Table
+CREATE TABLE IF NOT EXISTS ElectricConsumption (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event TEXT NOT NULL,
+    Vehicle TEXT NOT NULL,
+    ConsumptionPerKm REAL NOT NULL,  -- kWh per km
+    Timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (event) REFERENCES Events(name) ON UPDATE CASCADE
+);
+
+-- Electricity Emissions Table
+CREATE TABLE IF NOT EXISTS ElectricityEmissions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event TEXT NOT NULL,
+    Usage TEXT NOT NULL,  -- Type of electricity use (e.g., Lighting, Cooling, Heating)
+    Value REAL NOT NULL,  -- Consumption in kWh
+    Emission REAL NOT NULL,  -- Emissions in kg CO₂
+    Timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (event) REFERENCES Events(name) ON UPDATE CASCADE
+);
+
+
+-- HVAC Emissions Table
+CREATE TABLE IF NOT EXISTS HVACEmissions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event TEXT NOT NULL,
+    Refrigerant TEXT NOT NULL,
+    MassLeak REAL NOT NULL,
+    Emission REAL NOT NULL,
+    Timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (event) REFERENCES Events(name) ON UPDATE CASCADE
+);
+
+------ Logistics Emissions Table
+CREATE TABLE IF NOT EXISTS logistics_emissions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    Event TEXT NOT NULL,
+    material TEXT NOT NULL,
+    transport_mode TEXT NOT NULL,
+    origin TEXT NOT NULL,
+    destination TEXT NOT NULL,
+    distance_km REAL NOT NULL,
+    weight_kg REAL NOT NULL,
+    total_emission REAL NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+
+
+-- Food Emissions Table
+CREATE TABLE IF NOT EXISTS food_choices (
+                        event TEXT NOT NULL,
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        session_id TEXT NOT NULL,
+                        dietary_pattern TEXT NOT NULL,
+                        food_item TEXT NOT NULL,
+                        emission REAL NOT NULL,
+                        FOREIGN KEY (event) REFERENCES Events(name) ON UPDATE CASCADE);
+
+
+
+-- Scope 1 Table
+CREATE TABLE IF NOT EXISTS Scope1 (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event TEXT NOT NULL,
+    fuels TEXT NOT NULL,  -- Store multiple fuel types as JSON
+    consumptions TEXT NOT NULL,  -- Store multiple consumption values as JSON
+    emissions TEXT NOT NULL,  -- Store multiple emissions as JSON
+    total_emission REAL NOT NULL,  -- Store total emission
+    Timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (event) REFERENCES Events(name) ON UPDATE CASCADE
+);
+
+
+
+
+---------------------------------------------------------------------------------------------------------
+
+CREATE TABLE IF NOT EXISTS EmissionsSummary (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    Event TEXT NOT NULL,
+    Category TEXT CHECK (Category IN ('Scope 1', 'Scope 2', 'Scope 3')) NOT NULL,
+    SourceTable TEXT NOT NULL,
+    Emission REAL NOT NULL,
+    FOREIGN KEY (Event) REFERENCES Events(name) ON UPDATE CASCADE
+);
+-- Trigger to insert into EmissionsSummary
+
+-- Scope 1 Emissions (HVAC and Scope1 Table)
+CREATE TRIGGER IF NOT EXISTS insert_scope1_emissions
+AFTER INSERT ON HVACEmissions
+FOR EACH ROW
+BEGIN
+    INSERT INTO EmissionsSummary (Event, Category, SourceTable, Emission)
+    VALUES (NEW.event, 'Scope 1', 'HVACEmissions', NEW.Emission);
+END;
+
+CREATE TRIGGER IF NOT EXISTS insert_scope1_emissions_scope1
+AFTER INSERT ON Scope1
+FOR EACH ROW
+BEGIN
+    INSERT INTO EmissionsSummary (Event, Category, SourceTable, Emission)
+    VALUES (NEW.event, 'Scope 1', 'Scope1', NEW.total_emission);
+END;
+
+-- Scope 2 Emissions (Electricity Consumption)
+CREATE TRIGGER IF NOT EXISTS insert_scope2_emissions
+AFTER INSERT ON ElectricityEmissions
+FOR EACH ROW
+BEGIN
+    INSERT INTO EmissionsSummary (Event, Category, SourceTable, Emission)
+    VALUES (NEW.event, 'Scope 2', 'ElectricityEmissions', NEW.Emission);
+END;
+
+-- Scope 3 Emissions (Transport, Food, Materials)
+CREATE TRIGGER IF NOT EXISTS insert_scope3_transport
+AFTER INSERT ON transport_data
+FOR EACH ROW
+BEGIN
+    INSERT INTO EmissionsSummary (Event, Category, SourceTable, Emission)
+    VALUES (NEW.event, 'Scope 3', 'transport_data', NEW.Emission);
+END;
+
+CREATE TRIGGER IF NOT EXISTS insert_scope3_materials
+AFTER INSERT ON Materials
+FOR EACH ROW
+BEGIN
+    INSERT INTO EmissionsSummary (Event, Category, SourceTable, Emission)
+    VALUES (NEW.event, 'Scope 3', 'Materials', NEW.Emission);
+END;
+
+CREATE TRIGGER IF NOT EXISTS insert_scope3_food
+AFTER INSERT ON food_choices
+FOR EACH ROW
+BEGIN
+    INSERT INTO EmissionsSummary (Event, Category, SourceTable, Emission)
+    VALUES (NEW.event, 'Scope 3', 'food_choices', NEW.emission);
+END;
+
+
+CREATE TRIGGER IF NOT EXISTS insert_scope3_logistics
+AFTER INSERT ON logistics_emissions
+FOR EACH ROW
+BEGIN
+    INSERT INTO EmissionsSummary (Event, Category, SourceTable, Emission)
+    VALUES (NEW.event, 'Scope 3', 'logistics_emissions', NEW.total_emission);
+END;
+
+
+---------------------------------------------------------------------------------------------------------
+-- Indexes for the per-event dashboard queries registered in queries.py.
+-- Narrow queries get covering indexes; pages that select whole rows use the
+-- event prefix to find them. Check plans with: python query_audit.py
+CREATE INDEX IF NOT EXISTS idx_scope1_event ON Scope1 (event);
+CREATE INDEX IF NOT EXISTS idx_hvac_event ON HVACEmissions (event);
+CREATE INDEX IF NOT EXISTS idx_electricity_event ON ElectricityEmissions (event);
+CREATE INDEX IF NOT EXISTS idx_materials_event_category ON Materials (event, Category);
+CREATE INDEX IF NOT EXISTS idx_transport_event ON transport_data (event, mode, distance, Emission);
+CREATE INDEX IF NOT EXISTS idx_food_event ON food_choices (event, dietary_pattern, food_item, emission);
+CREATE INDEX IF NOT EXISTS idx_logistics_event_created ON logistics_emissions (Event, created_at);
+
+---------------------------------------------------------------------------------------------------------
+-- Keep EmissionsSummary in step when submissions are corrected or removed.
+-- Summary rows carry no source id, so one row with the same event, source
+-- and emission stands in for the changed record; such rows are identical.
+CREATE INDEX IF NOT EXISTS idx_summary_event_source ON EmissionsSummary (Event, SourceTable, Emission);
+
+CREATE TRIGGER IF NOT EXISTS update_summary_HVACEmissions
+AFTER UPDATE OF event, Emission ON HVACEmissions
+FOR EACH ROW
+BEGIN
+    UPDATE EmissionsSummary SET Event = NEW.event, Emission = NEW.Emission
+    WHERE id = (SELECT id FROM EmissionsSummary
+                WHERE Event = OLD.event AND SourceTable = 'HVACEmissions' AND Emission = OLD.Emission LIMIT 1);
+END;
+
+CREATE TRIGGER IF NOT EXISTS delete_summary_HVACEmissions
+AFTER DELETE ON HVACEmissions
+FOR EACH ROW
+BEGIN
+    DELETE FROM EmissionsSummary
+    WHERE id = (SELECT id FROM EmissionsSummary
+                WHERE Event = OLD.event AND SourceTable = 'HVACEmissions' AND Emission = OLD.Emission LIMIT 1);
+END;
+
+CREATE TRIGGER IF NOT EXISTS update_summary_Scope1
+AFTER UPDATE OF event, total_emission ON Scope1
+FOR EACH ROW
+BEGIN
+    UPDATE EmissionsSummary SET Event = NEW.event, Emission = NEW.total_emission
+    WHERE id = (SELECT id FROM EmissionsSummary
+                WHERE Event = OLD.event AND SourceTable = 'Scope1' AND Emission = OLD.total_emission LIMIT 1);
+END;
+
+CREATE TRIGGER IF NOT EXISTS delete_summary_Scope1
+AFTER DELETE ON Scope1
+FOR EACH ROW
+BEGIN
+    DELETE FROM EmissionsSummary
+    WHERE id = (SELECT id FROM EmissionsSummary
+                WHERE Event = OLD.event AND SourceTable = 'Scope1' AND Emission = OLD.total_emission LIMIT 1);
+END;
+
+CREATE TRIGGER IF NOT EXISTS update_summary_ElectricityEmissions
+AFTER UPDATE OF event, Emission ON ElectricityEmissions
+FOR EACH ROW
+BEGIN
+    UPDATE EmissionsSummary SET Event = NEW.event, Emission = NEW.Emission
+    WHERE id = (SELECT id FROM EmissionsSummary
+                WHERE Event = OLD.event AND SourceTable = 'ElectricityEmissions' AND Emission = OLD.Emission LIMIT 1);
+END;
+
+CREATE TRIGGER IF NOT EXISTS delete_summary_ElectricityEmissions
+AFTER DELETE ON ElectricityEmissions
+FOR EACH ROW
+BEGIN
+    DELETE FROM EmissionsSummary
+    WHERE id = (SELECT id FROM EmissionsSummary
+                WHERE Event = OLD.event AND SourceTable = 'ElectricityEmissions' AND Emission = OLD.Emission LIMIT 1);
+END;
+
+CREATE TRIGGER IF NOT EXISTS update_summary_transport_data
+AFTER UPDATE OF event, Emission ON transport_data
+FOR EACH ROW
+BEGIN
+    UPDATE EmissionsSummary SET Event = NEW.event, Emission = NEW.Emission
+    WHERE id = (SELECT id FROM EmissionsSummary
+                WHERE Event = OLD.event AND SourceTable = 'transport_data' AND Emission = OLD.Emission LIMIT 1);
+END;
+
+CREATE TRIGGER IF NOT EXISTS delete_summary_transport_data
+AFTER DELETE ON transport_data
+FOR EACH ROW
+BEGIN
+    DELETE FROM EmissionsSummary
+    WHERE id = (SELECT id FROM EmissionsSummary
+                WHERE Event = OLD.event AND SourceTable = 'transport_data' AND Emission = OLD.Emission LIMIT 1);
+END;
+
+CREATE TRIGGER IF NOT EXISTS update_summary_Materials
+AFTER UPDATE OF event, Emission ON Materials
+FOR EACH ROW
+BEGIN
+    UPDATE EmissionsSummary SET Event = NEW.event, Emission = NEW.Emission
+    WHERE id = (SELECT id FROM EmissionsSummary
+                WHERE Event = OLD.event AND SourceTable = 'Materials' AND Emission = OLD.Emission LIMIT 1);
+END;
+
+CREATE TRIGGER IF NOT EXISTS delete_summary_Materials
+AFTER DELETE ON Materials
+FOR EACH ROW
+BEGIN
+    DELETE FROM EmissionsSummary
+    WHERE id = (SELECT id FROM EmissionsSummary
+                WHERE Event = OLD.event AND SourceTable = 'Materials' AND Emission = OLD.Emission LIMIT 1);
+END;
+
+CREATE TRIGGER IF NOT EXISTS update_summary_food_choices
+AFTER UPDATE OF event, emission ON food_choices
+FOR EACH ROW
+BEGIN
+    UPDATE EmissionsSummary SET Event = NEW.event, Emission = NEW.emission
+    WHERE id = (SELECT id FROM EmissionsSummary
+                WHERE Event = OLD.event AND SourceTable = 'food_choices' AND Emission = OLD.emission LIMIT 1);
+END;
+
+CREATE TRIGGER IF NOT EXISTS delete_summary_food_choices
+AFTER DELETE ON food_choices
+FOR EACH ROW
+BEGIN
+    DELETE FROM EmissionsSummary
+    WHERE id = (SELECT id FROM EmissionsSummary
+                WHERE Event = OLD.event AND SourceTable = 'food_choices' AND Emission = OLD.emission LIMIT 1);
+END;
+
+CREATE TRIGGER IF NOT EXISTS update_summary_logistics_emissions
+AFTER UPDATE OF Event, total_emission ON logistics_emissions
+FOR EACH ROW
+BEGIN
+    UPDATE EmissionsSummary SET Event = NEW.Event, Emission = NEW.total_emission
+    WHERE id = (SELECT id FROM EmissionsSummary
+                WHERE Event = OLD.Event AND SourceTable = 'logistics_emissions' AND Emission = OLD.total_emission LIMIT 1);
+END;
+
+CREATE TRIGGER IF NOT EXISTS delete_summary_logistics_emissions
+AFTER DELETE ON logistics_emissions
+FOR EACH ROW
+BEGIN
+    DELETE FROM EmissionsSummary
+    WHERE id = (SELECT id FROM EmissionsSummary
+                WHERE Event = OLD.Event AND SourceTable = 'logistics_emissions' AND Emission = OLD.total_emission LIMIT 1);
+END;
+
+---------------------------------------------------------------------------------------------------------
+-- Per-event totals by scope and source, maintained incrementally from
+-- EmissionsSummary so dashboards read one row per source instead of
+-- aggregating every submission on each rerun.
+CREATE TABLE IF NOT EXISTS EventEmissionTotals (
+    Event TEXT NOT NULL,
+    Category TEXT NOT NULL,
+    SourceTable TEXT NOT NULL,
+    Total REAL NOT NULL,
+    Entries INTEGER NOT NULL,
+    MinEmission REAL,
+    MaxEmission REAL,
+    LastUpdated DATETIME,
+    PRIMARY KEY (Event, Category, SourceTable)
+);
+
+-- One-off backfill for databases created before the aggregate existed
+INSERT INTO EventEmissionTotals (Event, Category, SourceTable, Total, Entries, MinEmission, MaxEmission, LastUpdated)
+SELECT Event, Category, SourceTable, SUM(Emission), COUNT(*), MIN(Emission), MAX(Emission), CURRENT_TIMESTAMP
+FROM EmissionsSummary
+WHERE NOT EXISTS (SELECT 1 FROM EventEmissionTotals)
+GROUP BY Event, Category, SourceTable;
+
+CREATE TRIGGER IF NOT EXISTS totals_after_insert
+AFTER INSERT ON EmissionsSummary
+FOR EACH ROW
+BEGIN
+    INSERT INTO EventEmissionTotals (Event, Category, SourceTable, Total, Entries, MinEmission, MaxEmission, LastUpdated)
+    VALUES (NEW.Event, NEW.Category, NEW.SourceTable, NEW.Emission, 1, NEW.Emission, NEW.Emission, CURRENT_TIMESTAMP)
+    ON CONFLICT (Event, Category, SourceTable) DO UPDATE SET
+        Total = Total + excluded.Total,
+        Entries = Entries + 1,
+        MinEmission = MIN(MinEmission, excluded.MinEmission),
+        MaxEmission = MAX(MaxEmission, excluded.MaxEmission),
+        LastUpdated = excluded.LastUpdated;
+END;
+
+CREATE TRIGGER IF NOT EXISTS totals_after_delete
+AFTER DELETE ON EmissionsSummary
+FOR EACH ROW
+BEGIN
+    UPDATE EventEmissionTotals SET
+        Total = Total - OLD.Emission,
+        Entries = Entries - 1,
+        MinEmission = (SELECT MIN(Emission) FROM EmissionsSummary
+                       WHERE Event = OLD.Event AND SourceTable = OLD.SourceTable AND Category = OLD.Category),
+        MaxEmission = (SELECT MAX(Emission) FROM EmissionsSummary
+                       WHERE Event = OLD.Event AND SourceTable = OLD.SourceTable AND Category = OLD.Category),
+        LastUpdated = CURRENT_TIMESTAMP
+    WHERE Event = OLD.Event AND Category = OLD.Category AND SourceTable = OLD.SourceTable;
+    DELETE FROM EventEmissionTotals
+    WHERE Event = OLD.Event AND Category = OLD.Category AND SourceTable = OLD.SourceTable AND Entries <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS totals_after_update
+AFTER UPDATE ON EmissionsSummary
+FOR EACH ROW
+BEGIN
+    UPDATE EventEmissionTotals SET
+        Total = Total - OLD.Emission,
+        Entries = Entries - 1,
+        MinEmission = (SELECT MIN(Emission) FROM EmissionsSummary
+                       WHERE Event = OLD.Event AND SourceTable = OLD.SourceTable AND Category = OLD.Category),
+        MaxEmission = (SELECT MAX(Emission) FROM EmissionsSummary
+                       WHERE Event = OLD.Event AND SourceTable = OLD.SourceTable AND Category = OLD.Category),
+        LastUpdated = CURRENT_TIMESTAMP
+    WHERE Event = OLD.Event AND Category = OLD.Category AND SourceTable = OLD.SourceTable;
+    DELETE FROM EventEmissionTotals
+    WHERE Event = OLD.Event AND Category = OLD.Category AND SourceTable = OLD.SourceTable AND Entries <= 0;
+    INSERT INTO EventEmissionTotals (Event, Category, SourceTable, Total, Entries, MinEmission, MaxEmission, LastUpdated)
+    VALUES (NEW.Event, NEW.Category, NEW.SourceTable, NEW.Emission, 1, NEW.Emission, NEW.Emission, CURRENT_TIMESTAMP)
+    ON CONFLICT (Event, Category, SourceTable) DO UPDATE SET
+        Total = Total + excluded.Total,
+        Entries = Entries + 1,
+        MinEmission = MIN(MinEmission, excluded.MinEmission),
+        MaxEmission = MAX(MaxEmission, excluded.MaxEmission),
+        LastUpdated = excluded.LastUpdated;
+END;
+
+
+---------------------------------------------------------------------------------------------------------
+-- Data version counters: one row per source table, bumped by the triggers
+-- below on every write. Dashboards poll SUM(version) and only rerun when it
+-- moves, instead of re-running every query on a timer.
+CREATE TABLE IF NOT EXISTS DataVersion (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO DataVersion (name) VALUES
+    ('Events'),
+    ('Materials'),
+    ('transport_data'),
+    ('ElectricConsumption'),
+    ('ElectricityEmissions'),
+    ('HVACEmissions'),
+    ('logistics_emissions'),
+    ('food_choices'),
+    ('Scope1');
+
+CREATE TRIGGER IF NOT EXISTS bump_version_Events_insert
+AFTER INSERT ON Events
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'Events';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_Events_update
+AFTER UPDATE ON Events
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'Events';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_Events_delete
+AFTER DELETE ON Events
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'Events';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_Materials_insert
+AFTER INSERT ON Materials
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'Materials';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_Materials_update
+AFTER UPDATE ON Materials
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'Materials';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_Materials_delete
+AFTER DELETE ON Materials
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'Materials';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_transport_data_insert
+AFTER INSERT ON transport_data
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'transport_data';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_transport_data_update
+AFTER UPDATE ON transport_data
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'transport_data';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_transport_data_delete
+AFTER DELETE ON transport_data
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'transport_data';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_ElectricConsumption_insert
+AFTER INSERT ON ElectricConsumption
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'ElectricConsumption';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_ElectricConsumption_update
+AFTER UPDATE ON ElectricConsumption
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'ElectricConsumption';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_ElectricConsumption_delete
+AFTER DELETE ON ElectricConsumption
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'ElectricConsumption';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_ElectricityEmissions_insert
+AFTER INSERT ON ElectricityEmissions
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'ElectricityEmissions';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_ElectricityEmissions_update
+AFTER UPDATE ON ElectricityEmissions
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'ElectricityEmissions';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_ElectricityEmissions_delete
+AFTER DELETE ON ElectricityEmissions
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'ElectricityEmissions';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_HVACEmissions_insert
+AFTER INSERT ON HVACEmissions
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'HVACEmissions';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_HVACEmissions_update
+AFTER UPDATE ON HVACEmissions
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'HVACEmissions';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_HVACEmissions_delete
+AFTER DELETE ON HVACEmissions
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'HVACEmissions';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_logistics_emissions_insert
+AFTER INSERT ON logistics_emissions
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'logistics_emissions';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_logistics_emissions_update
+AFTER UPDATE ON logistics_emissions
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'logistics_emissions';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_logistics_emissions_delete
+AFTER DELETE ON logistics_emissions
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'logistics_emissions';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_food_choices_insert
+AFTER INSERT ON food_choices
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'food_choices';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_food_choices_update
+AFTER UPDATE ON food_choices
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'food_choices';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_food_choices_delete
+AFTER DELETE ON food_choices
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'food_choices';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_Scope1_insert
+AFTER INSERT ON Scope1
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'Scope1';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_Scope1_update
+AFTER UPDATE ON Scope1
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'Scope1';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_version_Scope1_delete
+AFTER DELETE ON Scope1
+BEGIN
+    UPDATE DataVersion SET version = version + 1 WHERE name = 'Scope1';
+END;
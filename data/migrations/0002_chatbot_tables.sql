@@ -0,0 +1,89 @@
+-- Tables the chatbot reads. Older databases already have MasterEmissions
+-- and its Insert_* triggers, so everything here is IF NOT EXISTS.
+
+-- Master Emissions Table (flat copy of every submission)
+CREATE TABLE IF NOT EXISTS MasterEmissions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    SourceTable TEXT NOT NULL,
+    Category TEXT NOT NULL,
+    Event TEXT,
+    Description TEXT NOT NULL,
+    Quantity REAL NOT NULL,
+    Weight REAL NOT NULL,
+    Emission REAL NOT NULL,
+    Timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_master_category ON MasterEmissions (Category, Emission);
+CREATE INDEX IF NOT EXISTS idx_master_source ON MasterEmissions (SourceTable, Emission);
+
+CREATE TRIGGER IF NOT EXISTS Insert_MaterialsEmissions
+AFTER INSERT ON Materials
+BEGIN
+    INSERT INTO MasterEmissions
+        (SourceTable, Category, Event, Description, Quantity, Weight, Emission, Timestamp)
+    VALUES
+        ('Materials', 'Scope3', NEW.event, NEW.Category, NEW.Quantity, NEW.Weight, NEW.Emission, CURRENT_TIMESTAMP);
+END;
+
+CREATE TRIGGER IF NOT EXISTS Insert_ElectricityEmissions
+AFTER INSERT ON ElectricityEmissions
+BEGIN
+    INSERT INTO MasterEmissions
+        (SourceTable, Category, Event, Description, Quantity, Weight, Emission, Timestamp)
+    VALUES
+        ('ElectricityEmissions', 'Scope2', NEW.event, NEW.Usage, NEW.Value, 0, NEW.Emission, CURRENT_TIMESTAMP);
+END;
+
+CREATE TRIGGER IF NOT EXISTS Insert_HVACEmissions
+AFTER INSERT ON HVACEmissions
+BEGIN
+    INSERT INTO MasterEmissions
+        (SourceTable, Category, Event, Description, Quantity, Weight, Emission, Timestamp)
+    VALUES
+        ('HVACEmissions', 'Scope2', NEW.event, NEW.Refrigerant, NEW.MassLeak, 0, NEW.Emission, CURRENT_TIMESTAMP);
+END;
+
+CREATE TRIGGER IF NOT EXISTS Insert_Scope1
+AFTER INSERT ON Scope1
+BEGIN
+    INSERT INTO MasterEmissions (SourceTable, Category, Event, Description, Quantity, Weight, Emission, Timestamp)
+    SELECT
+        'Scope1',
+        'Scope1',
+        NEW.event,
+        fuels.value,
+        consumptions.value,
+        0,
+        emissions.value,
+        CURRENT_TIMESTAMP
+    FROM json_each(NEW.fuels) AS fuels
+    JOIN json_each(NEW.consumptions) AS consumptions ON fuels.key = consumptions.key
+    JOIN json_each(NEW.emissions) AS emissions ON fuels.key = emissions.key;
+END;
+
+CREATE TRIGGER IF NOT EXISTS Insert_ElectricConsumption
+AFTER INSERT ON ElectricConsumption
+BEGIN
+    INSERT INTO MasterEmissions
+        (SourceTable, Category, Event, Description, Quantity, Weight, Emission, Timestamp)
+    VALUES
+        ('ElectricConsumption', 'Scope2', NEW.Event, NEW.Vehicle, NEW.ConsumptionPerKm, 0, 0, CURRENT_TIMESTAMP);
+END;
+
+---------------------------------------------------------------------------------------------------------
+-- Reduction tips shown by the chatbot
+CREATE TABLE IF NOT EXISTS reduction_tips_table (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    tip TEXT NOT NULL UNIQUE
+);
+
+INSERT OR IGNORE INTO reduction_tips_table (tip) VALUES
+    ('Use public transportation instead of driving alone'),
+    ('Switch to LED light bulbs'),
+    ('Reduce meat consumption, especially beef'),
+    ('Buy locally produced goods when possible'),
+    ('Use a programmable thermostat to reduce energy use'),
+    ('Properly insulate your home'),
+    ('Reduce, reuse, recycle in that order'),
+    ('Consider offsetting your carbon footprint through verified programs');
@@ -0,0 +1,48 @@
+-- One row per fuel of a Scope 1 submission. The JSON arrays on Scope1 stay
+-- as submitted; these triggers expand them in the same transaction so
+-- per-fuel analysis is a plain GROUP BY instead of JSON parsing in Python.
+CREATE TABLE IF NOT EXISTS Scope1Lines (
+    scope1_id INTEGER NOT NULL REFERENCES Scope1(id) ON DELETE CASCADE,
+    line_no INTEGER NOT NULL,  -- position in the submitted arrays
+    fuel TEXT NOT NULL,
+    consumption REAL NOT NULL,
+    emission REAL NOT NULL,
+    PRIMARY KEY (scope1_id, line_no)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS scope1_lines_after_insert
+AFTER INSERT ON Scope1
+BEGIN
+    INSERT INTO Scope1Lines (scope1_id, line_no, fuel, consumption, emission)
+    SELECT NEW.id, fuels.key, fuels.value, consumptions.value, emissions.value
+    FROM json_each(NEW.fuels) AS fuels
+    JOIN json_each(NEW.consumptions) AS consumptions ON fuels.key = consumptions.key
+    JOIN json_each(NEW.emissions) AS emissions ON fuels.key = emissions.key;
+END;
+
+CREATE TRIGGER IF NOT EXISTS scope1_lines_after_update
+AFTER UPDATE OF fuels, consumptions, emissions ON Scope1
+BEGIN
+    DELETE FROM Scope1Lines WHERE scope1_id = OLD.id;
+    INSERT INTO Scope1Lines (scope1_id, line_no, fuel, consumption, emission)
+    SELECT NEW.id, fuels.key, fuels.value, consumptions.value, emissions.value
+    FROM json_each(NEW.fuels) AS fuels
+    JOIN json_each(NEW.consumptions) AS consumptions ON fuels.key = consumptions.key
+    JOIN json_each(NEW.emissions) AS emissions ON fuels.key = emissions.key;
+END;
+
+-- Foreign keys are not enforced, so the cascade is done here
+CREATE TRIGGER IF NOT EXISTS scope1_lines_after_delete
+AFTER DELETE ON Scope1
+BEGIN
+    DELETE FROM Scope1Lines WHERE scope1_id = OLD.id;
+END;
+
+-- Backfill submissions made before the table existed
+INSERT OR IGNORE INTO Scope1Lines (scope1_id, line_no, fuel, consumption, emission)
+SELECT s.id, fuels.key, fuels.value, consumptions.value, emissions.value
+FROM Scope1 AS s
+JOIN json_each(s.fuels) AS fuels
+JOIN json_each(s.consumptions) AS consumptions ON fuels.key = consumptions.key
+JOIN json_each(s.emissions) AS emissions ON fuels.key = emissions.key
+WHERE json_valid(s.fuels) AND json_valid(s.consumptions) AND json_valid(s.emissions);
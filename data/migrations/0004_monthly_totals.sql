@@ -0,0 +1,242 @@
+-- Per-event totals by calendar month, scope and source, so chatbot answers
+-- for an event or a period read only that slice through the primary key or
+-- the Month index instead of grouping every submission by strftime().
+-- Each dated source table keeps it current with its own date column, so an
+-- entry counts in the month it was recorded. Attendee travel and food
+-- entries carry no date and have no monthly totals.
+CREATE TABLE IF NOT EXISTS EventMonthlyTotals (
+    Event TEXT NOT NULL,
+    Month TEXT NOT NULL,  -- 'YYYY-MM'
+    Category TEXT NOT NULL,
+    SourceTable TEXT NOT NULL,
+    Total REAL NOT NULL,
+    Entries INTEGER NOT NULL,
+    PRIMARY KEY (Event, Month, Category, SourceTable)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_monthly_month ON EventMonthlyTotals (Month, Category, SourceTable, Total);
+
+-- Fuel questions for a period filter Scope1 by date
+CREATE INDEX IF NOT EXISTS idx_scope1_timestamp ON Scope1 (Timestamp);
+
+-- Backfill entries made before the table existed
+INSERT INTO EventMonthlyTotals (Event, Month, Category, SourceTable, Total, Entries)
+SELECT Event, Month, Category, SourceTable, SUM(Emission), COUNT(*)
+FROM (
+    SELECT event AS Event, strftime('%Y-%m', Timestamp) AS Month, 'Scope 1' AS Category,
+           'Scope1' AS SourceTable, total_emission AS Emission FROM Scope1
+    UNION ALL
+    SELECT event AS Event, strftime('%Y-%m', Timestamp) AS Month, 'Scope 1' AS Category,
+           'HVACEmissions' AS SourceTable, Emission AS Emission FROM HVACEmissions
+    UNION ALL
+    SELECT event AS Event, strftime('%Y-%m', Timestamp) AS Month, 'Scope 2' AS Category,
+           'ElectricityEmissions' AS SourceTable, Emission AS Emission FROM ElectricityEmissions
+    UNION ALL
+    SELECT event AS Event, strftime('%Y-%m', Timestamp) AS Month, 'Scope 3' AS Category,
+           'Materials' AS SourceTable, Emission AS Emission FROM Materials
+    UNION ALL
+    SELECT Event AS Event, strftime('%Y-%m', created_at) AS Month, 'Scope 3' AS Category,
+           'logistics_emissions' AS SourceTable, total_emission AS Emission FROM logistics_emissions)
+WHERE Event IS NOT NULL AND Month IS NOT NULL
+GROUP BY Event, Month, Category, SourceTable
+ON CONFLICT (Event, Month, Category, SourceTable) DO NOTHING;
+
+-- Scope1
+CREATE TRIGGER IF NOT EXISTS monthly_after_insert_Scope1
+AFTER INSERT ON Scope1
+BEGIN
+    INSERT INTO EventMonthlyTotals (Event, Month, Category, SourceTable, Total, Entries)
+    SELECT NEW.event, strftime('%Y-%m', NEW.Timestamp), 'Scope 1', 'Scope1', NEW.total_emission, 1
+    WHERE NEW.event IS NOT NULL AND strftime('%Y-%m', NEW.Timestamp) IS NOT NULL
+    ON CONFLICT (Event, Month, Category, SourceTable) DO UPDATE SET
+        Total = Total + excluded.Total,
+        Entries = Entries + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS monthly_after_delete_Scope1
+AFTER DELETE ON Scope1
+BEGIN
+    UPDATE EventMonthlyTotals SET Total = Total - OLD.total_emission, Entries = Entries - 1
+    WHERE Event = OLD.event AND Month = strftime('%Y-%m', OLD.Timestamp)
+      AND Category = 'Scope 1' AND SourceTable = 'Scope1';
+    DELETE FROM EventMonthlyTotals
+    WHERE Event = OLD.event AND Month = strftime('%Y-%m', OLD.Timestamp)
+      AND Category = 'Scope 1' AND SourceTable = 'Scope1' AND Entries <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS monthly_after_update_Scope1
+AFTER UPDATE OF event, total_emission, Timestamp ON Scope1
+BEGIN
+    UPDATE EventMonthlyTotals SET Total = Total - OLD.total_emission, Entries = Entries - 1
+    WHERE Event = OLD.event AND Month = strftime('%Y-%m', OLD.Timestamp)
+      AND Category = 'Scope 1' AND SourceTable = 'Scope1';
+    DELETE FROM EventMonthlyTotals
+    WHERE Event = OLD.event AND Month = strftime('%Y-%m', OLD.Timestamp)
+      AND Category = 'Scope 1' AND SourceTable = 'Scope1' AND Entries <= 0;
+    INSERT INTO EventMonthlyTotals (Event, Month, Category, SourceTable, Total, Entries)
+    SELECT NEW.event, strftime('%Y-%m', NEW.Timestamp), 'Scope 1', 'Scope1', NEW.total_emission, 1
+    WHERE NEW.event IS NOT NULL AND strftime('%Y-%m', NEW.Timestamp) IS NOT NULL
+    ON CONFLICT (Event, Month, Category, SourceTable) DO UPDATE SET
+        Total = Total + excluded.Total,
+        Entries = Entries + 1;
+END;
+
+-- HVACEmissions
+CREATE TRIGGER IF NOT EXISTS monthly_after_insert_HVACEmissions
+AFTER INSERT ON HVACEmissions
+BEGIN
+    INSERT INTO EventMonthlyTotals (Event, Month, Category, SourceTable, Total, Entries)
+    SELECT NEW.event, strftime('%Y-%m', NEW.Timestamp), 'Scope 1', 'HVACEmissions', NEW.Emission, 1
+    WHERE NEW.event IS NOT NULL AND strftime('%Y-%m', NEW.Timestamp) IS NOT NULL
+    ON CONFLICT (Event, Month, Category, SourceTable) DO UPDATE SET
+        Total = Total + excluded.Total,
+        Entries = Entries + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS monthly_after_delete_HVACEmissions
+AFTER DELETE ON HVACEmissions
+BEGIN
+    UPDATE EventMonthlyTotals SET Total = Total - OLD.Emission, Entries = Entries - 1
+    WHERE Event = OLD.event AND Month = strftime('%Y-%m', OLD.Timestamp)
+      AND Category = 'Scope 1' AND SourceTable = 'HVACEmissions';
+    DELETE FROM EventMonthlyTotals
+    WHERE Event = OLD.event AND Month = strftime('%Y-%m', OLD.Timestamp)
+      AND Category = 'Scope 1' AND SourceTable = 'HVACEmissions' AND Entries <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS monthly_after_update_HVACEmissions
+AFTER UPDATE OF event, Emission, Timestamp ON HVACEmissions
+BEGIN
+    UPDATE EventMonthlyTotals SET Total = Total - OLD.Emission, Entries = Entries - 1
+    WHERE Event = OLD.event AND Month = strftime('%Y-%m', OLD.Timestamp)
+      AND Category = 'Scope 1' AND SourceTable = 'HVACEmissions';
+    DELETE FROM EventMonthlyTotals
+    WHERE Event = OLD.event AND Month = strftime('%Y-%m', OLD.Timestamp)
+      AND Category = 'Scope 1' AND SourceTable = 'HVACEmissions' AND Entries <= 0;
+    INSERT INTO EventMonthlyTotals (Event, Month, Category, SourceTable, Total, Entries)
+    SELECT NEW.event, strftime('%Y-%m', NEW.Timestamp), 'Scope 1', 'HVACEmissions', NEW.Emission, 1
+    WHERE NEW.event IS NOT NULL AND strftime('%Y-%m', NEW.Timestamp) IS NOT NULL
+    ON CONFLICT (Event, Month, Category, SourceTable) DO UPDATE SET
+        Total = Total + excluded.Total,
+        Entries = Entries + 1;
+END;
+
+-- ElectricityEmissions
+CREATE TRIGGER IF NOT EXISTS monthly_after_insert_ElectricityEmissions
+AFTER INSERT ON ElectricityEmissions
+BEGIN
+    INSERT INTO EventMonthlyTotals (Event, Month, Category, SourceTable, Total, Entries)
+    SELECT NEW.event, strftime('%Y-%m', NEW.Timestamp), 'Scope 2', 'ElectricityEmissions', NEW.Emission, 1
+    WHERE NEW.event IS NOT NULL AND strftime('%Y-%m', NEW.Timestamp) IS NOT NULL
+    ON CONFLICT (Event, Month, Category, SourceTable) DO UPDATE SET
+        Total = Total + excluded.Total,
+        Entries = Entries + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS monthly_after_delete_ElectricityEmissions
+AFTER DELETE ON ElectricityEmissions
+BEGIN
+    UPDATE EventMonthlyTotals SET Total = Total - OLD.Emission, Entries = Entries - 1
+    WHERE Event = OLD.event AND Month = strftime('%Y-%m', OLD.Timestamp)
+      AND Category = 'Scope 2' AND SourceTable = 'ElectricityEmissions';
+    DELETE FROM EventMonthlyTotals
+    WHERE Event = OLD.event AND Month = strftime('%Y-%m', OLD.Timestamp)
+      AND Category = 'Scope 2' AND SourceTable = 'ElectricityEmissions' AND Entries <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS monthly_after_update_ElectricityEmissions
+AFTER UPDATE OF event, Emission, Timestamp ON ElectricityEmissions
+BEGIN
+    UPDATE EventMonthlyTotals SET Total = Total - OLD.Emission, Entries = Entries - 1
+    WHERE Event = OLD.event AND Month = strftime('%Y-%m', OLD.Timestamp)
+      AND Category = 'Scope 2' AND SourceTable = 'ElectricityEmissions';
+    DELETE FROM EventMonthlyTotals
+    WHERE Event = OLD.event AND Month = strftime('%Y-%m', OLD.Timestamp)
+      AND Category = 'Scope 2' AND SourceTable = 'ElectricityEmissions' AND Entries <= 0;
+    INSERT INTO EventMonthlyTotals (Event, Month, Category, SourceTable, Total, Entries)
+    SELECT NEW.event, strftime('%Y-%m', NEW.Timestamp), 'Scope 2', 'ElectricityEmissions', NEW.Emission, 1
+    WHERE NEW.event IS NOT NULL AND strftime('%Y-%m', NEW.Timestamp) IS NOT NULL
+    ON CONFLICT (Event, Month, Category, SourceTable) DO UPDATE SET
+        Total = Total + excluded.Total,
+        Entries = Entries + 1;
+END;
+
+-- Materials
+CREATE TRIGGER IF NOT EXISTS monthly_after_insert_Materials
+AFTER INSERT ON Materials
+BEGIN
+    INSERT INTO EventMonthlyTotals (Event, Month, Category, SourceTable, Total, Entries)
+    SELECT NEW.event, strftime('%Y-%m', NEW.Timestamp), 'Scope 3', 'Materials', NEW.Emission, 1
+    WHERE NEW.event IS NOT NULL AND strftime('%Y-%m', NEW.Timestamp) IS NOT NULL
+    ON CONFLICT (Event, Month, Category, SourceTable) DO UPDATE SET
+        Total = Total + excluded.Total,
+        Entries = Entries + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS monthly_after_delete_Materials
+AFTER DELETE ON Materials
+BEGIN
+    UPDATE EventMonthlyTotals SET Total = Total - OLD.Emission, Entries = Entries - 1
+    WHERE Event = OLD.event AND Month = strftime('%Y-%m', OLD.Timestamp)
+      AND Category = 'Scope 3' AND SourceTable = 'Materials';
+    DELETE FROM EventMonthlyTotals
+    WHERE Event = OLD.event AND Month = strftime('%Y-%m', OLD.Timestamp)
+      AND Category = 'Scope 3' AND SourceTable = 'Materials' AND Entries <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS monthly_after_update_Materials
+AFTER UPDATE OF event, Emission, Timestamp ON Materials
+BEGIN
+    UPDATE EventMonthlyTotals SET Total = Total - OLD.Emission, Entries = Entries - 1
+    WHERE Event = OLD.event AND Month = strftime('%Y-%m', OLD.Timestamp)
+      AND Category = 'Scope 3' AND SourceTable = 'Materials';
+    DELETE FROM EventMonthlyTotals
+    WHERE Event = OLD.event AND Month = strftime('%Y-%m', OLD.Timestamp)
+      AND Category = 'Scope 3' AND SourceTable = 'Materials' AND Entries <= 0;
+    INSERT INTO EventMonthlyTotals (Event, Month, Category, SourceTable, Total, Entries)
+    SELECT NEW.event, strftime('%Y-%m', NEW.Timestamp), 'Scope 3', 'Materials', NEW.Emission, 1
+    WHERE NEW.event IS NOT NULL AND strftime('%Y-%m', NEW.Timestamp) IS NOT NULL
+    ON CONFLICT (Event, Month, Category, SourceTable) DO UPDATE SET
+        Total = Total + excluded.Total,
+        Entries = Entries + 1;
+END;
+
+-- logistics_emissions
+CREATE TRIGGER IF NOT EXISTS monthly_after_insert_logistics_emissions
+AFTER INSERT ON logistics_emissions
+BEGIN
+    INSERT INTO EventMonthlyTotals (Event, Month, Category, SourceTable, Total, Entries)
+    SELECT NEW.Event, strftime('%Y-%m', NEW.created_at), 'Scope 3', 'logistics_emissions', NEW.total_emission, 1
+    WHERE NEW.Event IS NOT NULL AND strftime('%Y-%m', NEW.created_at) IS NOT NULL
+    ON CONFLICT (Event, Month, Category, SourceTable) DO UPDATE SET
+        Total = Total + excluded.Total,
+        Entries = Entries + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS monthly_after_delete_logistics_emissions
+AFTER DELETE ON logistics_emissions
+BEGIN
+    UPDATE EventMonthlyTotals SET Total = Total - OLD.total_emission, Entries = Entries - 1
+    WHERE Event = OLD.Event AND Month = strftime('%Y-%m', OLD.created_at)
+      AND Category = 'Scope 3' AND SourceTable = 'logistics_emissions';
+    DELETE FROM EventMonthlyTotals
+    WHERE Event = OLD.Event AND Month = strftime('%Y-%m', OLD.created_at)
+      AND Category = 'Scope 3' AND SourceTable = 'logistics_emissions' AND Entries <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS monthly_after_update_logistics_emissions
+AFTER UPDATE OF Event, total_emission, created_at ON logistics_emissions
+BEGIN
+    UPDATE EventMonthlyTotals SET Total = Total - OLD.total_emission, Entries = Entries - 1
+    WHERE Event = OLD.Event AND Month = strftime('%Y-%m', OLD.created_at)
+      AND Category = 'Scope 3' AND SourceTable = 'logistics_emissions';
+    DELETE FROM EventMonthlyTotals
+    WHERE Event = OLD.Event AND Month = strftime('%Y-%m', OLD.created_at)
+      AND Category = 'Scope 3' AND SourceTable = 'logistics_emissions' AND Entries <= 0;
+    INSERT INTO EventMonthlyTotals (Event, Month, Category, SourceTable, Total, Entries)
+    SELECT NEW.Event, strftime('%Y-%m', NEW.created_at), 'Scope 3', 'logistics_emissions', NEW.total_emission, 1
+    WHERE NEW.Event IS NOT NULL AND strftime('%Y-%m', NEW.created_at) IS NOT NULL
+    ON CONFLICT (Event, Month, Category, SourceTable) DO UPDATE SET
+        Total = Total + excluded.Total,
+        Entries = Entries + 1;
+END;
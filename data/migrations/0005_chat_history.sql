@@ -0,0 +1,13 @@
+-- Sidebar chatbot history, one row per message. A conversation is the
+-- logged-in user (or a browser session before login); chat_history.py reads
+-- it a page at a time, newest first, and trims each conversation to its
+-- newest messages. Chat writes do not bump DataVersion.
+CREATE TABLE IF NOT EXISTS ChatMessages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    conversation TEXT NOT NULL,
+    role TEXT CHECK (role IN ('user', 'assistant')) NOT NULL,
+    content TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_chat_conversation ON ChatMessages (conversation, id);
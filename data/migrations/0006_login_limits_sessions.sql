@@ -0,0 +1,22 @@
+-- Login rate limiting and sessions, shared by every worker process (see
+-- auth_store.py). A key keeps only the failed-attempt counts of the current
+-- and previous window, so it is one row however many attempts it sees.
+-- Rows past expires_at are swept; neither table bumps DataVersion.
+CREATE TABLE IF NOT EXISTS LoginAttempts (
+    key TEXT PRIMARY KEY,
+    window_start REAL NOT NULL,  -- unix time the current window began
+    current INTEGER NOT NULL,
+    previous INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_login_attempts_expires ON LoginAttempts (expires_at);
+
+CREATE TABLE IF NOT EXISTS Sessions (
+    token TEXT PRIMARY KEY,
+    username TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_sessions_expires ON Sessions (expires_at);
@@ -0,0 +1,9 @@
+-- Geocoding and distance lookups shared by every worker (see geocache.py).
+-- Older databases created the table at runtime, so this is IF NOT EXISTS.
+CREATE TABLE IF NOT EXISTS GeoCache (
+    kind TEXT NOT NULL,          -- lookup type, e.g. 'google:geocode' or 'google:distance'
+    query TEXT NOT NULL,         -- normalized lookup key (JSON)
+    value TEXT NOT NULL,         -- JSON-encoded answer
+    expires_at REAL NOT NULL,    -- unix time after which the entry is stale
+    PRIMARY KEY (kind, query)
+) WITHOUT ROWID;
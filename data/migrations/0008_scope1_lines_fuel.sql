@@ -0,0 +1,2 @@
+-- Fuel questions filter Scope1Lines by fuel; without this they read every line
+CREATE INDEX IF NOT EXISTS idx_scope1_lines_fuel ON Scope1Lines (fuel, scope1_id, emission);
@@ -0,0 +1,124 @@
+import unicodedata
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def normalize_city(name: str) -> str:
+    """Normalize a city name for lookups ("  São Paulo " -> "sao paulo")."""
+    if not isinstance(name, str):
+        return ""
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(ch for ch in name if not unicodedata.combining(ch))
+    return " ".join(name.casefold().split())
+
+
+def to_unit_vectors(lat_deg, lon_deg) -> np.ndarray:
+    """Project lat/lon (degrees) onto the unit sphere."""
+    lat = np.radians(np.asarray(lat_deg, dtype=float))
+    lon = np.radians(np.asarray(lon_deg, dtype=float))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+def chord_to_km(chord):
+    """Convert a unit-sphere chord length to great-circle (haversine) km."""
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(np.asarray(chord) / 2, 0, 1))
+
+
+def haversine_km(origin, destination) -> float:
+    """Great-circle distance in km between two (lat, lon) pairs."""
+    a, b = to_unit_vectors([origin[0], destination[0]], [origin[1], destination[1]])
+    return float(chord_to_km(np.linalg.norm(a - b)))
+
+
+def km_to_chord(km: float) -> float:
+    """Convert a great-circle distance in km to a unit-sphere chord length."""
+    return 2 * np.sin(min(km / EARTH_RADIUS_KM, np.pi) / 2)
+
+
+class AirportIndex:
+    """Spatial and name indexes over the OpenFlights airports table.
+
+    Nearest-airport queries use a k-d tree over unit-sphere coordinates, which
+    ranks points exactly like the haversine metric but works with scipy's
+    Euclidean tree. City and IATA lookups are plain dict probes on normalized
+    keys. Everything is built once, so a lookup costs microseconds instead of
+    a scan over ~7,700 rows.
+    """
+
+    def __init__(self, airports_df: pd.DataFrame, routes_df: Optional[pd.DataFrame] = None):
+        df = airports_df.dropna(subset=["Latitude", "Longitude"]).reset_index(drop=True)
+        df["IATA"] = df["IATA"].where(df["IATA"] != "\\N")
+
+        # Airports with scheduled routes are preferred when a city has several
+        if routes_df is not None:
+            counts = pd.concat([routes_df["Source_Airport"], routes_df["Destination_Airport"]]).value_counts()
+            df["Routes"] = df["IATA"].map(counts).fillna(0).astype(int)
+        else:
+            df["Routes"] = df["IATA"].notna().astype(int)
+        self.airports = df
+        self._records = df.to_dict("records")
+
+        points = to_unit_vectors(df["Latitude"].to_numpy(), df["Longitude"].to_numpy())
+        self._tree = cKDTree(points)
+        served = np.flatnonzero(df["Routes"].to_numpy() > 0)
+        self._served_rows = served
+        self._served_tree = cKDTree(points[served]) if len(served) else None
+
+        self._by_city = {}
+        order = df.sort_values("Routes", ascending=False, kind="stable").index
+        for row in order:
+            key = normalize_city(df.at[row, "City"])
+            if key:
+                self._by_city.setdefault(key, []).append(row)
+        self._by_iata = {code: row for row, code in df["IATA"].items() if isinstance(code, str)}
+
+    def __len__(self):
+        return len(self.airports)
+
+    def _record(self, row: int, distance_km: Optional[float] = None) -> dict:
+        record = dict(self._records[row])
+        if distance_km is not None:
+            record["Distance_km"] = float(distance_km)
+        return record
+
+    def nearest(self, lat: float, lon: float, max_km: Optional[float] = None,
+                served_only: bool = False) -> Optional[dict]:
+        """Return the airport closest to (lat, lon), or None if none is within ``max_km``."""
+        tree, rows = self._tree, None
+        if served_only:
+            if self._served_tree is None:
+                return None
+            tree, rows = self._served_tree, self._served_rows
+
+        upper = km_to_chord(max_km) if max_km is not None else np.inf
+        chord, pos = tree.query(to_unit_vectors([lat], [lon])[0], k=1, distance_upper_bound=upper)
+        if not np.isfinite(chord):
+            return None
+        row = int(rows[pos]) if rows is not None else int(pos)
+        return self._record(row, chord_to_km(chord))
+
+    def by_city(self, city: str) -> Optional[dict]:
+        """Return the busiest airport serving ``city``, or None."""
+        rows = self._by_city.get(normalize_city(city))
+        return self._record(rows[0]) if rows else None
+
+    def iata_for_city(self, city: str) -> Optional[str]:
+        """Return the IATA code of the busiest airport serving ``city``."""
+        airport = self.by_city(city)
+        return airport["IATA"] if airport and isinstance(airport["IATA"], str) else None
+
+    def by_iata(self, code: str) -> Optional[dict]:
+        """Return the airport with IATA code ``code``, or None."""
+        row = self._by_iata.get(code.strip().upper()) if isinstance(code, str) else None
+        return self._record(row) if row is not None else None
+
+    def city_near(self, lat: float, lon: float, max_km: float = 50) -> Optional[str]:
+        """Return the city of the nearest airport within ``max_km``."""
+        airport = self.nearest(lat, lon, max_km=max_km)
+        return airport["City"] if airport else None
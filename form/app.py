@@ -1,46 +1,43 @@
 import os
+import sys
 import streamlit as st
-import sqlite3
 import time
 import qrcode
 from io import BytesIO
 from logistics import travel_app
-from streamlit_autorefresh import st_autorefresh
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR, "..", "data", "emissions.db")
-
-        
-def fetch_latest_event():
-    """Fetch the latest event name from the database."""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("SELECT name FROM Events ORDER BY id DESC LIMIT 1")
-    event = c.fetchone()
-    conn.close()
-    return event[0] if event else "No events found"
-
-st_autorefresh(interval=1000, key="lat_event_refresh")
-Event = fetch_latest_event()
+# Share the dashboard's pooled data-access layer
+SHARED_DIR = os.path.join(BASE_DIR, "..", "Emission-Calculator-main")
+if SHARED_DIR not in sys.path:
+    sys.path.append(SHARED_DIR)
+import db
+import queries
+import factors
+from events import latest_event
+from common import create_database
+from refresh import watch_data
+
+# Apply the schema migrations, including the data version triggers
+create_database()
+
+# Rerun only when a new event is created
+watch_data(tables=["Events"], key="event_version")
+Event = latest_event() or "No events found"
 st.write(f"Event: {Event}")
 
 def store_food_data(Event, session_id, dietary_pattern, food_choices, emission):
-    """Store food choices for the user session."""
-    with sqlite3.connect(DB_PATH) as conn:
-        c = conn.cursor()
-        for food_item in food_choices:
-            emission = emission_factors.get(food_item, 0.0)  # Get per-item emission
-            c.execute('''INSERT INTO food_choices (Event, session_id, dietary_pattern, food_item , emission) 
-                 VALUES (?, ?, ?, ?, ?)''', (Event, session_id, dietary_pattern, food_item, emission))
-        conn.commit()
+    """Store food choices for the user session in one batch; returns the row ids."""
+    emissions = factors.calculate("food", food_choices)  # Per-item emission
+    rows = [(Event, session_id, dietary_pattern, food_item, float(item_emission))
+            for food_item, item_emission in zip(food_choices, emissions)]
+    return db.insert_many('''INSERT INTO food_choices (Event, session_id, dietary_pattern, food_item , emission) 
+                 VALUES (?, ?, ?, ?, ?)''', rows)
 
 
 def store_message(Event, name, message):
     """Save a user's contact message to the database."""
-    with sqlite3.connect(DB_PATH) as conn:
-        c = conn.cursor()
-        c.execute("INSERT INTO contact_messages (name, message) VALUES (?, ?, ?)", (Event, name, message))
-        conn.commit()
+    db.execute("INSERT INTO contact_messages (name, message) VALUES (?, ?, ?)", (Event, name, message))
 
 
 
@@ -96,7 +93,7 @@ with st.container():
 
     # Transport Data Collection
     elif option == "Transport":
-        travel_app()
+        travel_app(Event)
         
     # Food Preferences Data Collection
     elif option == "Food":
@@ -134,22 +131,9 @@ with st.container():
         # Flatten the selections (remove extra list brackets)
         user_choices = list(selected_food_items) + list(breakfast_selection) + list(salad_selection) + list(sweets_selection) + list([banana_selection])
 
-        emission_factors = {
-            "Vegetarian Diet": 0.723, "Non-Vegetarian Diet": 1.30, "Vegan Diet": 0.7,
-            "Milk": 0.729, "Eggs": 0.588, "Idli with Sambar": 0.61, "Poha with Vegetables": 0.71,
-            "Paratha with Curd": 0.49, "Upma": 0.28, "Omelette with Toast": 0.419,
-            "Masala Dosa": 0.58, "Puri Bhaji": 1.2, "Aloo Paratha": 0.40,
-            "Medu Vada": 1.5, "Sabudana Khichdi": 1.0, "Dhokla": 0.8,
-            "Chole Bhature": 1.1, "Besan Cheela": 0.7, "Pongal": 0.6,
-            "Kachumber Salad": 0.4, "Sprouted Moong Salad": 0.3,
-            "Cucumber Raita Salad": 0.2, "Tomato Onion Salad": 0.3,
-            "Carrot and Cabbage Salad": 0.25, "Gulab Jamun": 0.725, "Rasgulla": 0.725,
-            "Kheer": 0.348, "Jalebi": 0.07, "Kaju Katli": 0.065, "Barfi": 0.069,
-            "Halwa (Carrot or Bottle Gourd)": 0.11, "Laddu": 0.040, "Single Banana": 0.1
-        }
         total_food_emission = 0.0
         for item in list(user_choices):
-            emission = emission_factors.get(item, 0.0)
+            emission = factors.factor("food", item)
             
             total_food_emission += emission
         
@@ -165,14 +149,8 @@ with st.container():
     # View Submitted Data
     elif option == "View Data":
         st.header("📊 Your Submitted Data")
-        conn =  sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        
-        c.execute("SELECT mode, distance FROM transport_data WHERE Event = ?", (Event,))
-        transport_data = c.fetchall()
-        c.execute("SELECT food_item FROM food_choices WHERE Event = ?", (Event,))
-        food_data = c.fetchall()
-        conn.close()
+        transport_data = db.fetchall(queries.FORM_TRANSPORT, (Event,))
+        food_data = db.fetchall(queries.FORM_FOOD, (Event,))
         
         if transport_data:
             st.subheader("🚗 Transport Details")
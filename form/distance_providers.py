@@ -0,0 +1,345 @@
+import os
+import logging
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from scipy.spatial import cKDTree
+
+from airport_index import AirportIndex, haversine_km, km_to_chord, normalize_city, to_unit_vectors
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+GAZETTEER_PATH = os.path.join(BASE_DIR, "gazetteer.csv")
+
+# Ratio of network distance to great-circle distance used by the offline
+# backend. Road and rail routes in India run ~25-35% longer than the
+# straight line between city centres.
+CIRCUITY_FACTORS = {
+    "driving": 1.3,
+    "transit": 1.25,
+}
+
+# Search radius for "nearest hub" lookups, same as the Places API calls
+NEARBY_RADIUS_KM = 50
+
+# Concurrent requests allowed against one web-service host
+MAX_REQUESTS_PER_HOST = 8
+
+Coords = Tuple[float, float]
+
+
+class DistanceProvider:
+    """Interface used by the travel calculator to resolve places and distances.
+
+    Every method returns ``None`` (or a tuple of ``None``) when it cannot answer,
+    so providers can be chained with :class:`FallbackProvider`.
+    """
+
+    name = "base"
+
+    def geocode(self, query: str) -> Tuple[Optional[float], Optional[float], Optional[str]]:
+        """Return ``(lat, lon, country)`` for a place name."""
+        raise NotImplementedError
+
+    def nearest_airport(self, lat: float, lon: float) -> Tuple[Optional[str], Optional[str], Optional[Coords]]:
+        """Return ``(airport name, city, coords)`` of the nearest airport."""
+        raise NotImplementedError
+
+    def nearest_station(self, lat: float, lon: float) -> Tuple[Optional[str], Optional[str], Optional[Coords]]:
+        """Return ``(station name, city, coords)`` of the nearest railway station."""
+        raise NotImplementedError
+
+    def find_station(self, city: str) -> Tuple[Optional[str], Optional[Coords]]:
+        """Return ``(station name, coords)`` of the main railway station of a city."""
+        raise NotImplementedError
+
+    def distance(self, origin: Coords, destination: Coords, mode: str) -> Optional[float]:
+        """Return the travel distance in km for ``mode`` ("driving" or "transit")."""
+        raise NotImplementedError
+
+
+class Gazetteer:
+    """Bundled list of cities with coordinates, country and main railway station."""
+
+    def __init__(self, path: str = GAZETTEER_PATH):
+        df = pd.read_csv(path, keep_default_na=False)
+        self.places = df.to_dict("records")
+        self._by_name = {}
+        for row, place in enumerate(self.places):
+            names = [place["City"]] + [alias for alias in place["Aliases"].split("|") if alias]
+            for name in names:
+                self._by_name.setdefault(normalize_city(name), row)
+        self._tree = cKDTree(to_unit_vectors(df["Latitude"].to_numpy(), df["Longitude"].to_numpy()))
+
+    def lookup(self, query: str) -> Optional[dict]:
+        key = normalize_city(query)
+        row = self._by_name.get(key)
+        if row is None and "," in key:
+            # "Andheri, Mumbai" -> try the most specific known component
+            for part in (p.strip() for p in key.split(",")):
+                row = self._by_name.get(part)
+                if row is not None:
+                    break
+        return self.places[row] if row is not None else None
+
+    def nearest(self, lat: float, lon: float, max_km: float = NEARBY_RADIUS_KM) -> Optional[dict]:
+        chord, row = self._tree.query(to_unit_vectors([lat], [lon])[0], k=1,
+                                      distance_upper_bound=km_to_chord(max_km))
+        if not np.isfinite(chord):
+            return None
+        return self.places[int(row)]
+
+
+class OfflineDistanceProvider(DistanceProvider):
+    """Resolve everything from the bundled gazetteer and OpenFlights files.
+
+    Road and rail distances are great-circle distances scaled by a circuity
+    factor, which is accurate to within ~10-15% for intercity trips and needs
+    no network access.
+    """
+
+    name = "offline"
+
+    def __init__(self, airports: AirportIndex, gazetteer: Optional[Gazetteer] = None):
+        self.airports = airports
+        self.gazetteer = gazetteer or Gazetteer()
+
+    def geocode(self, query):
+        place = self.gazetteer.lookup(query)
+        if place:
+            return place["Latitude"], place["Longitude"], place["Country"]
+        airport = self.airports.by_city(query) or self.airports.by_iata(query)
+        if airport:
+            return airport["Latitude"], airport["Longitude"], airport["Country"]
+        return None, None, None
+
+    def nearest_airport(self, lat, lon):
+        if lat is None or lon is None:
+            return None, None, None
+        airport = self.airports.nearest(lat, lon, max_km=NEARBY_RADIUS_KM * 4, served_only=True)
+        if not airport:
+            return None, None, None
+        return airport["Name"], airport["City"], (airport["Latitude"], airport["Longitude"])
+
+    def nearest_station(self, lat, lon):
+        if lat is None or lon is None:
+            return None, None, None
+        place = self.gazetteer.nearest(lat, lon)
+        if not place or not place["Station"]:
+            return None, None, None
+        return place["Station"], place["City"], (place["Latitude"], place["Longitude"])
+
+    def find_station(self, city):
+        place = self.gazetteer.lookup(city)
+        if not place or not place["Station"]:
+            return None, None
+        return place["Station"], (place["Latitude"], place["Longitude"])
+
+    def distance(self, origin, destination, mode):
+        if None in (*origin, *destination):
+            return None
+        return round(haversine_km(origin, destination) * CIRCUITY_FACTORS.get(mode, 1.0), 2)
+
+
+class GoogleMapsProvider(DistanceProvider):
+    """Resolve places and distances with the Google Maps web services.
+
+    All calls share one keep-alive session and are safe to make from several
+    threads; at most ``max_concurrency`` requests are in flight at a time.
+    """
+
+    name = "google"
+    BASE_URL = "https://maps.googleapis.com/maps/api"
+
+    def __init__(self, api_key: str, timeout: float = 10, max_concurrency: int = MAX_REQUESTS_PER_HOST):
+        self.api_key = api_key
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency))
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+
+    def _get(self, path: str, params: dict) -> dict:
+        params = dict(params, key=self.api_key)
+        with self._slots:
+            return self.session.get(f"{self.BASE_URL}/{path}", params=params, timeout=self.timeout).json()
+
+    def geocode(self, query):
+        response = self._get("geocode/json", {"address": query})
+        if response["status"] == "OK":
+            result = response["results"][0]
+            location = result["geometry"]["location"]
+            country = None
+            for component in result["address_components"]:
+                if "country" in component["types"]:
+                    country = component["long_name"]
+                    break
+            return location["lat"], location["lng"], country
+        logging.warning(f"Error fetching coordinates for {query}: {response.get('status')}")
+        return None, None, None
+
+    def _near_city(self, lat, lon):
+        # Reverse geocode to get the city name for the coordinates
+        response = self._get("geocode/json", {"latlng": f"{lat},{lon}"})
+        if response["status"] == "OK":
+            city_name = None
+            district_name = None
+            for result in response["results"]:
+                for component in result["address_components"]:
+                    if "locality" in component["types"]:
+                        city_name = component["long_name"]
+                    if "administrative_area_level_2" in component["types"]:
+                        district_name = component["long_name"]
+            return city_name if city_name else district_name
+        return "Unknown City"
+
+    def _nearby(self, lat, lon, place_type):
+        response = self._get("place/nearbysearch/json", {
+            "location": f"{lat},{lon}",
+            "radius": NEARBY_RADIUS_KM * 1000,
+            "type": place_type,
+        })
+        if response["status"] == "OK" and response["results"]:
+            nearest_place = response["results"][0]
+            place_lat = nearest_place["geometry"]["location"]["lat"]
+            place_lon = nearest_place["geometry"]["location"]["lng"]
+            return nearest_place["name"], self._near_city(place_lat, place_lon), (place_lat, place_lon)
+        return None, None, None
+
+    def nearest_airport(self, lat, lon):
+        return self._nearby(lat, lon, "airport")
+
+    def nearest_station(self, lat, lon):
+        return self._nearby(lat, lon, "train_station")
+
+    def find_station(self, city):
+        response = self._get("place/textsearch/json", {"query": f"{city} railway station", "type": "train_station"})
+        if response["status"] == "OK" and response["results"]:
+            station = response["results"][0]
+            location = station["geometry"]["location"]
+            return station["name"], (location["lat"], location["lng"])
+        return None, None
+
+    def distance(self, origin, destination, mode):
+        response = self._get("distancematrix/json", {
+            "origins": f"{origin[0]},{origin[1]}",
+            "destinations": f"{destination[0]},{destination[1]}",
+            "mode": mode,
+        })
+        if response.get("rows"):
+            element = response["rows"][0]["elements"][0]
+            if element.get("status") == "OK":
+                return round(element["distance"]["value"] / 1000, 2)
+            logging.warning(f"Distance Matrix returned {element.get('status')} for {origin} -> {destination}")
+        return None
+
+
+def _answered(result) -> bool:
+    if isinstance(result, tuple):
+        return result[0] is not None
+    return result is not None
+
+
+class FallbackProvider(DistanceProvider):
+    """Ask each provider in turn and return the first answer."""
+
+    def __init__(self, *providers: DistanceProvider):
+        self.providers = providers
+        self.name = "+".join(provider.name for provider in providers)
+
+    def _first(self, method: str, *args):
+        result = None
+        for provider in self.providers:
+            try:
+                result = getattr(provider, method)(*args)
+            except requests.RequestException as e:
+                logging.warning(f"{provider.name} provider failed on {method}: {e}")
+                continue
+            if _answered(result):
+                return result
+        return result
+
+    def geocode(self, query):
+        return self._first("geocode", query)
+
+    def nearest_airport(self, lat, lon):
+        return self._first("nearest_airport", lat, lon)
+
+    def nearest_station(self, lat, lon):
+        return self._first("nearest_station", lat, lon)
+
+    def find_station(self, city):
+        return self._first("find_station", city)
+
+    def distance(self, origin, destination, mode):
+        return self._first("distance", origin, destination, mode)
+
+
+def _as_tuples(value):
+    # JSON round-trips tuples as lists
+    return tuple(_as_tuples(v) for v in value) if isinstance(value, list) else value
+
+
+class CachedProvider(DistanceProvider):
+    """Memoize another provider's answers in a :class:`geocache.GeoCache`.
+
+    Keys are namespaced by the wrapped provider's name so answers from
+    different backends never mix. Unanswered lookups are not stored, so a
+    transient API failure is retried on the next request.
+    """
+
+    def __init__(self, provider: DistanceProvider, cache):
+        self.provider = provider
+        self.cache = cache
+        self.name = provider.name
+
+    def _cached(self, method: str, *args):
+        kind = f"{self.provider.name}:{method}"
+        value = self.cache.get(kind, *args)
+        if value is not None:
+            return _as_tuples(value)
+        value = getattr(self.provider, method)(*args)
+        if _answered(value):
+            self.cache.set(kind, *args, value=value)
+        return value
+
+    def geocode(self, query):
+        return self._cached("geocode", query)
+
+    def nearest_airport(self, lat, lon):
+        return self._cached("nearest_airport", lat, lon)
+
+    def nearest_station(self, lat, lon):
+        return self._cached("nearest_station", lat, lon)
+
+    def find_station(self, city):
+        return self._cached("find_station", city)
+
+    def distance(self, origin, destination, mode):
+        return self._cached("distance", origin, destination, mode)
+
+
+def build_provider(spec: str, airports: AirportIndex, api_key: Optional[str] = None,
+                   cache=None) -> DistanceProvider:
+    """Build a provider from a spec such as "offline", "google" or "offline+google".
+
+    Network-backed providers are wrapped in :class:`CachedProvider` when a
+    ``cache`` is given; the offline provider is already in-memory.
+    """
+    providers = []
+    for name in (part.strip().lower() for part in spec.split("+")):
+        if name == "offline":
+            providers.append(OfflineDistanceProvider(airports))
+        elif name == "google":
+            if not api_key:
+                logging.warning("Google Maps provider requested but no API key is configured; skipping it.")
+                continue
+            provider = GoogleMapsProvider(api_key)
+            providers.append(CachedProvider(provider, cache) if cache is not None else provider)
+        else:
+            raise ValueError(f"Unknown distance provider: {name}")
+    if not providers:
+        providers.append(OfflineDistanceProvider(airports))
+    return providers[0] if len(providers) == 1 else FallbackProvider(*providers)
@@ -1,137 +1,28 @@
 import os
-import sqlite3
+import sys
 import numpy as np
 import streamlit as st
 import pandas as pd
-import requests
 from geopy.distance import geodesic
 import re
-import googlemaps
-from streamlit_autorefresh import st_autorefresh
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from airport_index import AirportIndex
+from distance_providers import build_provider
 import pandas as pd
 import plotly.express as px
 
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR, "..", "data", "emissions.db")
-
-        
-def fetch_latest_event():
-    """Fetch the latest event name from the database."""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("SELECT name FROM Events ORDER BY id DESC LIMIT 1")
-    event = c.fetchone()
-    conn.close()
-    return event[0] if event else "No events found"
-
-
-# --- Google Maps API Key ---
-GOOGLE_MAPS_API_KEY = st.secrets["google"]["maps_api_key"]
-
-st_autorefresh(interval=1000, key="latest_event_refresh")
-Event = fetch_latest_event()
-
-
-# --- Function to Get Coordinates ---
-def get_lat_lon(city):
-    url = f"https://maps.googleapis.com/maps/api/geocode/json?address={city}&key={GOOGLE_MAPS_API_KEY}"
-    response = requests.get(url).json()
-    if response["status"] == "OK":
-        result = response["results"][0]
-        location = result["geometry"]["location"]
-        country = None
-        for component in result["address_components"]:
-            if "country" in component["types"]:
-                country = component["long_name"]
-                break
-        return location["lat"], location["lng"], country
-    else:
-        print(f"Error fetching coordinates for {city}: {response.get('status')}")
-    return None, None, None
-
-def get_near_city(lat, lon):
-    # use reverse geocoding api to get correct city name for coordinates
-    url = f"https://maps.googleapis.com/maps/api/geocode/json"
-    parms = {
-        "latlng": f"{lat},{lon}",
-        "key": GOOGLE_MAPS_API_KEY
-    }
-    response = requests.get(url, params=parms).json()
-
-    if response["status"] == "OK":
-        city_name = None
-        district_name = None
-        for result in response["results"]:
-            for component in result["address_components"]:
-                if "locality" in component["types"]:
-                    city_name =  component["long_name"]
-                if "administrative_area_level_2" in component["types"]:
-                    district_name =  component["long_name"]
-        return city_name if city_name else district_name
-    return "Unknown City"
-
-
-# --- Function to Find a Specific Station in a City ---
-def find_city_station(city):
-    url = f"https://maps.googleapis.com/maps/api/place/textsearch/json"
-    params = {
-        "query": f"{city} railway station",
-        "type": "train_station",
-        "key": GOOGLE_MAPS_API_KEY
-    }
-    response = requests.get(url, params=params).json()
-    if response["status"] == "OK" and response["results"]:
-        station = response["results"][0]
-        station_name = station["name"]
-        station_lat = station["geometry"]["location"]["lat"]
-        station_lon = station["geometry"]["location"]["lng"]
-        return station_name, (station_lat, station_lon)
-    return None, None
-
-# --- Function to Find Nearest Transport Hub (Airport/Railway) ---
-def find_nearest_place(lat, lon, place_type):
-    url = f"https://maps.googleapis.com/maps/api/place/nearbysearch/json"
-    params = {
-        "location": f"{lat},{lon}",
-        "radius": 50000,  # Search within 50 km
-        "type": place_type,  # "airport" or "train_station"
-        "key": GOOGLE_MAPS_API_KEY
-    }
-    response = requests.get(url, params=params).json()
-    if response["status"] == "OK" and response["results"]:
-        nearest_place = response["results"][0]
-        place_name = nearest_place["name"]
-        place_lat = nearest_place["geometry"]["location"]["lat"]
-        place_lon = nearest_place["geometry"]["location"]["lng"]
-        city_name = get_near_city(place_lat, place_lon)
-        return place_name, city_name, (place_lat, place_lon)
-    return None, None, None
-
-# --- Function to Get Distance between Two Places ---
-def get_distance(origin, destination, mode):
-    url = f"https://maps.googleapis.com/maps/api/distancematrix/json"
-    params = {
-        "origins": f"{origin[0]},{origin[1]}",
-        "destinations": f"{destination[0]},{destination[1]}",
-        "mode": mode,  # "driving", "transit"
-        "key": GOOGLE_MAPS_API_KEY
-    }
-    response = requests.get(url, params=params).json()
-
-    if "rows" in response and response["rows"]:
-        element = response["rows"][0]["elements"][0]
-        if "status" in element:
-            if element["status"] == "OK":
-                return element["distance"]["text"]
-            elif element["status"] == "OK":
-                distance_km = round(geodesic(origin, destination).km, 2)
-        elif element["status"] == "ZERO_RESULTS":
-            return "No results found"
-        else:
-            return "Error: " + element["status"]
-    return "N/A"
+# Share the dashboard's pooled data-access layer
+SHARED_DIR = os.path.join(BASE_DIR, "..", "Emission-Calculator-main")
+if SHARED_DIR not in sys.path:
+    sys.path.append(SHARED_DIR)
+from core.travel import save_travel_legs, travel_emission
+from geocache import geo_cache
+
 
 # --- Load OpenFlights Data ---
 routes_cols = ["Airline", "Airline_ID", "Source_Airport", "Source_Airport_ID", 
@@ -150,26 +41,48 @@ base2_dir = os.path.dirname(os.path.abspath(__file__))  # Get the current script
 file_path2 = os.path.join(base2_dir, "airports.csv")
 # Load CSV Data
 routes_df = pd.read_csv(file_path1, names=routes_cols, usecols=["Source_Airport", "Destination_Airport"])
-airports_df = pd.read_csv(file_path2, names=airports_cols, usecols=["Name","City", "IATA", "Latitude", "Longitude"])
+airports_df = pd.read_csv(file_path2, names=airports_cols, usecols=["Name", "City", "Country", "IATA", "Latitude", "Longitude"])
+
+# --- Spatial + city/IATA indexes, built once per process ---
+airport_index = AirportIndex(airports_df, routes_df)
+
+
+# --- Distance Provider ---
+def load_distance_provider():
+    """Build the configured distance provider.
+
+    Set ``DISTANCE_PROVIDER`` (env) or ``[distance] provider`` (secrets) to
+    "offline" (default), "google" or "offline+google". The Google Maps key is
+    only read when a remote backend is configured; remote answers are kept in
+    the shared geocode cache.
+    """
+    try:
+        secrets = st.secrets
+        spec = os.getenv("DISTANCE_PROVIDER") or secrets.get("distance", {}).get("provider", "offline")
+        api_key = secrets.get("google", {}).get("maps_api_key") if "google" in spec else None
+    except FileNotFoundError:
+        spec, api_key = os.getenv("DISTANCE_PROVIDER", "offline"), None
+    return build_provider(spec, airport_index, api_key=api_key, cache=geo_cache)
+
+distance_provider = load_distance_provider()
 
 # --- Match Airport Name to City in airports_df ---
 def match_airport_to_city(airport_name, lat, lon):
-    # Try to find a matching city based on coordinates proximity
-    for _, row in airports_df.iterrows():
-        dist = geodesic((lat, lon), (row["Latitude"], row["Longitude"])).km
-        if dist < 50:  # Consider it a match if within 50 km
-            return row["City"]
-    return airport_name  # Fallback to airport name if no match
+    # Nearest airport within 50 km decides the city
+    city = airport_index.city_near(lat, lon, max_km=50)
+    return city if city else airport_name  # Fallback to airport name if no match
 
 def get_air_distance_by_city(origin_city, destination_city):
     """Find airline distance between two cities using OpenFlights data."""
-    origin_airport = airports_df[airports_df["City"].str.lower() == origin_city.lower()]
-    destination_airport = airports_df[airports_df["City"].str.lower() == destination_city.lower()]
+    if not origin_city or not destination_city:
+        return None
+    origin_airport = airport_index.by_city(origin_city)
+    destination_airport = airport_index.by_city(destination_city)
 
-    if not origin_airport.empty and not destination_airport.empty:
+    if origin_airport and destination_airport:
 
-        origin_coords = (origin_airport.iloc[0]["Latitude"], origin_airport.iloc[0]["Longitude"])
-        destination_coords = (destination_airport.iloc[0]["Latitude"], destination_airport.iloc[0]["Longitude"])
+        origin_coords = (origin_airport["Latitude"], origin_airport["Longitude"])
+        destination_coords = (destination_airport["Latitude"], destination_airport["Longitude"])
 
         distance= round(geodesic(origin_coords, destination_coords).km, 2)
         return distance
@@ -198,16 +111,167 @@ def extract_rail_distance(value):
     return float(value)
 
 
-def insert_transport_into_db(Event, mode, type_, origin, destination, distance, emission):
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute('''INSERT INTO transport_data (Event, mode, type, origin, destination, distance, emission) 
-                 VALUES (?, ?, ?, ?, ?, ?, ?)''', (Event, mode, type_, origin, destination, distance, emission))
-    conn.commit()
-    conn.close()
+# --- Concurrent distance resolution ---
+# Entries are resolved in parallel, and each entry runs its origin and
+# destination lookups in parallel on a second pool. Keeping the two pools
+# separate means a busy entry can never wait on a lookup slot held by itself.
+MAX_ENTRY_WORKERS = 8
+MAX_LOOKUP_WORKERS = 16
+ENTRY_TIMEOUT = 60  # seconds before a leg is reported as failed
+
+lookup_pool = ThreadPoolExecutor(max_workers=MAX_LOOKUP_WORKERS, thread_name_prefix="distance-lookup")
+
+
+def _both(fn, origin_args, dest_args):
+    """Run ``fn`` for the origin and destination halves concurrently."""
+    dest_future = lookup_pool.submit(fn, *dest_args)
+    return fn(*origin_args), dest_future.result()
+
+
+def _station_for(place, coords):
+    station, station_coords = distance_provider.find_station(place)
+    if not station:
+        station, _, station_coords = distance_provider.nearest_station(*coords)
+    return station, station_coords
 
 
-def travel_app():
+def resolve_entry(entry):
+    """Resolve distance and emission for one travel entry.
+
+    Runs on a worker thread, where Streamlit calls are not allowed, so the
+    output is returned as ``(st method, text)`` pairs for the script thread to
+    render in entry order.
+    """
+    out = []
+    result = {"entry": entry, "messages": out, "distance": None, "emission": None}
+
+    if entry["mode"] != "Distance" and not (entry["origin"].strip() and entry["destination"].strip()):
+        out.append(("warning", "Please enter both origin and destination."))
+        return result
+
+    if entry["mode"] == "Distance":
+        try:
+            distance_value = float(entry['distance'])
+        except (TypeError, ValueError):
+            distance_value = None
+        if distance_value is None or not np.isfinite(distance_value) or distance_value < 0:
+            out.append(("warning", f"Please enter the distance as a number of km, not '{entry['distance']}'."))
+            return result
+        out.append(("write", f"📏 **Distance travelled**: {entry['distance']} km"))
+        emission_dist = travel_emission("Distance", entry["type"], distance_value)
+        out.append(("write", f"🚉 Emission calculated for {entry['distance']} km is {round(emission_dist,3)} kgCO₂e"))
+        result.update(distance=distance_value, emission=emission_dist)
+        return result
+
+    (origin_lat, origin_lon, origin_country), (dest_lat, dest_lon, dest_country) = _both(
+        distance_provider.geocode, (entry["origin"],), (entry["destination"],))
+
+    if entry["mode"] in ["Rail", "Road"] and (origin_country != "India" or dest_country != "India"):
+        out.append(("warning", f"{entry['mode']} travel is limited to India only. {entry['origin']} ({origin_country}) or {entry['destination']} ({dest_country}) is outside India."))
+        return result
+    origin_coords = (origin_lat, origin_lon)
+    dest_coords = (dest_lat, dest_lon)
+
+    if None in origin_coords or None in dest_coords:
+        out.append(("warning", f"Could not fetch location data for {entry['origin']} or {entry['destination']}."))
+        return result
+
+    if entry["mode"] == "Air":
+        (origin_airport, origin_city, origin_airport_coords), (dest_airport, dest_city, dest_airport_coords) = _both(
+            distance_provider.nearest_airport, origin_coords, dest_coords)
+
+        if not (origin_airport and dest_airport and origin_airport_coords and dest_airport_coords):
+            out.append(("warning", f"Could not fetch location data for {entry['origin']} or {entry['destination']}."))
+            return result
+
+        to_airport, from_airport = (round(extract_distance(d), 2) for d in _both(
+            distance_provider.distance,
+            (origin_coords, origin_airport_coords, "driving"),
+            (dest_airport_coords, dest_coords, "driving")))
+        air_distance_result = get_air_distance_by_city(origin_city, dest_city)  # Use matched cities
+        if air_distance_result is None:
+            out.append(("success", "Using nearest airports distance."))
+            air_distance = round(geodesic(origin_airport_coords, dest_airport_coords).km, 2)
+        else:
+            air_distance = round(air_distance_result, 2)
+
+        distance_value = round(to_airport + air_distance + from_airport, 2)
+        emission_dist = round(travel_emission("Air", entry["type"], air_distance), 2)
+
+        out.append(("success", f"✈️ **Flight Distance**:"))
+        out.append(("write", f"🚗 {entry['origin']} → {origin_airport}: {to_airport} km"))
+        out.append(("write", f"✈️ {origin_airport} → {dest_airport}: {air_distance} km"))
+        out.append(("write", f"🚗 {entry['destination']} ← {dest_airport}: {from_airport} km"))
+        out.append(("write", f"📏 **Trip AIR Total**: {distance_value} km"))
+        out.append(("write", f"Emission for air distance: {emission_dist} kgco2e"))
+
+    elif entry["mode"] == "Rail":
+        (origin_station, origin_station_coords), (dest_station, dest_station_coords) = _both(
+            _station_for, (entry["origin"], origin_coords), (entry["destination"], dest_coords))
+        if not origin_station:
+            out.append(("warning", f"No railwaystation found near {entry['origin']}."))
+        if not dest_station:
+            out.append(("warning", f"No railwaystation found near {entry['destination']}."))
+        if not (origin_station and dest_station):
+            out.append(("warning", "Could not find nearby railway stations."))
+            return result
+
+        rail_distance = distance_provider.distance(origin_station_coords, dest_station_coords, "transit")
+        distance_value = round(extract_rail_distance(rail_distance), 4)
+
+        out.append(("success", f"🚆 **Rail Distance**:"))
+        out.append(("write", f"🚉 **{origin_station} → {dest_station}**: {distance_value} km"))
+        if entry["type"] == "Electric":
+            emission_dist = round(travel_emission("Rail", "Electric", distance_value),3)
+            out.append(("write", f"🚉 Emission for Electric  rail from **{origin_station} → {dest_station}**: {emission_dist} kgco2e"))
+        else:
+            emission_dist = travel_emission("Rail", entry["type"], distance_value)
+            out.append(("write", f"🚉 Emission Diesel rail from **{origin_station} → {dest_station}**: {emission_dist} kgco2e"))
+
+    else:  # Road Mode
+        road_distance = distance_provider.distance(origin_coords, dest_coords, "driving")
+        distance_value = round(extract_distance(road_distance), 2)
+        out.append(("write", f"🚗 Road Distance from {entry['origin']} → {entry['destination']}: {distance_value} km"))
+        emission_dist = travel_emission("Road", entry["type"], distance_value)
+        out.append(("write", f"🚉 Emission from  {entry['origin']} → {entry['destination']} is {round(emission_dist,3)} kgco2e"))
+
+    result.update(distance=distance_value, emission=emission_dist)
+    return result
+
+
+def _failed(entry, message):
+    return {"entry": entry, "distance": None, "emission": None, "messages": [("warning", message)]}
+
+
+def resolve_entries(entries):
+    """Resolve every entry concurrently and return the results in entry order.
+
+    All entries share one ``ENTRY_TIMEOUT`` deadline. A leg that is still
+    running then, or that raised, is reported as failed; the pool is not
+    waited on, so a stalled lookup cannot hold up the form.
+    """
+    if not entries:
+        return []
+    pool = ThreadPoolExecutor(max_workers=min(MAX_ENTRY_WORKERS, len(entries)), thread_name_prefix="travel-entry")
+    try:
+        futures = [pool.submit(resolve_entry, entry) for entry in entries]
+        deadline = time.monotonic() + ENTRY_TIMEOUT
+        results = []
+        for entry, future in zip(entries, futures):
+            leg = f"{entry['origin']} → {entry['destination']}"
+            try:
+                results.append(future.result(timeout=max(deadline - time.monotonic(), 0)))
+            except FutureTimeout:
+                results.append(_failed(entry, f"Timed out resolving {leg}."))
+            except Exception as e:
+                logging.error(f"Resolving {leg} failed: {e}")
+                results.append(_failed(entry, f"Could not resolve {leg}: {e}"))
+        return results
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def travel_app(Event):
     st.title("🚀 Multi Travel Calculator & Distance Finder")
 
     # Initialize session state for travel entries
@@ -267,130 +331,18 @@ def travel_app():
         total_emission = 0.0
         st.write("### Travel Distances")
 
-        for entry in st.session_state.travel_entries:
-            
-            if entry["mode"] != "Distance" and not (entry["origin"].strip() and entry["destination"].strip()):
-                st.warning("Please enter both origin and destination.")
-                continue
-
-            origin_lat, origin_lon, origin_country = get_lat_lon(entry["origin"])
-            dest_lat, dest_lon, dest_country = get_lat_lon(entry["destination"])
-        
-
-            if entry["mode"] in ["Rail", "Road"] and (origin_country != "India" or dest_country != "India"):
-                st.warning(f"{entry['mode']} travel is limited to India only. {entry['origin']} ({origin_country}) or {entry['destination']} ({dest_country}) is outside India.")
-                continue
-            origin_coords = (origin_lat, origin_lon)
-            dest_coords = (dest_lat, dest_lon)
-
-            if entry["mode"] == "Distance":
-                st.write(f"📏 **Distance travelled**: {entry['distance']} km")
-                emission_dist = 0.0
-                distance_value = float(entry['distance'])
-        
-                if entry["type"] == "Auto CNG":
-                    emission_dist = distance_value * 0.107
-                elif entry["type"] == "Bike":
-                    emission_dist = distance_value * 0.049
-                elif entry["type"] == "Car Petrol":
-                    emission_dist = distance_value * 0.187
-                elif entry["type"] == "Electric bike":
-                    emission_dist = distance_value * 0.031
-                elif entry["type"] == "Car CNG":
-                    emission_dist = distance_value * 0.68
-                else:
-                    emission_dist = round(distance_value * 0.012, 3)
-
-                st.write(f"🚉 Emission calculated for {entry['distance']} km is {round(emission_dist,3)} kgCO₂e")
-                total_distance += distance_value
-                total_emission += emission_dist
-                continue  
-
-            if origin_coords and dest_coords:
-                if entry["mode"] == "Air":
-                    origin_airport, origin_city, origin_airport_coords = find_nearest_place(*origin_coords, "airport")
-                    dest_airport, dest_city, dest_airport_coords = find_nearest_place(*dest_coords, "airport")
-
-                    if origin_airport and dest_airport and origin_airport_coords and dest_airport_coords:
-                        to_airport = round(extract_distance(get_distance(origin_coords, origin_airport_coords, "driving")), 2)
-                        air_distance_result = get_air_distance_by_city(origin_city, dest_city)  # Use matched cities
-                        if air_distance_result is None:
-                            st.success("Using nearest airports distance.")                                
-                            air_distance = round(geodesic(origin_airport_coords, dest_airport_coords).km, 2)
-                        else:
-                            air_distance = round(air_distance_result, 2)
-                        from_airport = round(extract_distance(get_distance(dest_airport_coords, dest_coords, "driving")), 2)
-
-                        distance_value = round(to_airport + air_distance + from_airport, 2)
-                        total_distance += distance_value
-                        emission_dist = round(air_distance*1.58, 2)
-                        total_emission += emission_dist
-
-                        st.success(f"✈️ **Flight Distance**:")
-                        st.write(f"🚗 {entry['origin']} → {origin_airport}: {to_airport} km")
-                        st.write(f"✈️ {origin_airport} → {dest_airport}: {air_distance} km")
-                        st.write(f"🚗 {entry['destination']} ← {dest_airport}: {from_airport} km")
-                        st.write(f"📏 **Trip AIR Total**: {distance_value} km")
-                        st.write(f"Emission for air distance: {emission_dist} kgco2e")
-
-                    else:
-                        st.warning(f"Could not fetch location data for {entry['origin']} or {entry['destination']}.")
-
-                elif entry["mode"] == "Rail":
-                    origin_station, origin_station_coords = find_city_station(entry["origin"])
-                    if not origin_station:
-                        origin_station, origin_city, origin_station_coords = find_nearest_place(*origin_coords, "train_station")
-                        if not origin_station:
-                            st.warning(f"No railwaystation found near {entry['origin']}.")
-                    dest_station, dest_station_coords = find_city_station(entry["destination"])
-                    if not dest_station:
-                        dest_station, dest_city, dest_station_coords = find_nearest_place(*dest_coords, "train_station")
-                        if not dest_station:
-                            st.warning(f"No railwaystation found near {entry['destination']}.")
-
-                    if origin_station and dest_station:
-                        rail_distance = get_distance(origin_station_coords, dest_station_coords, "transit")
-                        distance_value = round(extract_rail_distance(rail_distance), 4)
-                        total_distance += distance_value  # Add to total
-
-                        st.success(f"🚆 **Rail Distance**:")
-                        st.write(f"🚉 **{origin_station} → {dest_station}**: {distance_value} km")
-                        emission_dist = round(0.0,3)
-                        if entry["type"] == "Electric":
-                            emission_dist = round(distance_value*0.82,3)
-                            st.write(f"🚉 Emission for Electric  rail from **{origin_station} → {dest_station}**: {emission_dist} kgco2e")
-                        else:
-                            emission_dist = distance_value*2.651
-                            st.write(f"🚉 Emission Diesel rail from **{origin_station} → {dest_station}**: {emission_dist} kgco2e")
-                        total_emission += emission_dist
-                    else:
-                        st.warning("Could not find nearby railway stations.")
-                
-
-                else:  # Road Mode
-                    road_distance = get_distance(origin_coords, dest_coords, "driving")
-                    distance_value = round(extract_distance(road_distance), 2)
-                    total_distance += distance_value  # Add to total
-
-                    st.write(f"🚗 Road Distance from {entry['origin']} → {entry['destination']}: {distance_value} km")
-                    emission_dist = 0.0
-                    if entry["type"] == "Auto CNG":
-                        emission_dist = distance_value*0.107
-                    elif entry["type"] == "Bike":
-                        emission_dist = distance_value*0.049
-                    elif entry["type"] == "Car Petrol":
-                        emission_dist = distance_value*0.187
-                    elif entry["type"] == "Electric bike":
-                        emission_dist = distance_value*0.031
-                    elif entry["type"] == "Car CNG":
-                        emission_dist = distance_value*0.68
-                    else:
-                        emission_dist = distance_value * 0.012
-                    st.write(f"🚉 Emission from  {entry['origin']} → {entry['destination']} is {round(emission_dist,3)} kgco2e")
-                    total_emission += emission_dist
-    
-            else:
-                st.warning(f"Could not fetch location data for {entry['origin']} or {entry['destination']}.")
+        # Network lookups run concurrently; output is rendered in entry order
+        results = resolve_entries(st.session_state.travel_entries)
+        legs = []
+        for result in results:
+            for level, text in result["messages"]:
+                getattr(st, level)(text)
+            if result["distance"] is not None:
+                entry = result["entry"]
+                legs.append((entry["mode"], entry["type"], entry["origin"], entry["destination"],
+                             result["distance"], result["emission"]))
+                total_distance += result["distance"]
+                total_emission += result["emission"]
 
     # Display the total distance across all entries
         total_distance = round(total_distance, 2)  # Round the final total
@@ -399,7 +351,7 @@ def travel_app():
             st.write("---")
             st.success(f"🌍 **Total Distance Across All Trips**: {total_distance} km")
             st.success(f"🌍 **Total Emission Across All Trips**: {total_emission} kgco2e")
-            insert_transport_into_db(Event, entry["mode"], entry["type"], entry["origin"], entry['destination'], distance_value, emission_dist)
+            save_travel_legs(Event, legs)
 
 
         # Data for the bars